@@ -0,0 +1,205 @@
+# agents.py
+# Many small movers on a grid — l01's rival colonies.
+#
+# State is struct-of-arrays: one list per property (x, y, vx, vy, energy), with
+# agent i at index i of every one. Each behaviour is a pass over whole lists.
+# A tick is a few such batches (crowd, seek, steer, jitter, move, feed), not a
+# method call per agent.
+#
+# Neighbours come from a uniform spatial hash that rebuild() makes each tick.
+# The grid is cut into cell × cell squares, and each occupied square lists the
+# agents in it, lowest index first. A query within radius r looks only at the
+# squares the radius covers. crowd() doesn't query at all: each square keeps the
+# sum of its agents' positions, and an agent is pushed away from its square's
+# centroid. That costs one lookup per agent however dense the crowd is.
+#
+# Determinism: lists and dicts are walked in index and insertion order, ties go
+# to the lower index, and the only randomness is the rng passed in. So the same
+# seed and the same calls give the same floats.
+
+from __future__ import annotations
+import math
+import random
+from array import array
+
+import snapshot
+
+CELL = 4   # hash square side, grid cells
+
+
+class Swarm:
+    def __init__(self, w: int, h: int, cell: int = CELL) -> None:
+        self.w      = w
+        self.h      = h
+        self.cell   = cell
+        self.gw     = -(-w // cell)
+        self.x      = []
+        self.y      = []
+        self.vx     = []
+        self.vy     = []
+        self.energy = []
+        self.keys   = []      # agent → its hash square, from rebuild()
+        self.cells  = {}      # hash square → agent indices, from rebuild()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def add(self, x: float, y: float, energy: float = 1.0,
+            vx: float = 0.0, vy: float = 0.0) -> None:
+        self.x.append(min(self.w - 1e-6, max(0.0, x)))
+        self.y.append(min(self.h - 1e-6, max(0.0, y)))
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.energy.append(energy)
+
+    # ── Spatial hash ──────────────────────────────────────────
+    def rebuild(self) -> None:
+        """Hash every agent into its square. Call after agents move, before queries."""
+        c, gw = self.cell, self.gw
+        keys  = [int(y) // c * gw + int(x) // c for x, y in zip(self.x, self.y)]
+        cells = {}
+        for i, k in enumerate(keys):
+            bucket = cells.get(k)
+            if bucket is None:
+                cells[k] = [i]
+            else:
+                bucket.append(i)
+        self.keys, self.cells = keys, cells
+
+    def near(self, x: float, y: float, r: float) -> list:
+        """Indices of agents within r of (x, y), lowest first."""
+        c, gw, cells = self.cell, self.gw, self.cells
+        xs, ys, r2 = self.x, self.y, r * r
+        x0, x1 = max(0, int(x - r) // c), min(gw - 1, int(x + r) // c)
+        y0, y1 = max(0, int(y - r) // c), int(y + r) // c
+        out = []
+        for gy in range(y0, y1 + 1):
+            for gx in range(x0, x1 + 1):
+                for i in cells.get(gy * gw + gx, ()):
+                    if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 <= r2:
+                        out.append(i)
+        out.sort()
+        return out
+
+    def nearest(self, x: float, y: float, r: float, want=None) -> int:
+        """Index of the closest agent within r for which want(i) holds, or -1.
+        Equal distances go to the lower index."""
+        xs, ys = self.x, self.y
+        best, best_d = -1, math.inf
+        for i in self.near(x, y, r):
+            d = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+            if d < best_d and (want is None or want(i)):
+                best, best_d = i, d
+        return best
+
+    # ── Behaviours ────────────────────────────────────────────
+    # Each adds to vx, vy for a batch of agents; move() applies them.
+    def crowd(self, push: float) -> None:
+        """Push every agent away from the centroid of its hash square, so
+        agents spread out instead of piling onto one tile. An agent alone in
+        its square is its own centroid and feels nothing."""
+        xs, ys, cells = self.x, self.y, self.cells.items()
+        cx = {k: sum(map(xs.__getitem__, b)) / len(b) for k, b in cells}
+        cy = {k: sum(map(ys.__getitem__, b)) / len(b) for k, b in cells}
+        self.vx = [v + push * (x - cx[k]) for v, x, k in zip(self.vx, xs, self.keys)]
+        self.vy = [v + push * (y - cy[k]) for v, y, k in zip(self.vy, ys, self.keys)]
+
+    def seek(self, x: float, y: float, r: float, pull: float, want=None) -> None:
+        """Agents within r of (x, y) accelerate toward it (away if pull < 0),
+        harder the closer they are. want(i) narrows who takes notice."""
+        xs, ys, vx, vy = self.x, self.y, self.vx, self.vy
+        for i in self.near(x, y, r):
+            if want is not None and not want(i):
+                continue
+            dx, dy = x - xs[i], y - ys[i]
+            d = math.sqrt(dx * dx + dy * dy)
+            if d > 0.0:
+                k = pull * (1.0 - d / r) / d
+                vx[i] += dx * k
+                vy[i] += dy * k
+
+    def steer(self, ax: list, ay: list) -> None:
+        """Add per-agent accelerations the level worked out itself."""
+        self.vx = [v + a for v, a in zip(self.vx, ax)]
+        self.vy = [v + a for v, a in zip(self.vy, ay)]
+
+    def jitter(self, rng: random.Random, amount: float) -> None:
+        """Random wander: two rolls per agent, in index order."""
+        roll = rng.random
+        a2   = 2.0 * amount
+        self.vx = [v + (roll() - 0.5) * a2 for v in self.vx]
+        self.vy = [v + (roll() - 0.5) * a2 for v in self.vy]
+
+    # ── Motion and life ───────────────────────────────────────
+    def move(self, drag: float, top: float) -> None:
+        """Damp, cap speed at top, step, and bounce off the grid's edges."""
+        keep  = 1.0 - drag
+        fast  = top / keep              # speeds that are still over top once damped
+        scale = [keep if s <= fast else top / s for s in map(math.hypot, self.vx, self.vy)]
+        vx    = [v * k for v, k in zip(self.vx, scale)]
+        vy    = [v * k for v, k in zip(self.vy, scale)]
+        x = [p + v for p, v in zip(self.x, vx)]
+        y = [p + v for p, v in zip(self.y, vy)]
+        _bounce(x, vx, self.w - 1e-6)
+        _bounce(y, vy, self.h - 1e-6)
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+    def burn(self, cost: float) -> int:
+        """Every agent spends cost energy; those left with none die.
+        Returns how many died."""
+        energy = [e - cost for e in self.energy]
+        if min(energy, default=1.0) > 0.0:
+            self.energy = energy
+            return 0
+        keep = [e > 0.0 for e in energy]
+        self.x      = [v for v, k in zip(self.x, keep) if k]
+        self.y      = [v for v, k in zip(self.y, keep) if k]
+        self.vx     = [v for v, k in zip(self.vx, keep) if k]
+        self.vy     = [v for v, k in zip(self.vy, keep) if k]
+        self.energy = [v for v, k in zip(energy, keep) if k]
+        return len(keep) - len(self.energy)
+
+    def split(self, threshold: float, cap: int) -> int:
+        """Agents holding threshold energy or more divide in two, halving it,
+        while there are fewer than cap. The daughter appears beside its parent
+        with the opposite velocity. Returns how many were born."""
+        born = 0
+        for i in range(len(self.x)):
+            if len(self.x) >= cap:
+                break
+            if self.energy[i] >= threshold:
+                self.energy[i] *= 0.5
+                self.add(self.x[i] - self.vx[i], self.y[i] - self.vy[i],
+                         self.energy[i], -self.vx[i], -self.vy[i])
+                born += 1
+        return born
+
+
+def _bounce(p: list, v: list, hi: float) -> None:
+    """Reflect positions that left [0, hi] back inside, reversing their velocity.
+    Few agents touch an edge in any one tick, so only those are visited."""
+    if min(p, default=0.0) >= 0.0 and max(p, default=0.0) <= hi:
+        return
+    for i in [i for i, q in enumerate(p) if q < 0.0 or q > hi]:
+        q = -p[i] if p[i] < 0.0 else 2 * hi - p[i]
+        p[i] = min(hi, max(0.0, q))
+        v[i] = -v[i]
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+# The hash follows from the positions; whoever queries next rebuilds it.
+def pack(s: Swarm) -> bytes:
+    p = snapshot.Packer()
+    for values in (s.x, s.y, s.vx, s.vy, s.energy):
+        p.blob(array("d", values).tobytes())
+    return p.bytes()
+
+
+def unpack(data: bytes, w: int, h: int, cell: int = CELL) -> Swarm:
+    s = Swarm(w, h, cell)
+    u = snapshot.Unpacker(data)
+    s.x, s.y, s.vx, s.vy, s.energy = (array("d", u.blob()).tolist() for _ in range(5))
+    if len({len(s.x), len(s.y), len(s.vx), len(s.vy), len(s.energy)}) != 1:
+        raise ValueError("agent arrays differ in length")
+    s.rebuild()
+    return s
@@ -0,0 +1,57 @@
+# components.py
+# Connected components of a network that only ever grows — l03's mycelium.
+#
+# A disjoint-set forest: union by size, path halving on find, so every query is
+# effectively constant time. Nodes are added and joined, never removed, which is
+# exactly what a disjoint set can follow without rescanning. It keeps the
+# statistics up to date as it goes: how many separate networks there are and how
+# big the largest one is.
+
+from __future__ import annotations
+
+
+class Components:
+    def __init__(self) -> None:
+        self.parent  = {}     # node → parent node (roots point at themselves)
+        self.size    = {}     # root → nodes in its component
+        self.count   = 0      # separate components
+        self.largest = 0      # nodes in the biggest component
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __contains__(self, n: int) -> bool:
+        return n in self.parent
+
+    def add(self, n: int) -> None:
+        if n in self.parent:
+            return
+        self.parent[n] = n
+        self.size[n]   = 1
+        self.count    += 1
+        self.largest   = max(self.largest, 1)
+
+    def find(self, n: int) -> int:
+        parent = self.parent
+        while parent[n] != n:
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+        return n
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra]  += self.size.pop(rb)
+        self.count     -= 1
+        self.largest    = max(self.largest, self.size[ra])
+
+    def connected(self, a: int, b: int) -> bool:
+        return a in self.parent and b in self.parent and self.find(a) == self.find(b)
+
+    def size_of(self, n: int) -> int:
+        """Nodes in n's component, 0 if n isn't in the network."""
+        return self.size[self.find(n)] if n in self.parent else 0
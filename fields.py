@@ -0,0 +1,123 @@
+# fields.py
+# Scalar fields that drift and spread — l01's chemical plumes and heat.
+#
+# A Field is a set of named channels on one grid. Each channel has its own
+# diffusion rate (fine cells² per step) and decay (fraction lost per step). The
+# level emits into it at sources, then step(ux, uy) moves every channel on one
+# current: carried along (first-order upwind), spread (5-point Laplacian), decayed.
+# Advection, diffusion and decay are all linear in the neighbours, so they fold
+# into one five-coefficient stencil per channel, run a row at a time over whole
+# lists. Nothing spreads through an edge or comes in at one; what the current
+# carries to an edge leaves.
+#
+# Large areas: Field(..., scale=s) keeps one cell per s × s block of the area
+# and samples back at fine coordinates by bilinear interpolation. The stencil's
+# cost follows the coarse grid — 400 × 400 at scale 8 costs what 50 × 50 does.
+# Rates given in fine cells are rescaled to the coarse grid, and a step too big
+# for the explicit stencil to stay stable is split into substeps.
+
+from __future__ import annotations
+import math
+from array import array
+from itertools import chain
+
+import snapshot
+
+
+class Field:
+    def __init__(self, w: int, h: int, channels: dict, scale: int = 1) -> None:
+        """channels: name → (diffusion, decay).
+        A step costs a stencil pass per coarse cell, per channel, per substep.
+        At scale 1 that is fine for l01's 22 × 16; a 400 × 400 field at scale 1
+        takes far longer than a tick to step, so an area that big needs scale > 1
+        (8 brings it down to 50 × 50)."""
+        self.w        = w
+        self.h        = h
+        self.scale    = scale
+        self.cw       = -(-w // scale)
+        self.ch       = -(-h // scale)
+        self.channels = dict(channels)
+        self.t        = 0                 # steps taken
+        self.grids    = {name: [[0.0] * self.cw for _ in range(self.ch)] for name in channels}
+
+    # ── Sources ───────────────────────────────────────────────
+    def emit(self, name: str, x: float, y: float, amount: float) -> None:
+        """Add amount to the channel at fine point (x, y), spread over its coarse cell."""
+        gx = min(self.cw - 1, max(0, int(x) // self.scale))
+        gy = min(self.ch - 1, max(0, int(y) // self.scale))
+        self.grids[name][gy][gx] += amount / (self.scale * self.scale)
+
+    # ── Stepping ──────────────────────────────────────────────
+    def step(self, ux: float = 0.0, uy: float = 0.0) -> None:
+        """One step on a current of (ux, uy) fine cells per step."""
+        self.t += 1
+        for name, (diffusion, decay) in self.channels.items():
+            k  = diffusion / (self.scale * self.scale)
+            ax = ux / self.scale
+            ay = uy / self.scale
+            n  = max(1, math.ceil((4 * k + abs(ax) + abs(ay)) / 0.9))
+            coeffs = _stencil(k / n, ax / n, ay / n, 1.0 - (1.0 - decay) ** (1.0 / n))
+            grid = self.grids[name]
+            for _ in range(n):
+                grid = _apply(grid, coeffs)
+            self.grids[name] = grid
+
+    # ── Sampling ──────────────────────────────────────────────
+    def sample(self, name: str, x: float, y: float) -> float:
+        """Channel value at fine point (x, y), bilinear between coarse cell centres."""
+        grid = self.grids[name]
+        gx = min(self.cw - 1.0, max(0.0, (x + 0.5) / self.scale - 0.5))
+        gy = min(self.ch - 1.0, max(0.0, (y + 0.5) / self.scale - 0.5))
+        x0, y0 = int(gx), int(gy)
+        x1, y1 = min(x0 + 1, self.cw - 1), min(y0 + 1, self.ch - 1)
+        fx, fy = gx - x0, gy - y0
+        top = grid[y0][x0] + (grid[y0][x1] - grid[y0][x0]) * fx
+        bot = grid[y1][x0] + (grid[y1][x1] - grid[y1][x0]) * fx
+        return top + (bot - top) * fy
+
+
+def _stencil(k: float, ax: float, ay: float, decay: float) -> tuple:
+    """(centre, up, down, left, right) weights for one explicit step.
+    Upwind: the current carries in from the neighbour it comes from."""
+    keep = 1.0 - decay
+    cu = k + (ay if ay > 0 else 0.0)
+    cd = k + (-ay if ay < 0 else 0.0)
+    cl = k + (ax if ax > 0 else 0.0)
+    cr = k + (-ax if ax < 0 else 0.0)
+    cc = 1.0 - cu - cd - cl - cr
+    return cc * keep, cu * keep, cd * keep, cl * keep, cr * keep
+
+
+def _apply(grid: list, coeffs: tuple) -> list:
+    cc, cu, cd, cl, cr = coeffs
+    last = len(grid) - 1
+    out  = []
+    for y, row in enumerate(grid):
+        up    = grid[y - 1] if y else row        # the outside mirrors the edge
+        down  = grid[y + 1] if y < last else row
+        left  = row[:1] + row[:-1]
+        right = row[1:] + row[-1:]
+        out.append([cc * c + cu * u + cd * d + cl * l + cr * r
+                    for c, u, d, l, r in zip(row, up, down, left, right)])
+    return out
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+def pack(f: Field) -> bytes:
+    p = snapshot.Packer()
+    p.put("I", f.t)
+    for name in f.channels:
+        p.blob(array("d", chain.from_iterable(f.grids[name])).tobytes())
+    return p.bytes()
+
+
+def unpack(data: bytes, w: int, h: int, channels: dict, scale: int = 1) -> Field:
+    f = Field(w, h, channels, scale)
+    u = snapshot.Unpacker(data)
+    f.t = u.one("I")
+    for name in channels:
+        flat = array("d", u.blob())
+        if len(flat) != f.cw * f.ch:
+            raise ValueError("field grid has the wrong size")
+        f.grids[name] = [list(flat[y * f.cw:(y + 1) * f.cw]) for y in range(f.ch)]
+    return f
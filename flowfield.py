@@ -0,0 +1,232 @@
+# flowfield.py
+# Shared paths to the nearest goal — l06's beetles.
+#
+# One terrain, many goal types. For each goal type (food, shelter, …) a field
+# holds every cell's cost to reach the nearest goal, and the first step on
+# that route. The cost is a multi-source Dijkstra over the terrain, run from
+# every goal at once. A beetle then steers by looking up its cell. It costs the
+# same for one beetle as for a thousand, and no search runs per beetle.
+#
+# Entering a cell costs its terrain cost × ORTH for a straight step and × DIAG
+# for a diagonal one. Every cost is an integer, so distances are exact. WALL
+# cells can't be entered. A goal cell costs 0 from itself.
+#
+# Fields are kept, not rebuilt. A change patches only the cells it can reach:
+#   a goal added, or terrain made cheaper — Dijkstra restarts from that cell
+#     and runs only while distances fall;
+#   a goal removed, or terrain made dearer — the cells whose route ran through
+#     that cell reset, take the best offer from the cells around them, and
+#     Dijkstra runs out from there.
+# A cell's step is not remembered from the search. It is worked out again from
+# the distances: the first neighbour, in DIRS order, that lies on a shortest
+# route. Distances are exact integers with one right answer, so a patched
+# field is the same, cell for cell, as one built from scratch. A snapshot
+# therefore keeps only the terrain and the goals.
+
+from __future__ import annotations
+import copy
+from heapq import heapify, heappop, heappush
+
+ORTH = 5             # a straight step, per unit of terrain cost
+DIAG = 7             # a diagonal one — near enough √2 × ORTH
+WALL = 0             # terrain cost of a cell nothing can enter
+FAR  = 1 << 60       # distance from a cell that can't reach any goal
+NONE = 255           # step from a goal, a wall or a cell with no route
+
+# Step directions, in the order ties are broken.
+DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1), (1, 1), (-1, 1), (-1, -1), (1, -1))
+
+
+class Field:
+    def __init__(self, n: int) -> None:
+        self.goals = set()
+        self.dist  = [FAR] * n
+        self.step  = bytearray([NONE]) * n
+
+    def copy(self) -> Field:
+        f = Field(0)
+        f.goals, f.dist, f.step = set(self.goals), list(self.dist), bytearray(self.step)
+        return f
+
+
+class FlowFields:
+    def __init__(self, w: int, h: int, cost: list) -> None:
+        """cost: w × h terrain costs, row-major; WALL for impassable."""
+        if len(cost) != w * h:
+            raise ValueError("terrain has the wrong size")
+        self.w      = w
+        self.h      = h
+        self.cost   = list(cost)
+        self.fields = {}            # goal type → Field
+        # Per cell: (neighbour, step weight, direction index), in DIRS order.
+        self.nbrs = [
+            [((y + dy) * w + x + dx, DIAG if dx and dy else ORTH, d)
+             for d, (dx, dy) in enumerate(DIRS)
+             if 0 <= x + dx < w and 0 <= y + dy < h]
+            for y in range(h) for x in range(w)
+        ]
+        self.delta = [dy * w + dx for dx, dy in DIRS]
+
+    def __deepcopy__(self, memo: dict) -> FlowFields:
+        # The neighbour table never changes; copies share it.
+        new = copy.copy(self)
+        new.cost   = list(self.cost)
+        new.fields = {name: f.copy() for name, f in self.fields.items()}
+        return new
+
+    # ── Queries ───────────────────────────────────────────────
+    def step(self, name: str, x: int, y: int) -> tuple[int, int]:
+        """(dx, dy) toward the nearest goal of this type; (0, 0) on a goal or
+        with no route."""
+        s = self.fields[name].step[y * self.w + x]
+        return (0, 0) if s == NONE else DIRS[s]
+
+    def distance(self, name: str, x: int, y: int) -> int | None:
+        d = self.fields[name].dist[y * self.w + x]
+        return None if d == FAR else d
+
+    def goals(self, name: str) -> set:
+        return self.fields[name].goals
+
+    # ── Goals ─────────────────────────────────────────────────
+    def define(self, name: str, goals) -> None:
+        """(Re)build a goal type's field from scratch, from cells goals."""
+        f = Field(len(self.cost))
+        f.goals = set(goals)
+        heap = [(0, g) for g in f.goals if self.cost[g] != WALL]
+        for _, g in heap:
+            f.dist[g] = 0
+        heapify(heap)
+        self._search(f, heap)
+        f.step = bytearray(self._best(f, c) for c in range(len(self.cost)))
+        self.fields[name] = f
+
+    def add_goal(self, name: str, c: int) -> None:
+        f = self.fields[name]
+        if c in f.goals:
+            return
+        f.goals.add(c)
+        if self.cost[c] == WALL or f.dist[c] == 0:
+            return
+        f.dist[c] = 0
+        self._restep(f, self._search(f, [(0, c)]) | {c})
+
+    def remove_goal(self, name: str, c: int) -> None:
+        f = self.fields[name]
+        if c not in f.goals:
+            return
+        f.goals.discard(c)
+        if self.cost[c] != WALL:
+            self._restep(f, self._reroute(f, self._downstream(f, c) | {c}))
+
+    # ── Terrain ───────────────────────────────────────────────
+    def set_cost(self, c: int, cost: int) -> None:
+        """Change one cell's terrain cost and patch every field to match."""
+        old = self.cost[c]
+        if cost == old:
+            return
+        self.cost[c] = cost
+        around = [u for u, _, _ in self.nbrs[c]]
+        for f in self.fields.values():
+            if old == WALL or (cost != WALL and cost < old):
+                changed = self._opened(f, c)
+            else:
+                lost = self._downstream(f, c)
+                if cost == WALL:
+                    lost.add(c)
+                changed = self._reroute(f, lost)
+            changed.add(c)
+            changed.update(around)
+            self._restep(f, changed)
+
+    def _opened(self, f: Field, c: int) -> set:
+        """c became cheaper, or passable: its own distance, then everything
+        that now does better through it."""
+        cost, dist = self.cost, f.dist
+        if dist[c] == FAR or c in f.goals:
+            dist[c] = 0 if c in f.goals else min(
+                (dist[u] + k * cost[u] for u, k, _ in self.nbrs[c]
+                 if cost[u] != WALL and dist[u] != FAR), default=FAR)
+        if dist[c] == FAR:
+            return {c}
+        # Routes that enter c are now cheaper.
+        heap, nearer = [(dist[c], c)], {c}
+        for v, k, _ in self.nbrs[c]:
+            if cost[v] != WALL and dist[c] + k * cost[c] < dist[v]:
+                dist[v] = dist[c] + k * cost[c]
+                nearer.add(v)
+                heap.append((dist[v], v))
+        heapify(heap)
+        return self._search(f, heap) | nearer
+
+    # ── Search ────────────────────────────────────────────────
+    def _search(self, f: Field, heap: list) -> set:
+        """Dijkstra outward from heap, a heap of (distance, cell). Returns every
+        cell whose distance fell."""
+        cost, dist, nbrs = self.cost, f.dist, self.nbrs
+        changed = set()
+        while heap:
+            d, u = heappop(heap)
+            if d > dist[u]:
+                continue
+            enter = cost[u]
+            for v, k, _ in nbrs[u]:
+                nd = d + k * enter
+                if nd < dist[v] and cost[v] != WALL:
+                    dist[v] = nd
+                    changed.add(v)
+                    heappush(heap, (nd, v))
+        return changed
+
+    def _downstream(self, f: Field, c: int) -> set:
+        """Every cell whose route to a goal passes through c, not counting c."""
+        step, delta, nbrs = f.step, self.delta, self.nbrs
+        out, todo = set(), [c]
+        while todo:
+            u = todo.pop()
+            for v, _, _ in nbrs[u]:
+                s = step[v]
+                if s != NONE and v + delta[s] == u and v not in out:
+                    out.add(v)
+                    todo.append(v)
+        return out
+
+    def _reroute(self, f: Field, lost: set) -> set:
+        """Forget the distances in lost, then rebuild them from the cells
+        around, which are still right. Returns every cell that moved."""
+        cost, dist, nbrs = self.cost, f.dist, self.nbrs
+        for v in lost:
+            dist[v] = FAR
+        heap = []
+        for v in lost:
+            if cost[v] == WALL:
+                continue
+            if v in f.goals:
+                dist[v] = 0
+            else:
+                dist[v] = min((dist[u] + k * cost[u] for u, k, _ in nbrs[v]
+                               if u not in lost and cost[u] != WALL and dist[u] != FAR),
+                              default=FAR)
+            if dist[v] != FAR:
+                heap.append((dist[v], v))
+        heapify(heap)
+        return self._search(f, heap) | lost
+
+    def _best(self, f: Field, c: int) -> int:
+        d = f.dist[c]
+        if d == 0 or d == FAR or self.cost[c] == WALL:
+            return NONE
+        cost, dist = self.cost, f.dist
+        for u, k, s in self.nbrs[c]:
+            if cost[u] != WALL and dist[u] + k * cost[u] == d:
+                return s
+        return NONE
+
+    def _restep(self, f: Field, changed: set) -> None:
+        """Work out steps again for changed cells and the cells around them."""
+        nbrs, step = self.nbrs, f.step
+        cells = set(changed)
+        for c in changed:
+            cells.update(u for u, _, _ in nbrs[c])
+        for c in cells:
+            step[c] = self._best(f, c)
@@ -0,0 +1,74 @@
+# frames.py
+# Adaptive frame rate for the play loops.
+#
+# FrameClock measures what each render + refresh actually costs and picks the
+# highest frame rate the terminal can sustain between MIN_FPS and MAX_FPS:
+# rendering may take at most RENDER_SHARE of the wall clock. A frame is also held
+# back when drawing it would run past the next simulation tick — ticks always
+# come first, so a slow terminal drops frames, never ticks. Only once a frame is
+# 1 / MIN_FPS late does it go ahead regardless.
+#
+# MANDALA_FPS=min-max overrides the bounds (e.g. MANDALA_FPS=10-30). The chosen
+# rate shows in the MANDALA_DEBUG overlay.
+
+from __future__ import annotations
+import os
+import time
+
+import screen as scr
+
+MIN_FPS      = 10
+MAX_FPS      = 60
+RENDER_SHARE = 0.5     # most of the wall clock rendering may take
+COST_WEIGHT  = 0.2     # how fast the measured cost follows changes
+FPS_ENV      = "MANDALA_FPS"
+
+
+def _bounds() -> tuple[float, float]:
+    spec = os.environ.get(FPS_ENV, "")
+    lo, _, hi = spec.partition("-")
+    try:
+        lo_fps, hi_fps = float(lo), float(hi)
+    except ValueError:
+        return MIN_FPS, MAX_FPS
+    if not 0 < lo_fps <= hi_fps:
+        return MIN_FPS, MAX_FPS
+    return lo_fps, hi_fps
+
+
+class FrameClock:
+    def __init__(self, min_fps: float | None = None, max_fps: float | None = None) -> None:
+        lo, hi = _bounds()
+        self.longest  = 1.0 / (min_fps or lo)
+        self.shortest = 1.0 / (max_fps or hi)
+        self.interval = self.shortest
+        self.cost     = 0.0       # seconds per render + refresh, smoothed
+        self.last     = None      # clock value of the last frame
+        self._began   = 0.0
+
+    @property
+    def fps(self) -> float:
+        return 1.0 / self.interval
+
+    def due(self, now: float, next_tick: float | None = None) -> bool:
+        """Whether to render at clock value now. next_tick is when the simulation
+        next needs the loop, or None while nothing is ticking."""
+        if self.last is None:
+            return True
+        since = now - self.last
+        if since < scr.frame_interval(self.interval):
+            return False
+        if next_tick is not None and now + self.cost > next_tick and since < self.longest:
+            return False
+        return True
+
+    def begin(self, now: float) -> None:
+        self.last   = now
+        self._began = time.perf_counter()
+
+    def end(self) -> None:
+        """Book the frame just drawn and re-pick the rate."""
+        took = time.perf_counter() - self._began
+        self.cost    += COST_WEIGHT * (took - self.cost)
+        self.interval = min(self.longest, max(self.shortest, self.cost / RENDER_SHARE))
+        scr.note("fps", f"{self.fps:.0f}fps")
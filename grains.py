@@ -0,0 +1,280 @@
+# grains.py
+# Falling grains on a grid of chunks — l07's soil, water and what the worms leave.
+#
+# Every cell holds one material (a byte). A material has a density and a way of
+# moving, and a grain only ever trades places with a lighter neighbour:
+#   FALL   straight down;
+#   SLIDE  down a diagonal, when it can't fall — a heap finds its slope;
+#   FLOW   along the row, when it rests on something no lighter and more of it
+#          weighs on it from above — water spreads until it lies one deep.
+#          Each such move lets the grain above drop a row, so it can't go on
+#          forever: a pool comes to rest;
+#   HOLD   cohesive: it won't fall while a FIRM cell stands either side of it,
+#          so a tunnel's roof holds as an arch. The grid's edges count as firm.
+# Density 0 is open space. Materials that don't FALL never move.
+#
+# The grid is cut into CHUNK × CHUNK chunks, and only awake chunks are stepped.
+# A chunk where something moved wakes itself and the eight around it for the
+# next tick; one that sits still for QUIET ticks in a row goes to sleep. set()
+# wakes the chunks a change can reach. A settled world costs nothing, and a
+# tick costs what moves — however big the grid.
+#
+# A chunk is stepped whole, not cell by cell. It's copied out with a one-cell
+# rim (its neighbours' edge cells, so grains cross over), and every rule is
+# worked out for every cell at once: bytes.translate turns the materials into
+# one 0/1 byte per cell for a property ("falls, and weighs at least k", "lighter
+# than k"), int.from_bytes makes that an integer, and shifting it by a row or a
+# column lines each cell up with its neighbour. One AND per density level gives
+# every grain that can move. Only the moves themselves are a Python loop.
+#
+# Moves never collide. Each tick moves grains out of every other row only — the
+# even rows on even ticks, odd on odd — so no grain falls into a cell that is
+# itself moving that tick, and the diagonal and the sideways moves all lean the
+# same way, turning every other pair of ticks. Over QUIET = 4 ticks every
+# combination has had its turn. Chunks go bottom first. There's no randomness
+# in it: the same grid steps the same way every time.
+
+from __future__ import annotations
+import copy
+from functools import lru_cache
+
+import snapshot
+
+CHUNK = 16         # cells per chunk side
+QUIET = 4          # still ticks before a chunk sleeps
+
+FALL  = 0x01
+SLIDE = 0x02
+FLOW  = 0x04
+HOLD  = 0x08
+FIRM  = 0x10       # holds up a HOLD neighbour
+
+
+class Grains:
+    def __init__(self, w: int, h: int, materials: dict) -> None:
+        """materials: material byte → (density, behaviour flags)."""
+        self.w     = w
+        self.h     = h
+        self.cw    = -(-w // CHUNK)          # chunks across
+        self.ch    = -(-h // CHUNK)          # chunks down
+        self.cell  = bytearray(w * h)        # row-major
+        self.t     = 0                       # ticks stepped
+        self.quiet = {}                      # awake chunk → still ticks in a row
+        self.rules = _rules(tuple(sorted(materials.items())))
+
+    def __deepcopy__(self, memo: dict) -> Grains:
+        # The rules never change; copies share them.
+        new = copy.copy(self)
+        new.cell  = bytearray(self.cell)
+        new.quiet = dict(self.quiet)
+        return new
+
+    # ── Access ────────────────────────────────────────────────
+    def get(self, x: int, y: int) -> int:
+        return self.cell[y * self.w + x]
+
+    def set(self, x: int, y: int, m: int) -> None:
+        c = y * self.w + x
+        if self.cell[c] != m:
+            self.cell[c] = m
+            self.wake(x, y)
+
+    def wake(self, x: int, y: int) -> None:
+        """Wake every chunk a change at (x, y) can reach."""
+        for yy in {max(0, y - 1) // CHUNK, y // CHUNK, min(self.h - 1, y + 1) // CHUNK}:
+            for xx in {max(0, x - 1) // CHUNK, x // CHUNK, min(self.w - 1, x + 1) // CHUNK}:
+                self.quiet[yy * self.cw + xx] = 0
+
+    def wake_all(self) -> None:
+        self.quiet = dict.fromkeys(range(self.cw * self.ch), 0)
+
+    def awake(self) -> int:
+        return len(self.quiet)
+
+    def count(self, m: int) -> int:
+        return self.cell.count(m)
+
+    # ── Stepping ──────────────────────────────────────────────
+    def step(self) -> int:
+        """One tick for every awake chunk. Returns how many grains moved."""
+        self.t += 1
+        parity = self.t & 1
+        lean   = 1 if self.t & 2 else -1
+        quiet  = self.quiet
+        moved  = 0
+        woken  = set()
+        for ci in sorted(quiet, reverse=True):       # bottom rows first
+            n = self._step_chunk(ci, parity, lean)
+            if n:
+                moved += n
+                woken.update(self._around(ci))
+            else:
+                quiet[ci] += 1
+        for ci in woken:
+            quiet[ci] = 0
+        for ci in [ci for ci, q in quiet.items() if q >= QUIET]:
+            del quiet[ci]
+        return moved
+
+    def settle(self, limit: int) -> int:
+        """Step until every chunk sleeps, or limit ticks. Returns ticks taken."""
+        for k in range(limit):
+            if not self.quiet:
+                return k
+            self.step()
+        return limit
+
+    def _around(self, ci: int) -> list:
+        cy, cx = divmod(ci, self.cw)
+        return [y * self.cw + x
+                for y in range(max(0, cy - 1), min(self.ch, cy + 2))
+                for x in range(max(0, cx - 1), min(self.cw, cx + 2))]
+
+    def _step_chunk(self, ci: int, parity: int, lean: int) -> int:
+        w, h, cell = self.w, self.h, self.cell
+        cy, cx = divmod(ci, self.cw)
+        x0, y0 = cx * CHUNK, cy * CHUNK
+        x1, y1 = min(w, x0 + CHUNK), min(h, y0 + CHUNK)
+        # The rim: a column either side and the row below, where there are any.
+        xa, xb, yb = max(0, x0 - 1), min(w, x1 + 1), min(h, y1 + 1)
+        bw  = xb - xa
+        buf = bytearray().join([cell[y * w + xa:y * w + xb] for y in range(y0, yb)])
+        g   = _geometry(bw, yb - y0, x0 - xa, x1 - xa, y1 - y0, xa == x0, xb == x1)
+        r   = self.rules
+
+        # Fall: a grain over a lighter cell, unless it holds.
+        fall = 0
+        for ge, lt in zip(r.fall, r.lighter):
+            fall |= _bits(buf, ge) & _at(_bits(buf, lt), bw)
+        fall &= g.rows[parity]
+        if fall and r.holds:
+            firm  = _bits(buf, r.firm)
+            fall &= ~(_bits(buf, r.hold) & ((firm >> 8) | (firm << 8) | g.edge))
+        moved = _swap(buf, fall, bw)
+
+        # Slide: down the diagonal the tick leans to, past an open side.
+        slide = 0
+        for ge, lt in zip(r.slide, r.lighter):
+            light  = _bits(buf, lt)
+            slide |= _bits(buf, ge) & _at(light, bw + lean) & _at(light, lean)
+        moved += _swap(buf, slide & g.rows[parity] & g.cols[lean], bw + lean)
+
+        # Flow: a resting grain with more of it on top, along its row.
+        flow, drop = 0, 0
+        for ge, lt in zip(r.flow, r.lighter):
+            light = _bits(buf, lt)
+            mover = _bits(buf, ge)
+            flow |= mover & _at(light, lean)
+            drop |= mover & _at(light, bw)
+        flow &= _at(_bits(buf, r.flows), -bw) & ~drop & g.core & g.cols[lean]
+        moved += _swap(buf, flow, lean)
+
+        if moved:
+            for i, y in enumerate(range(y0, yb)):
+                cell[y * w + xa:y * w + xb] = buf[i * bw:(i + 1) * bw]
+        return moved
+
+
+# ── Masks ─────────────────────────────────────────────────────
+def _bits(buf: bytearray, table: bytes) -> int:
+    """One 0/1 byte per cell, by table, as an int — the first cell highest."""
+    return int.from_bytes(buf.translate(table), "big")
+
+
+def _at(bits: int, off: int) -> int:
+    """Line each cell up with the one off cells after it."""
+    return bits << 8 * off if off >= 0 else bits >> -8 * off
+
+
+def _swap(buf: bytearray, mask: int, off: int) -> int:
+    """Trade every cell marked in mask with the one off cells after it."""
+    if not mask:
+        return 0
+    marks = mask.to_bytes(len(buf), "big")
+    i, n = marks.find(1), 0
+    while i >= 0:
+        j = i + off
+        buf[i], buf[j] = buf[j], buf[i]
+        n += 1
+        i = marks.find(1, i + 1)
+    return n
+
+
+class _Rules:
+    """Translate tables for one set of materials, a table per density level k:
+    fall/slide/flow — moves that way and weighs at least k; lighter — under k."""
+    def __init__(self, materials: tuple) -> None:
+        density = dict((m, d) for m, (d, _) in materials)
+        flags   = dict((m, f) for m, (_, f) in materials)
+        levels  = sorted({d for d in density.values() if d > 0})
+
+        def table(test) -> bytes:
+            return bytes(1 if m in density and test(m) else 0 for m in range(256))
+
+        def movers(flag: int) -> list:
+            return [table(lambda m, k=k: flags[m] & flag and density[m] >= k) for k in levels]
+
+        self.fall    = movers(FALL)
+        self.slide   = movers(SLIDE)
+        self.flow    = movers(FLOW)
+        self.lighter = [table(lambda m, k=k: density[m] < k) for k in levels]
+        self.hold    = table(lambda m: flags[m] & HOLD)
+        self.firm    = table(lambda m: flags[m] & FIRM)
+        self.flows   = table(lambda m: flags[m] & FLOW)
+        self.holds   = any(f & HOLD for f in flags.values())
+
+
+@lru_cache(maxsize=8)
+def _rules(materials: tuple) -> _Rules:
+    return _Rules(materials)
+
+
+class _Geometry:
+    """Which cells of a copied-out chunk may move. Cells are numbered row by
+    row across the copy, rim included."""
+    def __init__(self, bw: int, rows: int, c0: int, c1: int, core_rows: int,
+                 left_wall: bool, right_wall: bool) -> None:
+        def mask(test) -> int:
+            return int.from_bytes(
+                bytes(1 if test(i // bw, i % bw) else 0 for i in range(bw * rows)), "big")
+
+        def core(y: int, x: int) -> bool:
+            return y < core_rows and c0 <= x < c1
+
+        self.core = mask(core)
+        self.rows = [mask(lambda y, x, p=p: core(y, x) and y % 2 == p) for p in (0, 1)]
+        self.cols = {lean: mask(lambda y, x, lean=lean: 0 <= x + lean < bw) for lean in (1, -1)}
+        # The grid's edges hold like a firm neighbour.
+        self.edge = mask(lambda y, x: (left_wall and x == 0) or (right_wall and x == bw - 1))
+
+
+@lru_cache(maxsize=64)
+def _geometry(bw: int, rows: int, c0: int, c1: int, core_rows: int,
+              left_wall: bool, right_wall: bool) -> _Geometry:
+    return _Geometry(bw, rows, c0, c1, core_rows, left_wall, right_wall)
+
+
+# ── Serialization ─────────────────────────────────────────────
+def pack(g: Grains) -> bytes:
+    p = snapshot.Packer()
+    p.put("I", g.t)
+    p.blob(bytes(g.cell))
+    awake = sorted(g.quiet)
+    p.blob(b"".join(ci.to_bytes(4, "little") for ci in awake))
+    p.blob(bytes(g.quiet[ci] for ci in awake))
+    return p.bytes()
+
+
+def unpack(data: bytes, w: int, h: int, materials: dict) -> Grains:
+    g = Grains(w, h, materials)
+    u = snapshot.Unpacker(data)
+    g.t    = u.one("I")
+    g.cell = bytearray(u.blob())
+    raw, still = u.blob(), u.blob()
+    if len(g.cell) != w * h:
+        raise ValueError("grains grid has the wrong size")
+    awake = [int.from_bytes(raw[i:i + 4], "little") for i in range(0, len(raw), 4)]
+    if len(awake) != len(still) or any(not 0 <= ci < g.cw * g.ch for ci in awake):
+        raise ValueError("awake chunk off the grid")
+    g.quiet = dict(zip(awake, still))
+    return g
@@ -0,0 +1,299 @@
+# graph.py
+# A weighted undirected graph in compressed sparse rows — l05's mycorrhizal
+# network, fungus to fungus and fungus to plant.
+#
+# Nodes are ints 0…n−1. Each node's row is a run of slots in two flat arrays,
+# dst (neighbour) and wt (link weight). Row i starts at start[i], holds deg[i]
+# links sorted by neighbour, and has room for cap[i]. Every link is stored
+# twice, once in the row of each end. Slots not in use carry weight 0.
+#
+# Links are added in batches: link() only queues, and commit() files the whole
+# queue. It sorts the batch by row, drops links already filed, and merges each
+# touched row with its new links in one go. A row that still fits goes back
+# where it was; a full row moves to the end of the arrays with room doubled
+# until it fits, and the slots it left are dead. A row that keeps growing moves
+# O(log degree) times, so adding a link costs amortized O(1). When more than
+# half the slots are dead, commit() packs the rows together again. A new node's
+# row goes on the end.
+#
+# flow() is one step of diffusion over the links. A resource held at the nodes
+# moves along each link at weight × the difference between its ends, but never
+# faster than evens the two ends out: a link's share is capped at 1 / (the sum
+# of both ends' link weights). A node's links together then never move more
+# than it holds, so every node ends up with a blend of its own value and its
+# neighbours' — no overshoot, nothing below zero — and each link moves as much
+# out of one end as into the other, so totals are kept exactly. Below the cap
+# a pass is one explicit Euler step. A call makes as many passes as the caller
+# asks, one by default, whatever the rate.
+#
+# The links in use and their shares sit in flat lists in node order, built the
+# first time flow() runs and then spliced by commit() and add_node(). A pass is
+# one itemgetter, map() and accumulate() over them, with no Python loop per
+# link. A row's total is the running sum at its end minus the running sum at
+# its start. Rows are sorted by neighbour and gathered in node order, so equal
+# graphs give equal floats wherever their rows sit in the arrays.
+
+from __future__ import annotations
+import operator
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, repeat
+
+import snapshot
+
+MIN_CAP = 4      # slots a new row starts with
+
+
+class Graph:
+    def __init__(self) -> None:
+        self.start   = array("l")
+        self.deg     = array("l")
+        self.cap     = array("l")
+        self.dst     = array("l")
+        self.wt      = array("d")
+        self.wsum    = []          # node → total weight of its links
+        self.pending = []          # (a, b, w) queued by link(), filed by commit()
+        self.links   = 0           # undirected links filed
+        self.dead    = 0           # slots left behind by rows that moved
+        self._flat   = None        # links in use, flat, for flow() — see _flatten()
+        self._gather = None        # itemgetter over the flat far ends, remade on change
+        self._rate   = None        # [rate, share per link, keep per node] for flow()
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    # ── Nodes and links ───────────────────────────────────────
+    def add_node(self) -> int:
+        n = len(self.start)
+        self.start.append(len(self.dst))
+        self.deg.append(0)
+        self.cap.append(MIN_CAP)
+        self.dst.extend([n] * MIN_CAP)
+        self.wt.extend([0.0] * MIN_CAP)
+        self.wsum.append(0.0)
+        if self._flat is not None:
+            far, _, _, starts, ends = self._flat
+            starts.append(len(far))
+            ends.append(len(far))
+        if self._rate is not None:
+            self._rate[2].append(1.0)
+        return n
+
+    def link(self, a: int, b: int, w: float = 1.0) -> None:
+        """Queue a link between a and b. Filed by the next commit(); a link
+        that is already there, or a node linked to itself, is ignored then."""
+        self.pending.append((a, b, w))
+
+    def commit(self) -> int:
+        """File every queued link. Returns how many were new."""
+        if not self.pending:
+            return 0
+        batch, self.pending = self.pending, []
+        # Both ends of each queued link, by row; a link queued twice keeps the
+        # weight it was first queued with.
+        rows = {}
+        for a, b, w in batch:
+            if a != b:
+                rows.setdefault(a, {}).setdefault(b, w)
+                rows.setdefault(b, {}).setdefault(a, w)
+        added, grown = 0, []
+        for n in sorted(rows):
+            k = self._merge(n, rows[n])
+            if k:
+                added += k
+                grown.append(n)
+        if self.dead * 2 > len(self.dst):
+            self._compact()
+        self.links += added // 2
+        self._refile(grown)
+        return added // 2
+
+    def _merge(self, n: int, new: dict) -> int:
+        """File new (neighbour → weight) into row n, all at once. Neighbours
+        the row already has are left as they are. Returns how many went in."""
+        s, d, c = self.start[n], self.deg[n], self.cap[n]
+        dst, wt = self.dst, self.wt
+        row = dict(zip(dst[s:s + d], wt[s:s + d]))
+        for b, w in new.items():
+            row.setdefault(b, w)
+        size = len(row)
+        if size == d:
+            return 0
+        if size > c:
+            room = c
+            while room < size:
+                room *= 2
+            wt[s:s + c] = array("d", bytes(8 * c))
+            self.dead    += c
+            s, c          = len(dst), room
+            self.start[n] = s
+            self.cap[n]   = c
+            dst.extend([n] * c)
+            wt.frombytes(bytes(8 * c))
+        keys = sorted(row)
+        dst[s:s + size] = array("l", keys)
+        wt[s:s + size]  = array("d", map(row.__getitem__, keys))
+        self.deg[n]  = size
+        self.wsum[n] = sum(wt[s:s + size])
+        return size - d
+
+    def _compact(self) -> None:
+        """Pack every row together again, in node order, dropping dead slots."""
+        dst, wt, start, cap = self.dst, self.wt, self.start, self.cap
+        new_dst, new_wt = array("l"), array("d")
+        for n in range(len(start)):
+            s, c = start[n], cap[n]
+            start[n] = len(new_dst)
+            new_dst.extend(dst[s:s + c])
+            new_wt.extend(wt[s:s + c])
+        self.dst, self.wt = new_dst, new_wt
+        self.dead = 0
+
+    def linked(self, a: int, b: int) -> bool:
+        s, d = self.start[a], self.deg[a]
+        i = bisect_left(self.dst, b, s, s + d)
+        return i < s + d and self.dst[i] == b
+
+    def neighbours(self, n: int) -> list:
+        s = self.start[n]
+        return self.dst[s:s + self.deg[n]].tolist()
+
+    def degree(self, n: int) -> int:
+        return self.deg[n]
+
+    def edges(self) -> list:
+        """Every link once, as (a, b, weight) with a < b, sorted."""
+        out = []
+        for a in range(len(self.start)):
+            s, d = self.start[a], self.deg[a]
+            out.extend((a, b, w) for b, w in zip(self.dst[s:s + d], self.wt[s:s + d]) if a < b)
+        return out
+
+    # ── Flow ──────────────────────────────────────────────────
+    def flow(self, values: list, rate: float, passes: int = 1) -> list:
+        """values after rate time of diffusion over the links: each link moves
+        weight × (difference) per unit time from the fuller end to the emptier,
+        capped where that would carry an end past evening out. Done in passes
+        steps of rate / passes; more follow the uncapped spread more closely
+        where the links are dense. A call costs passes × links, whatever the
+        rate: some 25 ms a pass at 100k links."""
+        if not self.links or rate <= 0.0:
+            return list(values)
+        _, _, _, starts, ends = self._flatten()
+        if self._gather is None:
+            self._gather = operator.itemgetter(*self._flat[0])
+        share, keep = self._shares(rate / passes)
+        u = values
+        for _ in range(passes):
+            run = list(accumulate(map(operator.mul, self._gather(u), share), initial=0.0))
+            got = map(operator.sub, map(run.__getitem__, ends), map(run.__getitem__, starts))
+            u   = [v * c + g for v, c, g in zip(u, keep, got)]
+        return u
+
+    def _flatten(self) -> list:
+        """[far, weights, weight sums, starts, ends]: the links in use, in node
+        order. far is each link's far end; weight sums is both ends' total link
+        weight, per link; row n is starts[n]:ends[n]. Built once, then kept up
+        to date by add_node() and commit()."""
+        if self._flat is None:
+            start, deg, dst, wt, wsum = self.start, self.deg, self.dst, self.wt, self.wsum
+            far, w, near = [], [], []
+            for n, d in enumerate(deg):
+                if d:
+                    s = start[n]
+                    far.extend(dst[s:s + d])
+                    w.extend(wt[s:s + d])
+                    near.extend(repeat(wsum[n], d))
+            ends   = list(accumulate(deg))
+            starts = list(map(operator.sub, ends, deg))
+            both   = list(map(operator.add, near, map(wsum.__getitem__, far)))
+            self._flat = [far, w, both, starts, ends]
+        return self._flat
+
+    def _shares(self, rate: float) -> tuple:
+        """(share per link, keep per node) for one pass of rate: a link's
+        share is weight × min(rate, 1 / its weight sum), and a node keeps what
+        its links don't take."""
+        if self._rate is None or self._rate[0] != rate:
+            _, w, both, starts, ends = self._flatten()
+            share = [_share(x, t, rate) for x, t in zip(w, both)]
+            keep  = [1.0 - sum(share[s:e]) for s, e in zip(starts, ends)]
+            self._rate = [rate, share, keep]
+        return self._rate[1], self._rate[2]
+
+    def _refile(self, rows: list) -> None:
+        """Bring the flat lists, and the shares, up to date after rows (in node
+        order) took new links. Costs what those rows and their neighbours hold,
+        plus a splice per row; the same floats as building them afresh."""
+        if not rows:
+            return
+        self._gather = None
+        if self._flat is None:
+            return
+        far, w, both, starts, ends = self._flat
+        share = self._rate[1] if self._rate is not None else None
+        start, deg, dst, wt, wsum = self.start, self.deg, self.dst, self.wt, self.wsum
+        # Each row's new run over its old one, the last first so the runs
+        # before it stay where they are.
+        for n in reversed(rows):
+            s, d, a, b = start[n], deg[n], starts[n], ends[n]
+            far[a:b]  = dst[s:s + d]
+            w[a:b]    = wt[s:s + d]
+            both[a:b] = repeat(0.0, d)
+            if share is not None:
+                share[a:b] = repeat(0.0, d)
+        ends[:]   = accumulate(deg)
+        starts[:] = map(operator.sub, ends, deg)
+        # A link whose end took links has a new weight sum: every link of a
+        # changed row, and the one each of its neighbours has back.
+        slots = []
+        for n in rows:
+            a, b = starts[n], ends[n]
+            slots.extend((i, n) for i in range(a, b))
+            slots.extend((bisect_left(far, n, starts[j], ends[j]), j) for j in far[a:b])
+        for i, n in slots:
+            both[i] = wsum[n] + wsum[far[i]]
+        if share is not None:
+            rate = self._rate[0]
+            for i, _ in slots:
+                share[i] = _share(w[i], both[i], rate)
+            keep = self._rate[2]
+            for n in {n for _, n in slots}:
+                keep[n] = 1.0 - sum(share[starts[n]:ends[n]])
+
+
+def _share(w: float, both: float, rate: float) -> float:
+    """One link's share of a pass of rate, for its weight and weight sum."""
+    return w * (rate if rate * both <= 1.0 else 1.0 / both)
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+# The layout goes as it is: a restored graph moves and packs its rows as
+# the live one would.
+def pack(g: Graph) -> bytes:
+    if g.pending:
+        raise ValueError("graph has links queued; commit() before packing")
+    p = snapshot.Packer()
+    p.put("I", g.dead)
+    for a in (g.start, g.deg, g.cap, g.dst, g.wt):
+        p.blob(a.tobytes())
+    return p.bytes()
+
+
+def unpack(data: bytes) -> Graph:
+    g = Graph()
+    u = snapshot.Unpacker(data)
+    g.dead = u.one("I")
+    g.start, g.deg, g.cap = (array("l", u.blob()) for _ in range(3))
+    g.dst, g.wt           = array("l", u.blob()), array("d", u.blob())
+    n = len(g.start)
+    if not len(g.deg) == len(g.cap) == n or len(g.dst) != len(g.wt):
+        raise ValueError("graph arrays differ in length")
+    if any(s < 0 or d > c or s + c > len(g.dst)
+           for s, d, c in zip(g.start, g.deg, g.cap)):
+        raise ValueError("graph row runs off its arrays")
+    if any(not 0 <= b < n for b in g.dst):
+        raise ValueError("link names a node that isn't there")
+    g.wsum  = [sum(g.wt[s:s + d]) for s, d in zip(g.start, g.deg)]
+    g.links = sum(g.deg) // 2
+    return g
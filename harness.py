@@ -0,0 +1,432 @@
+# harness.py
+# End-to-end responsiveness check. Runs launcher.py under a pseudo-terminal of a
+# fixed size, types a script of keys into it, and reads the terminal output back
+# through a small VT parser, so it sees what a player would see.
+#
+# For every key it times the gap until the screen shows the result — the player
+# glyph moves. It also times the gaps between output bursts, which is the frame
+# cadence as the terminal sees it: curses sends nothing for a frame with no
+# change. Reports p50/p99 of both, per level.
+#
+# Each level starts straight in the phase under test: a throwaway HOME gets a
+# carry pointing at the level and a snapshot of a freshly generated world, so the
+# launcher resumes into it with no welcome and no navigation.
+#
+#   python3 harness.py                         all levels, default scripts
+#   python3 harness.py l02 --keys 40 --max-p99 120
+#   python3 harness.py --env MANDALA_THREADED=1
+#
+# Exits 1 if any level's key-latency p99 is over --max-p99 ms, or a key never showed.
+
+from __future__ import annotations
+import argparse
+import codecs
+import fcntl
+import json
+import os
+import pty
+import select
+import shutil
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+ROWS, COLS  = 30, 100
+SETTLE      = 8.0       # seconds to wait for the level's first frame
+KEY_TIMEOUT = 1.0       # seconds before a key counts as never shown
+KEY_GAP     = 0.15      # pause between keys, so each one is timed alone
+BURST_GAP   = 0.004     # output closer together than this is one frame
+
+# level: (module, phase under test, keys to alternate, what a keypress changes)
+SCENARIOS = {
+    "l01": ("levels.l01_archaea",   "catch",   ("a", "d"),           "@"),
+    "l02": ("levels.l02_cyano",     "bloom",   ("a", "d", "w", "s"), "@"),
+    "l03": ("levels.l03_fungus",    "network", ("a", "d", "w", "s"), "@"),
+    "l04": ("levels.l04_lichens",   "crust",   ("a", "d", "w", "s"), "@"),
+    "l05": ("levels.l05_symbiotes", "network", ("a", "d", "w", "s"), "@"),
+    "l06": ("levels.l06_beetles",   "forage",  ("a", "d", "w", "s"), "@"),
+    # A loop round a 2 × 4 block: longer than the worm, so it never meets itself.
+    "l07": ("levels.l07_worms",     "burrow",  ("a", "w", "w", "w", "d", "s", "s", "s"), "@"),
+}
+
+_KEY_BYTES = {"UP": b"\x1b[A", "DOWN": b"\x1b[B", "RIGHT": b"\x1b[C", "LEFT": b"\x1b[D",
+              "ESC": b"\x1b"}
+
+# DEC special graphics, for terminals that draw lines through ACS
+_DEC_LINES = dict(zip("`afgjklmnopqrstuvwxyz{|}~",
+                      "◆▒°±┘┐┌└┼⎺⎻─⎼⎽├┤┴┬│≤≥π≠£·"))
+
+
+# ── Terminal model ────────────────────────────────────────────
+class Term:
+    """Just enough of a VT100/xterm to follow what curses draws."""
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows, self.cols = rows, cols
+        self.grid    = [[" "] * cols for _ in range(rows)]
+        self.y = self.x = 0
+        self.top, self.bottom = 0, rows - 1
+        self.saved   = (0, 0)
+        self.wrap    = False
+        self.last    = " "
+        self.g       = ["B", "B"]       # G0, G1 charsets
+        self.shift   = 0
+        self.state   = "ground"
+        self.params  = ""
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def feed(self, data: bytes) -> None:
+        for ch in self.decoder.decode(data):
+            self._char(ch)
+
+    def find(self, glyph: str) -> frozenset:
+        return frozenset((y, x) for y, row in enumerate(self.grid)
+                         for x, c in enumerate(row) if c == glyph)
+
+    def text(self) -> str:
+        return "\n".join("".join(row) for row in self.grid)
+
+    # ── Parser ────────────────────────────────────────────────
+    def _char(self, ch: str) -> None:
+        state = self.state
+        if state == "ground":
+            if ch == "\x1b":
+                self.state = "esc"
+            elif ch >= " " and ch != "\x7f":
+                self._print(ch)
+            else:
+                self._control(ch)
+        elif state == "esc":
+            self._esc(ch)
+        elif state == "csi":
+            if "\x30" <= ch <= "\x3f" or "\x20" <= ch <= "\x2f":
+                self.params += ch
+            else:
+                self.state = "ground"
+                self._csi(ch, self.params)
+        elif state == "osc":
+            if ch == "\x07":
+                self.state = "ground"
+            elif ch == "\x1b":
+                self.state = "esc"          # ESC \ ends it; the backslash is ignored
+        elif state in ("g0", "g1"):
+            self.g[state == "g1"] = ch
+            self.state = "ground"
+
+    def _control(self, ch: str) -> None:
+        if ch == "\r":
+            self.x, self.wrap = 0, False
+        elif ch in "\n\x0b\x0c":
+            self._index()
+        elif ch == "\b":
+            self.x, self.wrap = max(0, self.x - 1), False
+        elif ch == "\t":
+            self.x = min(self.cols - 1, (self.x // 8 + 1) * 8)
+        elif ch == "\x0e":
+            self.shift = 1
+        elif ch == "\x0f":
+            self.shift = 0
+
+    def _esc(self, ch: str) -> None:
+        self.state = "ground"
+        if ch == "[":
+            self.state, self.params = "csi", ""
+        elif ch == "]":
+            self.state = "osc"
+        elif ch == "(":
+            self.state = "g0"
+        elif ch == ")":
+            self.state = "g1"
+        elif ch == "7":
+            self.saved = (self.y, self.x)
+        elif ch == "8":
+            self.y, self.x = self.saved
+        elif ch == "D":
+            self._index()
+        elif ch == "E":
+            self.x = 0
+            self._index()
+        elif ch == "M":
+            if self.y == self.top:
+                self._scroll(-1)
+            else:
+                self.y = max(0, self.y - 1)
+        elif ch == "c":
+            self.__init__(self.rows, self.cols)
+
+    def _print(self, ch: str) -> None:
+        if self.g[self.shift] == "0":
+            ch = _DEC_LINES.get(ch, ch)
+        if self.wrap:
+            self.x, self.wrap = 0, False
+            self._index()
+        self.grid[self.y][self.x] = ch
+        self.last = ch
+        if self.x == self.cols - 1:
+            self.wrap = True
+        else:
+            self.x += 1
+
+    def _index(self) -> None:
+        self.wrap = False
+        if self.y == self.bottom:
+            self._scroll(1)
+        elif self.y < self.rows - 1:
+            self.y += 1
+
+    def _scroll(self, n: int) -> None:
+        """Scroll the region up by n lines (down if n is negative)."""
+        region = self.grid[self.top:self.bottom + 1]
+        blank  = [[" "] * self.cols for _ in range(min(abs(n), len(region)))]
+        region = region[n:] + blank if n > 0 else blank + region[:n]
+        self.grid[self.top:self.bottom + 1] = region
+
+    def _csi(self, final: str, raw: str) -> None:
+        if raw.startswith(("?", ">", "=")):
+            return                          # private modes: nothing that moves glyphs
+        args = [int(p) if p.isdigit() else 0 for p in raw.rstrip(" ").split(";")] if raw else []
+
+        def arg(i: int = 0, default: int = 1) -> int:
+            return args[i] if i < len(args) and args[i] else default
+
+        self.wrap = False
+        if final in "Hf":
+            self.y = min(self.rows - 1, arg(0) - 1)
+            self.x = min(self.cols - 1, arg(1) - 1)
+        elif final == "A":
+            self.y = max(0, self.y - arg())
+        elif final in "Be":
+            self.y = min(self.rows - 1, self.y + arg())
+        elif final in "Ca":
+            self.x = min(self.cols - 1, self.x + arg())
+        elif final == "D":
+            self.x = max(0, self.x - arg())
+        elif final == "E":
+            self.y, self.x = min(self.rows - 1, self.y + arg()), 0
+        elif final == "F":
+            self.y, self.x = max(0, self.y - arg()), 0
+        elif final in "G`":
+            self.x = min(self.cols - 1, arg() - 1)
+        elif final == "d":
+            self.y = min(self.rows - 1, arg() - 1)
+        elif final == "J":
+            self._erase_display(arg(0, 0))
+        elif final == "K":
+            self._erase_line(arg(0, 0))
+        elif final == "X":
+            row = self.grid[self.y]
+            for x in range(self.x, min(self.cols, self.x + arg())):
+                row[x] = " "
+        elif final == "P":
+            row = self.grid[self.y]
+            n = min(arg(), self.cols - self.x)
+            row[self.x:] = row[self.x + n:] + [" "] * n
+        elif final == "@":
+            row = self.grid[self.y]
+            n = min(arg(), self.cols - self.x)
+            row[self.x:] = ([" "] * n + row[self.x:])[:self.cols - self.x]
+        elif final in "LM" and self.top <= self.y <= self.bottom:
+            saved_top, self.top = self.top, self.y
+            self._scroll(-arg() if final == "L" else arg())
+            self.top = saved_top
+        elif final == "S":
+            self._scroll(arg())
+        elif final == "T":
+            self._scroll(-arg())
+        elif final == "r":
+            self.top    = arg(0) - 1
+            self.bottom = min(self.rows - 1, arg(1, self.rows) - 1)
+            self.y = self.x = 0
+        elif final == "b":
+            for _ in range(arg()):
+                self._print(self.last)
+        elif final == "s":
+            self.saved = (self.y, self.x)
+        elif final == "u":
+            self.y, self.x = self.saved
+        # m (colour), h/l (modes), n, t, c: no effect on which glyph is where
+
+    def _erase_display(self, mode: int) -> None:
+        if mode == 0:
+            self._erase_line(0)
+            rows = range(self.y + 1, self.rows)
+        elif mode == 1:
+            self._erase_line(1)
+            rows = range(0, self.y)
+        else:
+            rows = range(self.rows)
+        for y in rows:
+            self.grid[y] = [" "] * self.cols
+
+    def _erase_line(self, mode: int) -> None:
+        row = self.grid[self.y]
+        lo, hi = {0: (self.x, self.cols), 1: (0, self.x + 1)}.get(mode, (0, self.cols))
+        for x in range(lo, hi):
+            row[x] = " "
+
+
+# ── Level setup ───────────────────────────────────────────────
+def _prepare(module: str, phase: str, seed: int) -> None:
+    """Runs in a child with HOME already pointing at a throwaway directory."""
+    import importlib
+    sys.path.insert(0, HERE)
+    import journal
+    import launcher
+    import persist
+    from state import CarryState, flush_carry, save_carry
+
+    index = [m for _, m in launcher.LEVELS].index(module)
+    world = importlib.import_module(module + ".world")
+    main  = importlib.import_module(module + ".main")
+    carry = CarryState(level_index=index)
+    ls = world.generate_state(seed=seed) if index == 0 else world.generate_state(carry, seed=seed)
+    ls.phase = phase
+    journal.Journal(main.CARRY_KEY, world.pack_state, ls, 0.0).close()
+    save_carry(carry)
+    flush_carry()
+    persist.writer.flush()
+
+
+# ── Running ───────────────────────────────────────────────────
+class Session:
+    def __init__(self, home: str, env: dict) -> None:
+        self.term   = Term(ROWS, COLS)
+        self.bursts = []           # clock value each output burst began
+        self._last  = 0.0
+        self.pid, self.fd = pty.fork()
+        if self.pid == 0:
+            fcntl.ioctl(0, termios.TIOCSWINSZ, struct.pack("HHHH", ROWS, COLS, 0, 0))
+            os.environ.update(HOME=home, TERM="xterm-256color",
+                              LANG="C.UTF-8", LC_ALL="C.UTF-8", **env)
+            os.execvp(sys.executable, [sys.executable, os.path.join(HERE, "launcher.py")])
+
+    def pump(self, until: float, done=None) -> bool:
+        """Read output until clock value until, or until done() holds. Returns done()."""
+        while True:
+            if done is not None and done():
+                return True
+            wait = until - time.monotonic()
+            if wait <= 0:
+                return False
+            ready, _, _ = select.select([self.fd], [], [], wait)
+            if not ready:
+                continue
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError:
+                return done() if done else False
+            if not data:
+                return done() if done else False
+            now = time.monotonic()
+            if now - self._last > BURST_GAP:
+                self.bursts.append(now)
+            self._last = now
+            self.term.feed(data)
+
+    def send(self, key: str) -> None:
+        os.write(self.fd, _KEY_BYTES.get(key, key.encode()))
+
+    def close(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        self.pump(time.monotonic() + 0.3)
+        os.waitpid(self.pid, 0)
+        os.close(self.fd)
+
+
+def run_level(name: str, keys: int, env: dict, seed: int) -> dict:
+    module, phase, script, glyph = SCENARIOS[name]
+    home = tempfile.mkdtemp(prefix="mandala-harness-")
+    try:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--prepare",
+                        module, phase, str(seed)],
+                       env={**os.environ, "HOME": home}, check=True)
+        s = Session(home, env)
+        try:
+            started = s.pump(time.monotonic() + SETTLE, lambda: s.term.find(glyph))
+            if not started:
+                return {"level": name, "error": "level never drew its player glyph"}
+            t_start   = time.monotonic()
+            n_bursts  = len(s.bursts)
+            latencies = []
+            missed    = 0
+            for i in range(keys):
+                before = s.term.find(glyph)
+                t0 = time.monotonic()
+                s.send(script[i % len(script)])
+                if s.pump(t0 + KEY_TIMEOUT, lambda: s.term.find(glyph) != before):
+                    latencies.append(time.monotonic() - t0)
+                else:
+                    missed += 1
+                s.pump(time.monotonic() + KEY_GAP)
+            elapsed = time.monotonic() - t_start
+            frames  = s.bursts[n_bursts:]
+        finally:
+            s.close()
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    gaps = [b - a for a, b in zip(frames, frames[1:])]
+    return {
+        "level":      name,
+        "phase":      phase,
+        "keys":       keys,
+        "missed":     missed,
+        "latency_ms": _percentiles(latencies),
+        "fps":        round(len(frames) / elapsed, 1) if elapsed else 0.0,
+        "frame_ms":   _percentiles(gaps),
+    }
+
+
+def _percentiles(values: list) -> dict:
+    if not values:
+        return {"p50": None, "p99": None, "max": None}
+    v = sorted(values)
+    n = len(v)
+    return {"p50": round(v[n // 2] * 1000, 1),
+            "p99": round(v[min(n - 1, n * 99 // 100)] * 1000, 1),
+            "max": round(v[-1] * 1000, 1)}
+
+
+def main() -> int:
+    if len(sys.argv) == 5 and sys.argv[1] == "--prepare":
+        _prepare(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return 0
+
+    ap = argparse.ArgumentParser(description="pty latency harness for mandala")
+    ap.add_argument("levels", nargs="*", default=sorted(SCENARIOS),
+                    help="any of " + ", ".join(sorted(SCENARIOS)))
+    ap.add_argument("--keys", type=int, default=30, help="keys to send per level")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--env", action="append", default=[], metavar="K=V",
+                    help="extra environment for the game, e.g. MANDALA_THREADED=1")
+    ap.add_argument("--max-p99", type=float, default=None, metavar="MS",
+                    help="fail if any level's key latency p99 is over this")
+    opts = ap.parse_args()
+    unknown = set(opts.levels) - set(SCENARIOS)
+    if unknown:
+        ap.error("unknown level: " + ", ".join(sorted(unknown)))
+
+    env = dict(e.split("=", 1) for e in opts.env)
+    failed = False
+    for name in opts.levels:
+        result = run_level(name, opts.keys, env, opts.seed)
+        print(json.dumps(result))
+        p99 = result.get("latency_ms", {}).get("p99")
+        if "error" in result or result["missed"]:
+            failed = True
+        elif opts.max_p99 is not None and p99 is not None and p99 > opts.max_p99:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
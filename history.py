@@ -0,0 +1,95 @@
+# history.py
+# Every completed mandala, kept forever, read only when asked.
+#
+# The launcher loops back to level 1 for as long as the installation runs, so the
+# record of past cycles grows without bound. It lives here instead of in carry.json:
+#
+#   history.log — append-only, one json record per line
+#   history.idx — fixed-size (offset, length) entries, one per record
+#
+# Appending costs the same on the first cycle and the ten-thousandth. Reading a
+# record is one seek into the index and one into the log; nothing is loaded
+# until something asks.
+
+from __future__ import annotations
+import json
+import os
+import struct
+
+LOG_PATH   = os.path.expanduser("~/.mandala/history.log")
+INDEX_PATH = os.path.expanduser("~/.mandala/history.idx")
+
+_ENTRY = struct.Struct("<QI")   # byte offset into the log, record length
+
+
+def count() -> int:
+    try:
+        return os.path.getsize(INDEX_PATH) // _ENTRY.size
+    except OSError:
+        return 0
+
+
+def read(i: int) -> dict:
+    """Record i, oldest first. Negative indexes count from the end."""
+    n = count()
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError("history index out of range")
+    with open(INDEX_PATH, "rb") as f:
+        f.seek(i * _ENTRY.size)
+        offset, length = _ENTRY.unpack(f.read(_ENTRY.size))
+    with open(LOG_PATH, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+
+def last() -> dict | None:
+    return read(-1) if count() else None
+
+
+def records(start: int = 0):
+    """Yield records from start onwards, streaming — the log is never loaded whole."""
+    n = count()
+    if start >= n:
+        return
+    with open(INDEX_PATH, "rb") as idx, open(LOG_PATH, "rb") as log:
+        idx.seek(start * _ENTRY.size)
+        for _ in range(start, n):
+            offset, length = _ENTRY.unpack(idx.read(_ENTRY.size))
+            log.seek(offset)
+            yield json.loads(log.read(length))
+
+
+def append(record: dict) -> int:
+    """Append one record and return its index."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+    end  = _repair()
+    with open(LOG_PATH, "ab") as log:
+        log.write(line)
+        log.flush()
+        os.fsync(log.fileno())
+    with open(INDEX_PATH, "ab") as idx:
+        idx.write(_ENTRY.pack(end, len(line)))
+        idx.flush()
+        os.fsync(idx.fileno())
+    return count() - 1
+
+
+def _repair() -> int:
+    """Trim anything a crash left half-written; return where the next record goes.
+    The index is the source of truth: log bytes past its last entry are orphans,
+    and a torn final index entry is dropped."""
+    n   = count()
+    end = 0
+    if os.path.exists(INDEX_PATH) and os.path.getsize(INDEX_PATH) != n * _ENTRY.size:
+        os.truncate(INDEX_PATH, n * _ENTRY.size)
+    if n:
+        with open(INDEX_PATH, "rb") as f:
+            f.seek((n - 1) * _ENTRY.size)
+            offset, length = _ENTRY.unpack(f.read(_ENTRY.size))
+        end = offset + length
+    if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) != end:
+        os.truncate(LOG_PATH, end)
+    return end
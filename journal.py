@@ -0,0 +1,180 @@
+# journal.py
+# Write-ahead tick journal. Recovers a level to within one tick of a crash.
+#
+# Between snapshots, every world-changing event is appended here before it is
+# applied: each simulation tick, and each key that got past the play loop's gating.
+# Recovery loads the snapshot and replays the journal through the level's own
+# tick and key functions, as fast as they run — no TICK_INTERVAL waits.
+#
+# Checkpoints: every AUTOSAVE_INTERVAL a snapshot is queued — the packed world plus
+# its full rng state — and a new journal segment starts. The snapshot reaches the
+# disk a moment later on the writer thread, so the previous segment is kept as
+# <path>.prev — if the newest snapshot never landed, the older one plus both
+# segments still replay to the same place. Each segment header carries the
+# checkpoint's generation; the snapshot body starts with the same number.
+# Checkpoints never touch the rng, so when they happen doesn't change the game.
+#
+# Records are buffered and written with one os.write per play-loop iteration.
+# That survives a killed process; it does not fsync, so it won't survive the
+# machine losing power.
+
+from __future__ import annotations
+import os
+import struct
+
+import snapshot
+
+JOURNAL_PATH = os.path.expanduser("~/.mandala/level.journal")
+PREV_PATH    = JOURNAL_PATH + ".prev"
+
+MAGIC      = b"MSJ1"
+_HEADER    = struct.Struct("<4sI")    # magic, generation
+_STAMP     = struct.Struct("<II")     # generation, rng state length — prefixed to snapshot bodies
+
+OP_TICK = 0x01
+OP_KEY  = 0x02                        # followed by length byte + utf-8 key name
+
+
+class Journal:
+    """Open journal for one level. Starts with a checkpoint of ls."""
+
+    def __init__(self, key: str, pack, ls, now: float) -> None:
+        self.key  = key
+        self.pack = pack
+        self.gen  = _last_generation()
+        self.buf  = bytearray()
+        self.fd   = None
+        self.last = now
+        self.checkpoint(ls, now)
+
+    # ── Recording ─────────────────────────────────────────────
+    def tick(self) -> None:
+        self.buf.append(OP_TICK)
+
+    def key_event(self, key: str) -> None:
+        raw = key.encode()[:255]
+        self.buf += bytes((OP_KEY, len(raw))) + raw
+
+    def flush(self) -> None:
+        """Write everything buffered since the last flush in one call."""
+        if self.buf and self.fd is not None:
+            os.write(self.fd, self.buf)
+            self.buf.clear()
+
+    # ── Checkpoints ───────────────────────────────────────────
+    def poll(self, ls, now: float) -> None:
+        if now - self.last >= snapshot.AUTOSAVE_INTERVAL:
+            self.checkpoint(ls, now)
+
+    def checkpoint(self, ls, now: float) -> None:
+        self.flush()
+        self.gen += 1
+        rng = snapshot.pack_rng(ls.rng)
+        snapshot.save(self.key, _STAMP.pack(self.gen, len(rng)) + rng + self.pack(ls))
+        self._rotate()
+        self.last = now
+
+    def close(self) -> None:
+        self.flush()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def _rotate(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+        os.makedirs(os.path.dirname(JOURNAL_PATH), exist_ok=True)
+        if os.path.exists(JOURNAL_PATH):
+            os.replace(JOURNAL_PATH, PREV_PATH)
+        self.fd = os.open(JOURNAL_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(self.fd, _HEADER.pack(MAGIC, self.gen))
+
+
+# ── Recovery ──────────────────────────────────────────────────
+def recover(key: str, unpack, tick, apply_key):
+    """Rebuild level key from its snapshot and journal.
+    tick(ls) and apply_key(ls, key) must be the same functions the play loop uses.
+    Returns the LevelState, or None if there's no snapshot for this level."""
+    body = snapshot.load(key)
+    if body is None or len(body) < _STAMP.size:
+        return None
+    gen, rng_len = _STAMP.unpack_from(body)
+    rng_end = _STAMP.size + rng_len
+    try:
+        rng = snapshot.unpack_rng(body[_STAMP.size:rng_end])
+        ls  = unpack(body[rng_end:])
+    except (ValueError, struct.error, IndexError):
+        return None
+    ls.rng = rng
+
+    segments = [s for s in (_read(PREV_PATH), _read(JOURNAL_PATH)) if s]
+    for seg_gen, ops in sorted(segments, key=lambda s: s[0]):
+        if seg_gen < gen:
+            continue
+        if seg_gen > gen + 1:
+            break                          # a gap — nothing after it can be trusted
+        gen = seg_gen
+        for op, arg in ops:
+            if op == OP_TICK:
+                tick(ls)
+            else:
+                apply_key(ls, arg)
+    return ls
+
+
+def clear() -> None:
+    for path in (JOURNAL_PATH, PREV_PATH):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _last_generation() -> int:
+    gens = [g for g in (_read_header(PREV_PATH), _read_header(JOURNAL_PATH)) if g is not None]
+    return max(gens, default=0)
+
+
+def _read_header(path: str):
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(head) < _HEADER.size:
+        return None
+    magic, gen = _HEADER.unpack(head)
+    return gen if magic == MAGIC else None
+
+
+def _read(path: str):
+    """(generation, [(op, key)]) for one segment. A torn final record is dropped."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, gen = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        return None
+    ops = []
+    pos = _HEADER.size
+    while pos < len(data):
+        op = data[pos]
+        if op == OP_TICK:
+            ops.append((OP_TICK, ""))
+            pos += 1
+        elif op == OP_KEY and pos + 1 < len(data):
+            n = data[pos + 1]
+            if pos + 2 + n > len(data):
+                break
+            try:
+                ops.append((OP_KEY, data[pos + 2:pos + 2 + n].decode()))
+            except UnicodeDecodeError:
+                break
+            pos += 2 + n
+        else:
+            break
+    return gen, ops
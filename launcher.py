@@ -5,9 +5,14 @@
 import sys
 import os
 import importlib
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import history
+import journal
+import screen as scr
+import snapshot
 from state import CarryState, load_carry, save_carry
 
 LEVELS = [
@@ -22,9 +27,11 @@ LEVELS = [
 
 
 def main() -> None:
+    scr.start_meter()   # only over ssh, or with MANDALA_METER=1
     carry = load_carry()
 
-    if carry.level_index == 0:
+    # A level in progress resumes straight into its saved phase — no welcome.
+    if carry.level_index == 0 and not snapshot.exists():
         from welcome import play as play_welcome
         play_welcome()
 
@@ -33,6 +40,7 @@ def main() -> None:
             level = importlib.import_module(module_path)
         except (ImportError, ModuleNotFoundError):
             # Next level not yet built — loop back to the beginning
+            _close_cycle(carry)
             carry.level_index = 0
             save_carry(carry)
             main()
@@ -41,8 +49,31 @@ def main() -> None:
         carry = level.run(carry)
         carry.level_index += 1
         save_carry(carry)
+        snapshot.clear()   # queued after the carry, so a crash between them resumes nothing stale
+        journal.clear()
 
     _ending()
+    # Every level is built: the cycle closes here, and the next launch begins
+    # the next one.
+    _close_cycle(carry)
+    carry.level_index = 0
+    save_carry(carry)
+
+
+def _close_cycle(carry: CarryState) -> None:
+    # The finished cycle leaves the hot state for the append-only history.
+    # If a crash lands between the append and the save, the cycle number
+    # tells us it's already recorded.
+    prev = history.last()
+    if prev is None or prev.get("cycle") != carry.cycle:
+        history.append({
+            "cycle":     carry.cycle,
+            "ended":     round(time.time()),
+            "dissolved": carry.dissolved,
+            "substrate": carry.substrate,
+        })
+    carry.cycle += 1
+    carry.dissolved = []
 
 
 def _ending() -> None:
@@ -4,6 +4,7 @@
 # Phase 2 (catch): archaea body moves at top; compounds rise from vent.
 #   Body segments dim = not yet collected, bright = absorbed.
 #   On completion the body floats to the bottom and settles as dim sediment.
+#   Rival cells drift through the arena as dim ~, eating what they reach.
 # Monochrome only.
 
 import screen as scr
@@ -11,6 +12,7 @@ from . import world as w
 from . import text as txt
 
 _FILL_CHAR = "."
+_WARM_CHARS = ".:*"   # low-bandwidth: warmth in the glyph, one attribute for all
 
 
 # ── Navigation view ───────────────────────────────────────────
@@ -45,15 +47,19 @@ def draw_nav(stdscr, ls: w.LevelState, msg: str = "") -> None:
     if msg:
         _draw_centered(stdscr, h // 2, msg, dim=True)
 
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 def _fill_panel(stdscr, h: int, x0: int, x1: int,
                 is_warm: bool, prox: float) -> None:
+    steady  = scr.low_bandwidth()
+    warm_ch = _WARM_CHARS[(prox >= 0.20) + (prox > 0.60)]
     for row in range(1, h - 2):
         for col in range(x0 + 1, x1 - 1):
             if (row * 17 + col * 11) % 13 == 0:
-                if is_warm:
+                if steady:
+                    scr.addch(stdscr, row, col, warm_ch if is_warm else _FILL_CHAR, dim=True)
+                elif is_warm:
                     bold = prox > 0.60
                     dim  = prox < 0.20
                     scr.addch(stdscr, row, col, _FILL_CHAR, bold=bold, dim=dim)
@@ -98,6 +104,11 @@ def draw_catch(stdscr, ls: w.LevelState, msg: str = "") -> None:
     else:
         _draw_archaea_body(stdscr, _ARENA_TOP, arena_left + ls.catch_px, ls.collected)
 
+    # Rival cells — under the compounds, which stay readable on top of them
+    for col, row in w.rival_cells(ls):
+        if row < arena_h:
+            scr.addch(stdscr, _ARENA_TOP + row, arena_left + col, "~", dim=True)
+
     # Rising compounds — bright if still needed, dim if already have it
     for s in ls.sprites:
         if 0 < s.y < arena_h:
@@ -109,7 +120,7 @@ def draw_catch(stdscr, ls: w.LevelState, msg: str = "") -> None:
     if msg:
         scr.addstr(stdscr, h - 2, 2, msg, dim=True)
     scr.addstr(stdscr, h - 1, 2, "a d to move", dim=True)
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 def _draw_archaea_body(stdscr, row: int, col: int,
@@ -156,14 +167,12 @@ def draw_win(stdscr, msg: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, msg)
-    stdscr.refresh()
 
 
 def draw_dissolve_line(stdscr, line: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, line, dim=True)
-    stdscr.refresh()
 
 
 # ── Utility ───────────────────────────────────────────────────
@@ -1,12 +1,21 @@
 # levels/l01_archaea/world.py
 # Pure engine logic. No curses imports.
-# Phase 1: navigation via relative heading across a 2D grid.
+# Phase 1: navigation via relative heading across a 2D grid, following the heat
+#           and chemistry the vent breathes into the water (fields.py).
 # Phase 2: catch — compounds rise from vent, player collects all four types.
 #           When complete the bacterium lights up and floats to the bottom.
+#           Rival cells (agents.py) share the arena: they chase the same
+#           compounds, shy from the vent's heat and crowd each other off tiles.
 
 from __future__ import annotations
+import math
 import random
 from dataclasses import dataclass, field
+
+import agents
+import fields
+import snapshot
+from substrate import SubstrateMap, quality
 from . import text as txt
 
 # ── Navigation grid ───────────────────────────────────────────
@@ -21,6 +30,25 @@ HEADING_DELTA = {
     "W": (-1, 0),
 }
 
+# ── Vent plume ────────────────────────────────────────────────
+# The vent emits the four compounds and heat every tick; a rising current that
+# sways side to side carries them off while they spread and fade.
+PLUME_CHANNELS = {           # name → (diffusion, decay) per tick
+    "S":    (0.30, 0.010),
+    "F":    (0.12, 0.008),   # iron — heavy, stays near the vent
+    "H":    (0.60, 0.020),   # hydrogen — light, spreads far and thins fast
+    "C":    (0.35, 0.012),
+    "heat": (0.45, 0.040),
+}
+VENT_OUTPUT  = {"S": 1.0, "F": 0.8, "H": 1.2, "C": 0.9, "heat": 1.0}
+PLUME_RISE   = 0.25   # rows per tick the current carries upward
+PLUME_SWAY   = 0.35   # peak sideways current, cells per tick
+SWAY_PERIOD  = 240    # ticks per full sway
+HEAT_PULSE   = 0.3    # heat output swings ±30%
+PULSE_PERIOD = 60     # ticks per heat pulse
+PLUME_WARMUP = 300    # ticks run at generation, so the plume is already there
+PROX_FALLOFF = 2.0    # e-folds of heat between the vent and proximity 0
+
 # ── Catch arena ───────────────────────────────────────────────
 CATCH_COLS     = 44
 CATCH_ROWS     = 20
@@ -28,6 +56,29 @@ SPAWN_INTERVAL = 10
 RISE_SPEED     = 1
 COMPOUNDS      = ["S", "F", "H", "C"]
 
+# ── Rival colonies ────────────────────────────────────────────
+# Rivals live between the player's row and the sediment row: swarm row r is
+# arena row r + 1. They burn energy every tick, and a compound eaten feeds one.
+# A rival fed past RIVAL_SPLIT divides; one that runs dry dies. When they dwindle
+# below RIVAL_MIN the vent now and then seeds a new one.
+RIVALS       = 10      # at generation
+RIVAL_MIN    = 4
+RIVAL_CAP    = 60
+RIVAL_SEED   = 0.02    # chance per tick of a new rival while below RIVAL_MIN
+RIVAL_SENSE  = 5.0     # cells a rival notices a compound from
+RIVAL_SEEK   = 0.20
+RIVAL_CROWD  = 0.10
+RIVAL_FLEE   = 0.25
+RIVAL_DEPTH  = 3.0     # rows above the vent the heat is felt over, per e-fold
+RIVAL_JITTER = 0.12
+RIVAL_DRAG   = 0.25
+RIVAL_SPEED  = 0.45    # cells per tick
+RIVAL_BITE   = 0.8     # how close a rival must be to eat
+RIVAL_BURN   = 0.003   # energy per tick
+RIVAL_MEAL   = 0.6
+RIVAL_FULL   = 1.2     # sated rivals ignore compounds
+RIVAL_SPLIT  = 1.6
+
 # ── Body definition ───────────────────────────────────────────
 # Segments extending LEFT of @ and RIGHT of @.
 # Each entry: (compound_key, display_char)
@@ -49,6 +100,12 @@ FLOAT_MAX_DRIFT = 0.3   # max horizontal drift per tick (adds subtle organic fee
 # ── Win condition ─────────────────────────────────────────────
 WIN_DEAD = 8
 
+# ── Sediment carry ────────────────────────────────────────────
+# The catch arena is a close-up of the vent. Seen from the nav grid it spans
+# SEDIMENT_SPAN tiles across, and each settled body conditions a small pool.
+SEDIMENT_SPAN   = 8
+SEDIMENT_RADIUS = 3.0
+
 
 # ── State ─────────────────────────────────────────────────────
 @dataclass
@@ -63,6 +120,14 @@ class SettledBody:
     x: int   # column of @ when the body settled
 
 
+def _plume() -> fields.Field:
+    return fields.Field(NAV_W, NAV_H, PLUME_CHANNELS)
+
+
+def _rivals() -> agents.Swarm:
+    return agents.Swarm(CATCH_COLS, CATCH_ROWS - 2)
+
+
 @dataclass
 class LevelState:
     # Navigation
@@ -71,6 +136,7 @@ class LevelState:
     heading: str  = "S"
     vent_x:  int  = 0
     vent_y:  int  = 0
+    plume:   fields.Field = field(default_factory=_plume)
 
     # Phase
     phase:   str  = "nav"
@@ -81,6 +147,7 @@ class LevelState:
     sprites:      list = field(default_factory=list)
     catch_px:     int  = CATCH_COLS // 2
     catch_ticks:  int  = 0
+    rivals:       agents.Swarm = field(default_factory=_rivals)
 
     # Float (death animation)
     floating:     bool  = False
@@ -95,27 +162,55 @@ class LevelState:
     dead_count:   int  = 0
     won:          bool = False
 
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
 
 # ── Generation ────────────────────────────────────────────────
-def generate_state() -> LevelState:
-    vent_x  = random.randint(2, NAV_W - 3)
-    vent_y  = random.randint(NAV_H // 3, NAV_H - 1)
-    heading = random.choice(HEADINGS)
-    return LevelState(
+def generate_state(seed: int | None = None) -> LevelState:
+    rng     = random.Random(seed)
+    vent_x  = rng.randint(2, NAV_W - 3)
+    vent_y  = rng.randint(NAV_H // 3, NAV_H - 1)
+    heading = rng.choice(HEADINGS)
+    ls = LevelState(
         nx=NAV_W // 2,
         ny=NAV_H // 2,
         heading=heading,
         vent_x=vent_x,
         vent_y=vent_y,
         catch_px=max(BODY_PX_MIN, min(BODY_PX_MAX, CATCH_COLS // 2)),
+        rng=rng,
     )
+    for _ in range(PLUME_WARMUP):
+        vent_tick(ls)
+    for _ in range(RIVALS):
+        ls.rivals.add(rng.uniform(0, CATCH_COLS), rng.uniform(0, CATCH_ROWS - 2),
+                      rng.uniform(RIVAL_MEAL, RIVAL_FULL))
+    return ls
+
+
+# ── Vent plume ────────────────────────────────────────────────
+def vent_tick(ls: LevelState) -> None:
+    """The vent breathes out one tick's worth; the plume drifts and spreads."""
+    f     = ls.plume
+    pulse = 1.0 + HEAT_PULSE * math.sin(2 * math.pi * f.t / PULSE_PERIOD)
+    for name, out in VENT_OUTPUT.items():
+        f.emit(name, ls.vent_x, ls.vent_y, out * pulse if name == "heat" else out)
+    f.step(PLUME_SWAY * math.sin(2 * math.pi * f.t / SWAY_PERIOD), -PLUME_RISE)
+
+
+def _heat(ls: LevelState, x: int, y: int) -> float:
+    return ls.plume.sample("heat", x, y)
 
 
 # ── Navigation helpers ────────────────────────────────────────
 def nav_proximity(ls: LevelState) -> float:
-    """0.0 = far from vent, 1.0 = at vent."""
-    dist = abs(ls.nx - ls.vent_x) + abs(ls.ny - ls.vent_y)
-    return max(0.0, 1.0 - dist / (NAV_W + NAV_H))
+    """0.0 = far from vent, 1.0 = at vent — by how much of the vent's heat reaches here."""
+    here, vent = _heat(ls, ls.nx, ls.ny), _heat(ls, ls.vent_x, ls.vent_y)
+    if here <= 0.0 or vent <= 0.0:
+        return 0.0
+    return max(0.0, min(1.0, 1.0 + math.log(here / vent) / PROX_FALLOFF))
 
 
 def nav_arrived(ls: LevelState) -> bool:
@@ -139,20 +234,22 @@ def _forward_pos(nx: int, ny: int, heading: str) -> tuple[int, int]:
 
 
 def nav_warmer_direction(ls: LevelState) -> str:
-    """Return 'left', 'forward', or 'right' — whichever leads closest to vent."""
-    def dist_from(nx: int, ny: int) -> int:
-        return abs(nx - ls.vent_x) + abs(ny - ls.vent_y)
+    """Return 'left', 'forward', or 'right' — whichever step is warmest.
+    The current can carry the hottest water a cell off the vent, so a step onto
+    the vent itself always wins."""
+    def warmth(x: int, y: int) -> float:
+        return math.inf if (x, y) == (ls.vent_x, ls.vent_y) else _heat(ls, x, y)
 
     fx, fy = _forward_pos(ls.nx, ls.ny, ls.heading)
     lx, ly = _forward_pos(ls.nx, ls.ny, _turn_left(ls.heading))
     rx, ry = _forward_pos(ls.nx, ls.ny, _turn_right(ls.heading))
 
     options = {
-        "forward": dist_from(fx, fy),
-        "left":    dist_from(lx, ly),
-        "right":   dist_from(rx, ry),
+        "forward": warmth(fx, fy),
+        "left":    warmth(lx, ly),
+        "right":   warmth(rx, ry),
     }
-    return min(options, key=options.get)
+    return max(options, key=options.get)
 
 
 def nav_move(ls: LevelState, action: str) -> str:
@@ -169,16 +266,18 @@ def nav_move(ls: LevelState, action: str) -> str:
             return txt.ARRIVE_VENT
         prox = nav_proximity(ls)
         if prox > 0.65:
-            return random.choice(txt.ATMOSPHERE_CLOSE)
+            return ls.rng.choice(txt.ATMOSPHERE_CLOSE)
         if prox > 0.35:
-            return random.choice(txt.ATMOSPHERE_MED)
-        return random.choice(txt.ATMOSPHERE_FAR)
+            return ls.rng.choice(txt.ATMOSPHERE_MED)
+        return ls.rng.choice(txt.ATMOSPHERE_FAR)
     return ""
 
 
 # ── Catch phase ───────────────────────────────────────────────
 def catch_tick(ls: LevelState) -> None:
     ls.catch_ticks += 1
+    vent_tick(ls)
+    rivals_tick(ls)
 
     if ls.floating:
         # Advance float animation — body drifts downward with slight horizontal wander.
@@ -191,15 +290,16 @@ def catch_tick(ls: LevelState) -> None:
             _advance_bacterium(ls)
         return
 
-    # Spawn — bias 55% toward compounds not yet collected.
+    # Spawn — bias 55% toward compounds not yet collected, otherwise whatever the
+    # vent is giving off most; it rises where the plume carries that compound.
     if ls.catch_ticks % SPAWN_INTERVAL == 0:
         needed = [c for c in COMPOUNDS if c not in ls.collected]
-        if needed and random.random() < 0.55:
-            kind = random.choice(needed)
+        if needed and ls.rng.random() < 0.55:
+            kind = ls.rng.choice(needed)
         else:
-            kind = random.choice(COMPOUNDS)
+            kind = ls.rng.choices(COMPOUNDS, [_vent_share(ls, c) for c in COMPOUNDS])[0]
         ls.sprites.append(CompoundSprite(
-            x=random.randint(0, CATCH_COLS - 1),
+            x=ls.rng.choices(range(CATCH_COLS), _arena_profile(ls, kind))[0],
             y=CATCH_ROWS - 1,
             kind=kind,
         ))
@@ -210,6 +310,70 @@ def catch_tick(ls: LevelState) -> None:
     ls.sprites = [s for s in ls.sprites if s.y >= 0]
 
 
+def _vent_share(ls: LevelState, kind: str) -> float:
+    return ls.plume.sample(kind, ls.vent_x, ls.vent_y) + 1e-9
+
+
+def _arena_profile(ls: LevelState, kind: str) -> list:
+    """How much of kind each arena column holds — the arena is SEDIMENT_SPAN nav
+    tiles of the vent row, seen close up."""
+    return [
+        ls.plume.sample(kind, ls.vent_x + (col / (CATCH_COLS - 1) - 0.5) * SEDIMENT_SPAN,
+                        ls.vent_y) + 1e-9
+        for col in range(CATCH_COLS)
+    ]
+
+
+# ── Rivals ───────────────────────────────────────────────────
+def rivals_tick(ls: LevelState) -> None:
+    """Rivals crowd apart, chase compounds, back off the heat, move, eat, and
+    live or die by what they ate."""
+    sw     = ls.rivals
+    energy = sw.energy
+    sw.rebuild()
+    sw.crowd(RIVAL_CROWD)
+
+    def hungry(i: int) -> bool:
+        return energy[i] < RIVAL_FULL
+
+    for s in ls.sprites:
+        sw.seek(s.x + 0.5, s.y - 0.5, RIVAL_SENSE, RIVAL_SEEK, hungry)
+
+    # The heat rises off the vent row below the swarm; felt strongest there.
+    heat  = _arena_profile(ls, "heat")
+    peak  = max(heat)
+    heat  = [v / peak for v in heat]
+    slope = [0.0] + [(heat[c + 1] - heat[c - 1]) * 0.5 for c in range(1, CATCH_COLS - 1)] + [0.0]
+    felt  = [math.exp((y - sw.h) / RIVAL_DEPTH) for y in sw.y]
+    cols  = [int(x) for x in sw.x]
+    sw.steer([-RIVAL_FLEE * slope[c] * f for c, f in zip(cols, felt)],
+             [-RIVAL_FLEE * heat[c] * f for c, f in zip(cols, felt)])
+
+    sw.jitter(ls.rng, RIVAL_JITTER)
+    sw.move(RIVAL_DRAG, RIVAL_SPEED)
+
+    # A compound within reach of a hungry rival is gone — the nearest one eats it.
+    sw.rebuild()
+    remaining = []
+    for s in ls.sprites:
+        i = sw.nearest(s.x + 0.5, s.y - 0.5, RIVAL_BITE, hungry)
+        if i < 0:
+            remaining.append(s)
+        else:
+            energy[i] += RIVAL_MEAL
+    ls.sprites = remaining
+
+    sw.split(RIVAL_SPLIT, RIVAL_CAP)
+    sw.burn(RIVAL_BURN)
+    if len(sw) < RIVAL_MIN and ls.rng.random() < RIVAL_SEED:
+        sw.add(ls.rng.uniform(0, CATCH_COLS), sw.h - 1, RIVAL_MEAL)
+
+
+def rival_cells(ls: LevelState) -> list:
+    """(col, arena row) of every rival."""
+    return [(int(x), int(y) + 1) for x, y in zip(ls.rivals.x, ls.rivals.y)]
+
+
 def catch_check_collision(ls: LevelState) -> str | None:
     """Check if any sprite reached the player row and is uncollected.
     Returns 'collected', 'all_collected', or None."""
@@ -230,7 +394,7 @@ def catch_check_collision(ls: LevelState) -> str | None:
         ls.floating    = True
         ls.float_y     = 0.0
         ls.float_x     = float(ls.catch_px)
-        ls.float_drift = random.uniform(-FLOAT_MAX_DRIFT, FLOAT_MAX_DRIFT)
+        ls.float_drift = ls.rng.uniform(-FLOAT_MAX_DRIFT, FLOAT_MAX_DRIFT)
         ls.sprites     = []
         return "all_collected"
 
@@ -268,4 +432,71 @@ def serialize_for_carry(ls: LevelState) -> dict:
         "coverage":   round(ls.dead_count / WIN_DEAD, 3),
         "origin_x":   round(ls.vent_x / (NAV_W - 1), 3),
         "origin_y":   round(ls.vent_y / (NAV_H - 1), 3),
+        "map":        _sediment_map(ls),
     }
+
+
+def _sediment_map(ls: LevelState) -> SubstrateMap:
+    """Conditioned substrate on the nav grid — sediment pooled around the vent.
+    Each settled body deposits where it landed, projected out of the arena."""
+    level = [[0.0] * NAV_W for _ in range(NAV_H)]
+    share = 2.0 / WIN_DEAD   # two overlapping bodies saturate a tile
+    for body in ls.settled:
+        bx = ls.vent_x + (body.x / (CATCH_COLS - 1) - 0.5) * SEDIMENT_SPAN
+        by = ls.vent_y
+        for y in range(NAV_H):
+            for x in range(NAV_W):
+                dist = math.sqrt((x - bx) ** 2 + (y - by) ** 2)
+                if dist < SEDIMENT_RADIUS:
+                    level[y][x] += share * (1.0 - dist / SEDIMENT_RADIUS)
+    return SubstrateMap.from_rows(
+        [quality(min(1.0, v)) for v in row] for row in level
+    )
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 3
+PHASES = ("nav", "catch")
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBBBBBB", SNAPSHOT_VERSION, ls.nx, ls.ny, HEADINGS.index(ls.heading),
+          ls.vent_x, ls.vent_y, PHASES.index(ls.phase))
+    p.put("?B", ls.first, snapshot.pack_set(ls.collected, COMPOUNDS))
+    p.put("BI", ls.catch_px, ls.catch_ticks)
+    p.put("?ddd", ls.floating, ls.float_y, ls.float_x, ls.float_drift)
+    p.put("H?", ls.dead_count, ls.won)
+    p.blob(bytes(s.x for s in ls.sprites))
+    p.blob(bytes(s.y for s in ls.sprites))
+    p.blob(bytes(COMPOUNDS.index(s.kind) for s in ls.sprites))
+    p.blob(bytes(b.x for b in ls.settled))
+    p.blob(fields.pack(ls.plume))
+    p.blob(agents.pack(ls.rivals))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, nx, ny, heading, vent_x, vent_y, phase = u.get("BBBBBBB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    first, collected          = u.get("?B")
+    catch_px, catch_ticks     = u.get("BI")
+    floating, fy, fx, drift   = u.get("?ddd")
+    dead_count, won           = u.get("H?")
+    xs, ys, kinds, settled    = u.blob(), u.blob(), u.blob(), u.blob()
+    plume  = fields.unpack(u.blob(), NAV_W, NAV_H, PLUME_CHANNELS)
+    rivals = agents.unpack(u.blob(), CATCH_COLS, CATCH_ROWS - 2)
+    return LevelState(
+        nx=nx, ny=ny, heading=HEADINGS[heading], vent_x=vent_x, vent_y=vent_y,
+        plume=plume,
+        phase=PHASES[phase], first=first,
+        collected=snapshot.unpack_set(collected, COMPOUNDS),
+        sprites=[CompoundSprite(x=x, y=y, kind=COMPOUNDS[k])
+                 for x, y, k in zip(xs, ys, kinds)],
+        catch_px=catch_px, catch_ticks=catch_ticks, rivals=rivals,
+        floating=floating, float_y=fy, float_x=fx, float_drift=drift,
+        settled=[SettledBody(x=x) for x in settled],
+        dead_count=dead_count, won=won,
+    )
@@ -2,8 +2,12 @@
 # Curses rendering for the cyanobacteria level. First level with color.
 # Phase 1 (ascend): vertical cross-section; light zone grows from top.
 # Phase 2 (bloom): mat spread across lit grid; O2 meter and coverage counter.
+#   With a raster (raster.wanted()), the mat is drawn in half blocks: solid where
+#   the light is strong, a thin film where it is weak, sunlit on top in the
+#   brightest water; bubbles are points of light over it.
 
 import curses
+import raster
 import screen as scr
 from . import world as w
 
@@ -78,6 +82,7 @@ def draw_ascend(stdscr, ls: w.LevelState, msg: str = "") -> None:
     # depth=0         → light_rows=arena_h-1, player at top.
     light_rows = int((w.MAX_DEPTH - ls.depth) / w.MAX_DEPTH * (arena_h - 1))
     player_row = arena_h - 1 - light_rows   # player rises as light grows
+    low        = scr.low_bandwidth()        # no dark water, no bold shimmer
 
     # Fill arena
     for row in range(arena_h):
@@ -92,10 +97,10 @@ def draw_ascend(stdscr, ls: w.LevelState, msg: str = "") -> None:
                 is_lower_half = row >= light_rows // 2
                 ch = "~" if is_lower_half else "\xb7"  # · = U+00B7
                 _cch(stdscr, screen_row, col, ch,
-                     CP_YELLOW, bold=is_lower_half)
+                     CP_YELLOW, bold=is_lower_half and not low)
             elif row == player_row:
                 pass   # player drawn separately below
-            else:
+            elif not low:
                 # Dark water — sparse blue dots
                 if _is_sparse(row, col):
                     _cch(stdscr, screen_row, col, ".", CP_BLUE, dim=True)
@@ -113,7 +118,7 @@ def draw_ascend(stdscr, ls: w.LevelState, msg: str = "") -> None:
         _draw_centered(stdscr, h // 2, msg, dim=True)
 
     scr.addstr(stdscr, h - 2, 2, "w / \u2191 to rise", dim=True)
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 def _is_sparse(row: int, col: int) -> bool:
@@ -129,6 +134,7 @@ def draw_bloom(stdscr, ls: w.LevelState, msg: str = "") -> None:
 
     arena_top  = _ARENA_TOP_BLOOM
     arena_left = max(0, (sw - w.BLOOM_W) // 2)
+    low        = scr.low_bandwidth()   # no light dots, no bubbles
 
     # HUD row 0 — O2 meter
     o2_pct  = min(1.0, ls.total_o2 / w.WIN_O2)
@@ -143,6 +149,14 @@ def draw_bloom(stdscr, ls: w.LevelState, msg: str = "") -> None:
     mat_str = f"mat: {cov_pct}%"
     _cstr(stdscr, 1, max(0, sw - len(mat_str) - 2), mat_str, CP_GREEN)
 
+    if raster.wanted():
+        _draw_bloom_raster(stdscr, ls, h, sw, arena_top, arena_left)
+        if msg:
+            scr.addstr(stdscr, h - 2, 2, msg, dim=True)
+        scr.addstr(stdscr, h - 1, 2, "wasd / arrows to move", dim=True)
+        scr.present(stdscr)
+        return
+
     # Arena — background layer then colony/player
     for ry in range(w.BLOOM_H):
         for rx in range(w.BLOOM_W):
@@ -160,12 +174,12 @@ def draw_bloom(stdscr, ls: w.LevelState, msg: str = "") -> None:
             elif is_colony:
                 ch = _colony_char(light_val)
                 _cch(stdscr, sr, sc, ch, CP_GREEN)
-            elif light_val > 0.3:
+            elif light_val > 0.3 and not low:
                 _cch(stdscr, sr, sc, "\xb7", CP_YELLOW, dim=True)
             # else: dark, leave empty
 
     # Bubbles — drawn last so they float above colony tiles
-    for bx, by in ls.bubbles:
+    for bx, by in ([] if low else ls.bubbles.positions()):
         sr = arena_top + by
         sc = arena_left + bx
         if 0 <= sr < h - 2 and 0 <= sc < sw:
@@ -175,7 +189,7 @@ def draw_bloom(stdscr, ls: w.LevelState, msg: str = "") -> None:
         scr.addstr(stdscr, h - 2, 2, msg, dim=True)
 
     scr.addstr(stdscr, h - 1, 2, "wasd / arrows to move", dim=True)
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 def _colony_char(light_val: float) -> str:
@@ -186,16 +200,59 @@ def _colony_char(light_val: float) -> str:
     return "%"
 
 
+# ── Bloom raster ──────────────────────────────────────────────
+_bloom_raster: raster.Raster | None = None
+
+
+def _mat_inks(light_val: float) -> tuple[int, int]:
+    """(top, bottom) pixel of a mat cell — the half-block take on _colony_char."""
+    if light_val > 0.7:
+        return raster.YELLOW, raster.GREEN
+    if light_val > 0.4:
+        return raster.GREEN, raster.GREEN
+    return raster.NONE, raster.GREEN
+
+
+def _draw_bloom_raster(stdscr, ls: w.LevelState, h: int, sw: int,
+                       arena_top: int, arena_left: int) -> None:
+    global _bloom_raster
+    if _bloom_raster is None:
+        _bloom_raster = raster.Raster(w.BLOOM_W, w.BLOOM_H, raster.HALF)
+    r = _bloom_raster
+
+    # Lit water under the mat, as glyphs; the raster leaves it showing.
+    for rx in range(w.BLOOM_W):
+        sc = arena_left + rx
+        if ls.light[rx] > 0.3 and sc < sw:
+            for ry in range(w.BLOOM_H):
+                if arena_top + ry < h - 2:
+                    _cch(stdscr, arena_top + ry, sc, "\xb7", CP_YELLOW, dim=True)
+
+    inks = [_mat_inks(ls.light[rx]) for rx in range(w.BLOOM_W)]
+    r.clear()
+    for ry, row in enumerate(ls.colony):
+        top = bytes(inks[rx][0] if on else raster.NONE for rx, on in enumerate(row))
+        bot = bytes(inks[rx][1] if on else raster.NONE for rx, on in enumerate(row))
+        r.px[2 * ry * r.w:(2 * ry + 1) * r.w]       = top
+        r.px[(2 * ry + 1) * r.w:(2 * ry + 2) * r.w] = bot
+    for bx, by in ls.bubbles.positions():
+        r.set(bx, 2 * by, raster.WHITE)
+    r.draw(stdscr, arena_top, arena_left)
+
+    # Player over the raster, clipped to the arena like the glyph view.
+    sr, sc = arena_top + ls.py, arena_left + ls.px
+    if sr < h - 2 and sc < sw:
+        _cch(stdscr, sr, sc, "@", CP_GREEN, bold=True)
+
+
 # ── Win / dissolve ────────────────────────────────────────────
 def draw_win(stdscr, msg: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_GREEN)
-    stdscr.refresh()
 
 
 def draw_dissolve_line(stdscr, line: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, line, dim=True)
-    stdscr.refresh()
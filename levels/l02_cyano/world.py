@@ -8,6 +8,11 @@ import math
 import random
 from dataclasses import dataclass, field
 
+import particles
+import resample
+import snapshot
+from substrate import SubstrateMap, quality
+
 # ── Ascend constants ───────────────────────────────────────────
 MAX_DEPTH = 10
 
@@ -18,9 +23,15 @@ SPREAD_CHANCE  = 0.02
 O2_RATE        = 0.04
 WIN_O2         = 200.0
 BUBBLE_CHANCE  = 0.04
+BUBBLE_SLOTS   = 1024   # live bubbles at most — a full mat at steady state is ~300
+SEDIMENT_BONUS = 1.5    # spread multiplier on fully conditioned archaea sediment
 
 
 # ── State ─────────────────────────────────────────────────────
+def _bubbles() -> particles.Particles:
+    return particles.Particles(BUBBLE_SLOTS, BLOOM_W, BLOOM_H)
+
+
 @dataclass
 class LevelState:
     # Phase
@@ -37,13 +48,18 @@ class LevelState:
     origin_x: float = 0.5
     light:    list  = field(default_factory=list)   # BLOOM_W floats 0.0–1.0
     colony:   list  = field(default_factory=list)   # BLOOM_H x BLOOM_W bools
-    bubbles:  list  = field(default_factory=list)   # list of [x, y]
+    bubbles:  particles.Particles = field(default_factory=_bubbles)   # rising O2
+    ground:   list  = field(default_factory=list)   # BLOOM_H x BLOOM_W floats — inherited sediment
 
     # Bloom — progress
     total_o2:            float = 0.0
     coverage_msgs_shown: set   = field(default_factory=set)  # {5, 20, 50}
     won:                 bool  = False
 
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
 
 # ── Generation ────────────────────────────────────────────────
 def _make_light(origin_x: float) -> list:
@@ -54,7 +70,7 @@ def _make_light(origin_x: float) -> list:
     ]
 
 
-def generate_state(carry) -> LevelState:
+def generate_state(carry, seed: int | None = None) -> LevelState:
     origin_x = carry.origin_x
     px = int(origin_x * (BLOOM_W - 1))
     px = max(1, min(BLOOM_W - 2, px))
@@ -62,6 +78,7 @@ def generate_state(carry) -> LevelState:
 
     light  = _make_light(origin_x)
     colony = [[False] * BLOOM_W for _ in range(BLOOM_H)]
+    ground = _read_ground(carry.maps.get("archaea"))
 
     # Seed 3×3 patch centered on starting position
     for dy in range(-1, 2):
@@ -77,9 +94,20 @@ def generate_state(carry) -> LevelState:
         origin_x=origin_x,
         light=light,
         colony=colony,
+        ground=ground,
+        rng=random.Random(seed),
     )
 
 
+def _read_ground(sediment: SubstrateMap | None) -> list:
+    """Inherited sediment as BLOOM_H rows of 0.0–1.0 on the bloom grid.
+    Kept at tile precision (k/255) so a snapshot restores it exactly."""
+    if sediment is None:
+        return [[0.0] * BLOOM_W for _ in range(BLOOM_H)]
+    tiles = resample.resample(sediment, BLOOM_W, BLOOM_H)
+    return [[q / 255 for q in tiles.row(ry)] for ry in range(BLOOM_H)]
+
+
 # ── Ascend phase ──────────────────────────────────────────────
 def ascend_step(ls: LevelState) -> str:
     """Decrease depth by 1, return flavor text."""
@@ -90,27 +118,29 @@ def ascend_step(ls: LevelState) -> str:
     if ls.depth == 0:
         return txt.ASCEND_ARRIVE
     elif ls.depth <= 2:
-        return random.choice(txt.ASCEND_NEAR)
+        return ls.rng.choice(txt.ASCEND_NEAR)
     elif ls.depth <= 5:
-        return random.choice(txt.ASCEND_MID)
+        return ls.rng.choice(txt.ASCEND_MID)
     else:
-        return random.choice(txt.ASCEND_DEEP)
+        return ls.rng.choice(txt.ASCEND_DEEP)
 
 
 # ── Bloom phase ───────────────────────────────────────────────
 def bloom_tick(ls: LevelState) -> None:
-    # Spread: each colonized cell has SPREAD_CHANCE of claiming a random empty neighbor
+    # Spread: each colonized cell has SPREAD_CHANCE of claiming a random empty neighbor,
+    # more on ground the archaea conditioned.
     new_colonies = []
     for ry in range(BLOOM_H):
         for rx in range(BLOOM_W):
-            if ls.colony[ry][rx] and random.random() < SPREAD_CHANCE:
+            chance = SPREAD_CHANCE * (1.0 + SEDIMENT_BONUS * ls.ground[ry][rx])
+            if ls.colony[ry][rx] and ls.rng.random() < chance:
                 neighbors = []
                 for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1)):
                     ny, nx = ry + dy, rx + dx
                     if 0 <= ny < BLOOM_H and 0 <= nx < BLOOM_W and not ls.colony[ny][nx]:
                         neighbors.append((ny, nx))
                 if neighbors:
-                    new_colonies.append(random.choice(neighbors))
+                    new_colonies.append(ls.rng.choice(neighbors))
     for ny, nx in new_colonies:
         ls.colony[ny][nx] = True
 
@@ -120,16 +150,10 @@ def bloom_tick(ls: LevelState) -> None:
             if ls.colony[ry][rx]:
                 ls.total_o2 += ls.light[rx] * O2_RATE
 
-    # Advance existing bubbles (rise = y decreases)
-    new_bubbles = [[x, y - 1] for x, y in ls.bubbles if y - 1 >= 0]
-
-    # Emit new bubbles from colonized cells
-    for ry in range(BLOOM_H):
-        for rx in range(BLOOM_W):
-            if ls.colony[ry][rx] and random.random() < BUBBLE_CHANCE:
-                new_bubbles.append([rx, ry - 1])
-
-    ls.bubbles = new_bubbles
+    # Bubbles rise a row a tick until they pass the top; colonized cells emit
+    # new ones just above themselves.
+    ls.bubbles.step()
+    ls.bubbles.spawn_mask(ls.colony, BUBBLE_CHANCE, ls.rng, dy=-1, vy=-1.0)
 
     # Win check
     if ls.total_o2 >= WIN_O2:
@@ -156,4 +180,53 @@ def serialize_for_carry(ls: LevelState) -> dict:
         "total_o2":  round(ls.total_o2, 1),
         "origin_x":  ls.origin_x,
         "origin_y":  round(ls.py / (BLOOM_H - 1), 3),
+        "map":       _colony_map(ls),
     }
+
+
+def _colony_map(ls: LevelState) -> SubstrateMap:
+    """The mat as tile quality — colonized cells, richer where the light was strong."""
+    return SubstrateMap.from_rows(
+        [quality(0.5 + 0.5 * ls.light[rx]) if ls.colony[ry][rx] else 0
+         for rx in range(BLOOM_W)]
+        for ry in range(BLOOM_H)
+    )
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 2
+PHASES       = ("ascend", "bloom")
+COVERAGE_MSG = (5, 20, 50)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBBBB", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.depth, ls.px, ls.py)
+    p.put("ddB?", ls.origin_x, ls.total_o2,
+          snapshot.pack_set(ls.coverage_msgs_shown, COVERAGE_MSG), ls.won)
+    p.blob(snapshot.pack_bits(ls.colony))
+    p.blob(snapshot.pack_grid([[round(v * 255) for v in row] for row in ls.ground]))
+    p.blob(particles.pack(ls.bubbles))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, depth, px, py = u.get("BBBBB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    origin_x, total_o2, shown, won = u.get("ddB?")
+    colony = snapshot.unpack_bits(u.blob(), BLOOM_W, BLOOM_H)
+    ground = snapshot.unpack_grid(u.blob(), BLOOM_W, BLOOM_H)
+    bubbles = particles.unpack(u.blob(), BUBBLE_SLOTS, BLOOM_W, BLOOM_H)
+    return LevelState(
+        phase=PHASES[phase], depth=depth, px=px, py=py,
+        origin_x=origin_x,
+        light=_make_light(origin_x),
+        colony=colony,
+        bubbles=bubbles,
+        ground=[[q / 255 for q in row] for row in ground],
+        total_o2=total_o2,
+        coverage_msgs_shown=snapshot.unpack_set(shown, COVERAGE_MSG),
+        won=won,
+    )
@@ -2,8 +2,12 @@
 # Curses rendering for the fungus level. Terminal, richer than l01/l02.
 # Phase 1 (germinate): dark substrate, player at origin, text.
 # Phase 2 (network): box-drawing network chars for mycelium; soil meter HUD.
+#   Mycelium carrying plenty of nutrient is drawn bold.
+#   With a raster (raster.wanted()), the network is drawn in braille dots instead:
+#   fine hyphae a dot wide, twice as thick where nutrient runs.
 
 import curses
+import raster
 import screen as scr
 from . import world as w
 
@@ -102,11 +106,60 @@ def _net_char(grid, y: int, x: int) -> str:
 _ARENA_TOP = 2
 
 
+# ── Hyphae ─────────────────────────────────────────────────────
+# Braille dots (column 0–1, row 0–3) of a network tile, by (N, S, E) neighbour
+# connectivity. A tile's west arm is its west neighbour's east one.
+def _hypha(n: bool, s: bool, e: bool, fed: bool) -> tuple:
+    dots = {(0, 1)}
+    if n:
+        dots.add((0, 0))
+    if s:
+        dots.update(((0, 2), (0, 3)))
+    if e:
+        dots.add((1, 1))
+    if fed:
+        dots.update([(1, y) for x, y in dots if x == 0 and y != 1]
+                    + [(x, 2) for x, y in dots if y == 1])
+    return tuple(sorted(dots))
+
+
+_HYPHAE  = {(n, s, e, fed): _hypha(n, s, e, fed)
+            for n in (False, True) for s in (False, True)
+            for e in (False, True) for fed in (False, True)}
+_ORGANIC = ((0, 1), (1, 1), (0, 2), (1, 2))
+
+_network_raster: raster.Raster | None = None
+
+
+def _draw_network_raster(stdscr, ls: w.LevelState, arena_left: int) -> None:
+    global _network_raster
+    if _network_raster is None:
+        _network_raster = raster.Raster(w.WORLD_W, w.WORLD_H, raster.BRAILLE)
+    r = _network_raster
+    r.clear()
+    for ry in range(w.WORLD_H):
+        for rx in range(w.WORLD_W):
+            tile = ls.grid[ry][rx]
+            if tile == w.ORGANIC:
+                dots, ink = _ORGANIC, raster.YELLOW
+            elif tile in (w.MYCELIUM, w.SOIL):
+                fed  = tile == w.MYCELIUM and w.nutrient_at(ls, ry, rx) >= w.NUTRIENT_HALF
+                dots = _HYPHAE[_is_net(ls.grid, ry - 1, rx), _is_net(ls.grid, ry + 1, rx),
+                               _is_net(ls.grid, ry, rx + 1), fed]
+                ink  = raster.WHITE if tile == w.MYCELIUM else raster.GREEN
+            else:
+                continue
+            for dx, dy in dots:
+                r.set(2 * rx + dx, 4 * ry + dy, ink)
+    r.draw(stdscr, _ARENA_TOP, arena_left)
+
+
 # ── Germinate view ─────────────────────────────────────────────
 def draw_germinate(stdscr, ls: w.LevelState, msg: str = "") -> None:
     stdscr.erase()
     h, sw = stdscr.getmaxyx()
     arena_left = max(0, (sw - w.WORLD_W) // 2)
+    low        = scr.low_bandwidth()   # no substrate dots
 
     for ry in range(w.WORLD_H):
         for rx in range(w.WORLD_W):
@@ -117,7 +170,7 @@ def draw_germinate(stdscr, ls: w.LevelState, msg: str = "") -> None:
             tile = ls.grid[ry][rx]
             if tile == w.ORGANIC:
                 _cch(stdscr, sr, sc, "o", CP_YELLOW, dim=True)
-            elif (ry * 17 + rx * 11) % 19 == 0:
+            elif not low and (ry * 17 + rx * 11) % 19 == 0:
                 scr.addch(stdscr, sr, sc, ".", dim=True)
 
     # Player (spore)
@@ -130,7 +183,7 @@ def draw_germinate(stdscr, ls: w.LevelState, msg: str = "") -> None:
         _draw_centered(stdscr, h // 2, msg, dim=True)
 
     scr.addstr(stdscr, h - 2, 2, "w / \u2191 to extend", dim=True)
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 # ── Network view ───────────────────────────────────────────────
@@ -138,6 +191,7 @@ def draw_network(stdscr, ls: w.LevelState, msg: str = "") -> None:
     stdscr.erase()
     h, sw = stdscr.getmaxyx()
     arena_left = max(0, (sw - w.WORLD_W) // 2)
+    low        = scr.low_bandwidth()   # no substrate dots
 
     # HUD — soil progress meter
     progress = min(1.0, w.get_soil_fraction(ls) / w.WIN_SOIL_FRAC)
@@ -147,7 +201,17 @@ def draw_network(stdscr, ls: w.LevelState, msg: str = "") -> None:
     hud_str  = f"soil [{bar}] {int(progress * 100)}%"
     _cstr(stdscr, 0, 2, hud_str, CP_GREEN)
 
+    # HUD row 1 — network size (right-aligned), and any networks cut off from it
+    stats   = w.network_stats(ls)
+    net_str = f"network: {stats['rooted']}"
+    if stats["networks"] > 1:
+        net_str += f"  apart: {stats['networks'] - 1}"
+    _cstr(stdscr, 1, max(0, sw - len(net_str) - 2), net_str, CP_WHITE)
+
     # Arena
+    fine = raster.wanted()
+    if fine:
+        _draw_network_raster(stdscr, ls, arena_left)
     for ry in range(w.WORLD_H):
         for rx in range(w.WORLD_W):
             sr = _ARENA_TOP + ry
@@ -160,22 +224,25 @@ def draw_network(stdscr, ls: w.LevelState, msg: str = "") -> None:
 
             if is_player:
                 scr.addch(stdscr, sr, sc, "@", bold=True)
+            elif fine and tile != w.ROCK:
+                continue   # drawn by the raster
             elif tile == w.SOIL:
                 ch = _net_char(ls.grid, ry, rx)
                 _cch(stdscr, sr, sc, ch, CP_GREEN, dim=True)
             elif tile == w.MYCELIUM:
-                ch = _net_char(ls.grid, ry, rx)
-                _cch(stdscr, sr, sc, ch, CP_WHITE)
+                ch  = _net_char(ls.grid, ry, rx)
+                fed = w.nutrient_at(ls, ry, rx) >= w.NUTRIENT_HALF
+                _cch(stdscr, sr, sc, ch, CP_WHITE, bold=fed)
             elif tile == w.ORGANIC:
                 _cch(stdscr, sr, sc, "o", CP_YELLOW, dim=True)
-            elif (ry * 17 + rx * 11) % 19 == 0:
+            elif not low and (ry * 17 + rx * 11) % 19 == 0:
                 scr.addch(stdscr, sr, sc, ".", dim=True)
 
     if msg:
         scr.addstr(stdscr, h - 2, 2, msg, dim=True)
 
     scr.addstr(stdscr, h - 1, 2, "wasd / arrows to move", dim=True)
-    stdscr.refresh()
+    scr.present(stdscr)
 
 
 # ── Win / dissolve ─────────────────────────────────────────────
@@ -183,11 +250,9 @@ def draw_win(stdscr, msg: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_GREEN)
-    stdscr.refresh()
 
 
 def draw_dissolve_line(stdscr, line: str) -> None:
     stdscr.erase()
     h, _ = stdscr.getmaxyx()
     _draw_centered(stdscr, h // 2, line, dim=True)
-    stdscr.refresh()
@@ -2,12 +2,22 @@
 # Pure engine logic. No curses imports.
 # Phase 1: germinate — spore senses substrate (4 steps).
 # Phase 2: network — mycelium spreads through substrate, converting it to soil.
+#           Organic matter feeds the network where it touches it; the nutrient
+#           travels through connected mycelium and soil (transport.py), and tips
+#           that are well fed advance and branch faster. Connected components
+#           of the network are followed as it grows (components.py).
 
 from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass, field
 
+import components
+import resample
+import snapshot
+import transport
+from substrate import SubstrateMap, quality
+
 # ── World dimensions ───────────────────────────────────────────
 WORLD_W = 48
 WORLD_H = 15
@@ -22,12 +32,23 @@ SOIL     = 3
 BASE_DENSITY  = 0.10
 CARRY_BONUS   = 0.18   # max additional density from strong cyano legacy
 
+# ── Carry map ──────────────────────────────────────────────────
+TILE_QUALITY = {ROCK: 0.0, ORGANIC: 0.4, MYCELIUM: 0.65, SOIL: 1.0}
+
 # ── Growth ─────────────────────────────────────────────────────
 AGE_TO_SOIL     = 50    # ticks before MYCELIUM → SOIL
 BRANCH_CHANCE   = 0.005 # per tick per MYCELIUM/SOIL tile: chance to sprout a tip
 TIP_MOVE_CHANCE = 0.20  # per tick per tip: chance to advance one cell
 MAX_TIPS        = 30    # cap on autonomous tips
 
+# ── Nutrient ───────────────────────────────────────────────────
+ORGANIC_YIELD = 0.1    # intake per tick for each ORGANIC tile a network tile touches
+NUTRIENT_LEAK = 0.02   # fraction a tile uses up per tick — sets how far nutrient reaches
+NUTRIENT_HALF = 0.2    # nutrient at which a tile grows at the midpoint of its range
+VIGOR_STARVED = 0.3    # growth multiplier with no nutrient
+VIGOR_FED     = 2.0    # growth multiplier when saturated
+RELAX_BUDGET  = 2000   # transport relaxations per tick at most
+
 # ── Win ────────────────────────────────────────────────────────
 WIN_SOIL_FRAC = 0.30   # fraction of tiles that must be soil
 
@@ -47,6 +68,10 @@ class LevelState:
 
     tips: list = field(default_factory=list)   # [[y, x], ...]
 
+    # Nutrient over the MYCELIUM/SOIL network, node = y * WORLD_W + x
+    nutrient: transport.Transport = field(default_factory=lambda: transport.Transport(NUTRIENT_LEAK))
+    network:  components.Components = field(default_factory=components.Components)
+
     germ_step: int = GERM_STEPS
 
     soil_count:     int  = 0
@@ -58,29 +83,33 @@ class LevelState:
     origin_x: float = 0.5
     origin_y: float = 0.5
 
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
 
 # ── Generation ─────────────────────────────────────────────────
-def generate_state(carry) -> LevelState:
+def generate_state(carry, seed: int | None = None) -> LevelState:
     origin_x = getattr(carry, "origin_x", 0.5)
     origin_y = getattr(carry, "origin_y", 0.5)
 
     cyano    = carry.substrate.get("cyano", {})
     coverage = cyano.get("coverage", 0.0)
     density  = BASE_DENSITY + coverage * CARRY_BONUS
+    mat      = _read_mat(carry.maps.get("cyano"))
 
     grid = [[ROCK] * WORLD_W for _ in range(WORLD_H)]
     age  = [[0]    * WORLD_W for _ in range(WORLD_H)]
 
-    _place_organics(grid, origin_x, origin_y, density)
+    rng = random.Random(seed)
+    _place_organics(grid, rng, origin_x, origin_y, density, mat)
 
     px = int(origin_x * (WORLD_W - 1))
     py = int(origin_y * (WORLD_H - 1))
     px = max(1, min(WORLD_W - 2, px))
     py = max(1, min(WORLD_H - 2, py))
 
-    grid[py][px] = MYCELIUM
-
-    return LevelState(
+    ls = LevelState(
         grid=grid,
         age=age,
         py=py,
@@ -89,18 +118,35 @@ def generate_state(carry) -> LevelState:
         germ_step=GERM_STEPS,
         origin_x=origin_x,
         origin_y=origin_y,
+        rng=rng,
     )
+    _grow(ls, py, px, MYCELIUM)
+    return ls
+
+
+def _read_mat(colony: SubstrateMap | None) -> list | None:
+    """The cyano mat as WORLD_H rows of 0.0–1.0 on the fungus grid."""
+    if colony is None:
+        return None
+    return resample.field(colony, WORLD_W, WORLD_H)
 
 
-def _place_organics(grid, origin_x: float, origin_y: float, density: float) -> None:
+def _place_organics(grid, rng: random.Random, origin_x: float, origin_y: float,
+                    density: float, mat: list | None = None) -> None:
+    """Scatter ORGANIC tiles around the origin. Where the old mat lay dead,
+    organics follow it tile by tile instead of the single coverage figure."""
     ox    = int(origin_x * (WORLD_W - 1))
     oy    = int(origin_y * (WORLD_H - 1))
     sigma = WORLD_W * 0.30
     for y in range(WORLD_H):
         for x in range(WORLD_W):
             dist = math.sqrt((x - ox) ** 2 + (y - oy) ** 2)
-            p    = density * math.exp(-0.5 * (dist / sigma) ** 2)
-            if random.random() < p:
+            fall = math.exp(-0.5 * (dist / sigma) ** 2)
+            if mat is None:
+                p = density * fall
+            else:
+                p = BASE_DENSITY * fall + CARRY_BONUS * mat[y][x]
+            if rng.random() < p:
                 grid[y][x] = ORGANIC
 
 
@@ -116,6 +162,56 @@ def germinate_step(ls: LevelState) -> str:
     return txt.GERM_TEXT[idx % len(txt.GERM_TEXT)]
 
 
+# ── Nutrient network ───────────────────────────────────────────
+def _grow(ls: LevelState, y: int, x: int, tile: int) -> None:
+    """Turn (y, x) into a network tile and join it to the nutrient network."""
+    was = ls.grid[y][x]
+    ls.grid[y][x] = tile
+    cells = _cells_around(y, x)
+    _join(ls, y, x, cells)
+    if was == ORGANIC:
+        # Its network neighbours have lost a food source.
+        for ny, nx in cells:
+            ls.nutrient.set_source(ny * WORLD_W + nx, _intake(ls.grid, ny, nx))
+
+
+def _join(ls: LevelState, y: int, x: int, cells: list) -> None:
+    n    = y * WORLD_W + x
+    nbrs = [ny * WORLD_W + nx for ny, nx in cells]
+    ls.nutrient.add(n, nbrs, _intake(ls.grid, y, x))
+    ls.network.add(n)
+    for m in nbrs:
+        if m in ls.network:
+            ls.network.union(n, m)
+
+
+def _intake(grid, y: int, x: int) -> float:
+    return ORGANIC_YIELD * sum(1 for ny, nx in _cells_around(y, x) if grid[ny][nx] == ORGANIC)
+
+
+def _cells_around(y: int, x: int) -> list:
+    return [(y + dy, x + dx) for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= y + dy < WORLD_H and 0 <= x + dx < WORLD_W]
+
+
+def _vigor(ls: LevelState, y: int, x: int) -> float:
+    """Growth multiplier from the nutrient reaching (y, x)."""
+    n = ls.nutrient.value(y * WORLD_W + x)
+    return VIGOR_STARVED + (VIGOR_FED - VIGOR_STARVED) * n / (n + NUTRIENT_HALF)
+
+
+def nutrient_at(ls: LevelState, y: int, x: int) -> float:
+    return ls.nutrient.value(y * WORLD_W + x)
+
+
+def _rebuild_network(ls: LevelState) -> None:
+    """Join every network tile, in grid order — for a LevelState read from a snapshot."""
+    for y in range(WORLD_H):
+        for x in range(WORLD_W):
+            if ls.grid[y][x] in (MYCELIUM, SOIL):
+                _join(ls, y, x, _cells_around(y, x))
+
+
 # ── Network phase ──────────────────────────────────────────────
 def network_tick(ls: LevelState) -> None:
     ls.tick += 1
@@ -131,11 +227,11 @@ def network_tick(ls: LevelState) -> None:
     # Advance existing tips
     surviving = []
     for ty, tx in ls.tips:
-        if random.random() < TIP_MOVE_CHANCE:
+        if ls.rng.random() < TIP_MOVE_CHANCE * _vigor(ls, ty, tx):
             nbrs = _open_neighbors(ls.grid, ty, tx)
             if nbrs:
-                ny, nx = random.choice(nbrs)
-                ls.grid[ny][nx] = MYCELIUM
+                ny, nx = ls.rng.choice(nbrs)
+                _grow(ls, ny, nx, MYCELIUM)
                 surviving.append([ny, nx])
             # stuck tips retire (fall off the list)
         else:
@@ -145,16 +241,17 @@ def network_tick(ls: LevelState) -> None:
     new_tips = []
     for y in range(WORLD_H):
         for x in range(WORLD_W):
-            if ls.grid[y][x] in (MYCELIUM, SOIL) and random.random() < BRANCH_CHANCE:
+            if (ls.grid[y][x] in (MYCELIUM, SOIL)
+                    and ls.rng.random() < BRANCH_CHANCE * _vigor(ls, y, x)):
                 nbrs = _open_neighbors(ls.grid, y, x)
                 if nbrs:
-                    ny, nx = random.choice(nbrs)
-                    ls.grid[ny][nx] = MYCELIUM
+                    ny, nx = ls.rng.choice(nbrs)
+                    _grow(ls, ny, nx, MYCELIUM)
                     new_tips.append([ny, nx])
 
     ls.tips = surviving + new_tips
     if len(ls.tips) > MAX_TIPS:
-        ls.tips = random.sample(ls.tips, MAX_TIPS)
+        ls.tips = ls.rng.sample(ls.tips, MAX_TIPS)
 
     # Soil count
     ls.soil_count = sum(1 for row in ls.grid for cell in row if cell == SOIL)
@@ -162,6 +259,8 @@ def network_tick(ls: LevelState) -> None:
     if ls.soil_count >= WIN_SOIL_FRAC * WORLD_W * WORLD_H:
         ls.won = True
 
+    ls.nutrient.relax(RELAX_BUDGET)
+
 
 def player_move(ls: LevelState, dy: int, dx: int) -> None:
     ny = max(0, min(WORLD_H - 1, ls.py + dy))
@@ -169,9 +268,9 @@ def player_move(ls: LevelState, dy: int, dx: int) -> None:
     ls.py, ls.px = ny, nx
     tile = ls.grid[ny][nx]
     if tile == ROCK:
-        ls.grid[ny][nx] = MYCELIUM
+        _grow(ls, ny, nx, MYCELIUM)
     elif tile == ORGANIC:
-        ls.grid[ny][nx] = SOIL   # player processing is immediate
+        _grow(ls, ny, nx, SOIL)   # player processing is immediate
 
 
 def _open_neighbors(grid, y: int, x: int) -> list:
@@ -188,10 +287,78 @@ def get_soil_fraction(ls: LevelState) -> float:
     return ls.soil_count / (WORLD_W * WORLD_H)
 
 
+def network_stats(ls: LevelState) -> dict:
+    """Separate networks, the largest one's size, and the size of the one the
+    spore started — all in tiles, straight from the disjoint set."""
+    return {
+        "networks": ls.network.count,
+        "largest":  ls.network.largest,
+        "rooted":   ls.network.size_of(_origin_node(ls)),
+    }
+
+
+def _origin_node(ls: LevelState) -> int:
+    px = max(1, min(WORLD_W - 2, int(ls.origin_x * (WORLD_W - 1))))
+    py = max(1, min(WORLD_H - 2, int(ls.origin_y * (WORLD_H - 1))))
+    return py * WORLD_W + px
+
+
 # ── Carry serialization ────────────────────────────────────────
 def serialize_for_carry(ls: LevelState) -> dict:
     return {
         "soil_fraction": round(get_soil_fraction(ls), 3),
+        "networks":      ls.network.count,
+        "network_frac":  round(ls.network.largest / (WORLD_W * WORLD_H), 3),
         "origin_x":      round(ls.px / (WORLD_W - 1), 3),
         "origin_y":      round(ls.py / (WORLD_H - 1), 3),
+        "map":           _soil_map(ls),
     }
+
+
+def _soil_map(ls: LevelState) -> SubstrateMap:
+    """Tile quality by what the network made of it — soil richest, bare rock nothing."""
+    return SubstrateMap.from_rows(
+        [quality(TILE_QUALITY[tile]) for tile in row] for row in ls.grid
+    )
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 2
+PHASES   = ("germinate", "network")
+SOIL_MSG = (25, 50, 75)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBBBB", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.py, ls.px, ls.germ_step)
+    p.put("HI?B", ls.soil_count, ls.tick, ls.won,
+          snapshot.pack_set(ls.soil_msgs_shown, SOIL_MSG))
+    p.put("dd", ls.origin_x, ls.origin_y)
+    p.blob(snapshot.pack_grid(ls.grid))
+    p.blob(snapshot.pack_grid([[min(255, a) for a in row] for row in ls.age]))
+    p.blob(bytes(y for y, _ in ls.tips))
+    p.blob(bytes(x for _, x in ls.tips))
+    p.blob(transport.pack_values(ls.nutrient))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, py, px, germ_step = u.get("BBBBB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    soil_count, tick, won, shown = u.get("HI?B")
+    origin_x, origin_y           = u.get("dd")
+    grid = snapshot.unpack_grid(u.blob(), WORLD_W, WORLD_H)
+    age  = snapshot.unpack_grid(u.blob(), WORLD_W, WORLD_H)
+    ys, xs = u.blob(), u.blob()
+    ls = LevelState(
+        phase=PHASES[phase], grid=grid, age=age, py=py, px=px,
+        tips=[[y, x] for y, x in zip(ys, xs)],
+        germ_step=germ_step, soil_count=soil_count, tick=tick, won=won,
+        soil_msgs_shown=snapshot.unpack_set(shown, SOIL_MSG),
+        origin_x=origin_x, origin_y=origin_y,
+    )
+    _rebuild_network(ls)
+    transport.unpack_values(ls.nutrient, u.blob())
+    return ls
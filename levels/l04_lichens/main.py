@@ -0,0 +1,89 @@
+# levels/l04_lichens/main.py
+# Level 4 — Lichens.
+# Two phases: meet (the partners find each other, 3 steps) then crust (the
+# lichen spreads over bare rock and weathers it). Two things in one body that
+# must stay in balance; the seasons keep pushing them apart.
+#
+# The loop, journal and dissolve are runtime.py's; this file declares the level.
+
+import runtime
+from state import CarryState
+from . import world, view
+from . import text as txt
+
+CARRY_KEY = "lichens"   # names this level in carry, maps and snapshots
+
+TICK_INTERVAL      = 0.2     # seconds between crust ticks
+MEET_STEP_INTERVAL = 1.5     # minimum seconds between meet steps
+
+
+def run(carry: CarryState) -> CarryState:
+    return runtime.run(LEVEL, carry)
+
+
+def _tick(ls: world.LevelState) -> str:
+    """One crust tick. Returns a message to show, or ''."""
+    world.crust_tick(ls)
+    if ls.won:
+        return ""
+
+    # The partnership straining, once each time it drifts out of balance
+    strain = world.strain(ls)
+    if strain and not ls.strained:
+        ls.strained = True
+        return ls.rng.choice(txt.STRAIN_ALGAE if strain > 0 else txt.STRAIN_FUNGUS)
+    if not strain and ls.strained:
+        ls.strained = False
+        return ls.rng.choice(txt.EVEN)
+
+    # Weathering progress threshold messages
+    progress_pct = int(world.get_weathered_fraction(ls) / world.WIN_WEATHERED * 100)
+    for threshold, pool in [
+        (25, txt.WEATHER_25),
+        (50, txt.WEATHER_50),
+        (75, txt.WEATHER_75),
+    ]:
+        if progress_pct >= threshold and threshold not in ls.weather_msgs_shown:
+            ls.weather_msgs_shown.add(threshold)
+            return ls.rng.choice(pool)
+    return ""
+
+
+# ── Keys ──────────────────────────────────────────────────────
+# Shared by the play loop and journal replay — keep them free of timing.
+def _move(dy: int, dx: int):
+    return lambda ls: world.player_move(ls, dy, dx)
+
+
+def _lean(step: int):
+    return lambda ls: world.shift_lean(ls, step)
+
+
+def _met(ls: world.LevelState) -> str | None:
+    return "crust" if ls.meet_step == 0 else None
+
+
+LEVEL = runtime.Level(
+    key           = CARRY_KEY,
+    world         = world,
+    view          = view,
+    text          = txt,
+    generate      = world.generate_state,
+    tick          = _tick,
+    tick_interval = TICK_INTERVAL,
+    epitaph       = "lichens — two things that stayed together long enough",
+    phases        = [
+        # Meeting is slow — steps closer together than MEET_STEP_INTERVAL are dropped.
+        runtime.Phase("meet", view.draw_meet, after=_met,
+                      keys=runtime.keys(("w", "UP"), world.meet_step),
+                      step_keys=("w", "UP"), step_interval=MEET_STEP_INTERVAL),
+        runtime.Phase("crust", view.draw_crust, ticks=True, keys={
+            **runtime.keys(("w", "UP"),    _move(-1, 0)),
+            **runtime.keys(("s", "DOWN"),  _move(1, 0)),
+            **runtime.keys(("a", "LEFT"),  _move(0, -1)),
+            **runtime.keys(("d", "RIGHT"), _move(0, 1)),
+            "q": _lean(-1),
+            "e": _lean(1),
+        }),
+    ],
+)
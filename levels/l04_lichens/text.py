@@ -0,0 +1,55 @@
+# levels/l04_lichens/text.py
+# All flavor text for the lichen level.
+# Lowercase. No exclamation points. The organism is never named.
+
+# ── Meet phase ─────────────────────────────────────────────────
+MEET_TEXT = [
+    "bare rock. wind. nothing holds here.",
+    "something drifts in. green, single, drying.",
+]
+
+MEET_ARRIVE = "a thread closes around it. two, now. neither alone."
+
+# ── Crust phase ────────────────────────────────────────────────
+# The partnership strains — one side has run ahead of the other.
+STRAIN_ALGAE = [
+    "too much green. the threads cannot keep it wet.",
+    "the light feeds more than the grip can hold.",
+]
+
+STRAIN_FUNGUS = [
+    "the threads reach further than the sugar goes.",
+    "hunger in the pale parts. too little green.",
+]
+
+EVEN = [
+    "even again. each holding the other.",
+]
+
+# Weathering threshold messages
+WEATHER_25 = [
+    "the rock is softer where the crust has been.",
+    "grains come loose under the threads.",
+]
+
+WEATHER_50 = [
+    "the surface is no longer the surface it was.",
+    "the stone gives, very slowly, to something patient.",
+]
+
+WEATHER_75 = [
+    "there is almost a place here for roots.",
+    "the rock is becoming ground.",
+]
+
+# ── Win / dissolve ─────────────────────────────────────────────
+WIN_MESSAGE = "the crust holds. the rock has begun to give."
+
+DISSOLVE_LINES = [
+    "the crust stays where it was.",
+    "the rock under it is not rock anymore.",
+    "neither of them could have done it alone.",
+    "something with roots will find this.",
+]
+
+DISSOLVED = "the lichen. two things that stayed together long enough."
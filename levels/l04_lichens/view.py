@@ -0,0 +1,177 @@
+# levels/l04_lichens/view.py
+# Curses rendering for the lichen level. The transition point: the world is
+# bigger than the screen now, and the view follows the player across it.
+# Phase 1 (meet): bare rock, the drifted-in algae, the player at the origin.
+# Phase 2 (crust): lichen density as glyph weight, the partner that leads as
+#   colour — green where the algae run ahead, yellow where the fungus does,
+#   cyan where they are even. Weathered rock shows as ',' once the crust is gone.
+#   HUD: weathering meter, the balance between the two, the season and the lean.
+
+import curses
+import screen as scr
+from . import world as w
+
+# ── Color pairs ────────────────────────────────────────────────
+CP_WHITE  = 1   # player, HUD
+CP_GREEN  = 2   # algae ahead
+CP_YELLOW = 3   # fungus ahead
+CP_CYAN   = 4   # even
+
+
+def init_colors() -> None:
+    curses.start_color()
+    curses.use_default_colors()
+    curses.init_pair(CP_WHITE,  curses.COLOR_WHITE,  -1)
+    curses.init_pair(CP_GREEN,  curses.COLOR_GREEN,  -1)
+    curses.init_pair(CP_YELLOW, curses.COLOR_YELLOW, -1)
+    curses.init_pair(CP_CYAN,   curses.COLOR_CYAN,   -1)
+
+
+# ── Color helpers ──────────────────────────────────────────────
+def _cattr(pair: int, bold: bool = False, dim: bool = False) -> int:
+    attr = curses.color_pair(pair)
+    if bold:
+        attr |= curses.A_BOLD
+    if dim:
+        attr |= curses.A_DIM
+    return attr
+
+
+def _cch(win, y: int, x: int, ch: str,
+         pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, ch, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _cstr(win, y: int, x: int, text: str,
+          pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, text, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _draw_centered(stdscr, row: int, text: str,
+                   bold: bool = False, dim: bool = False,
+                   pair: int = 0) -> None:
+    _, sw = stdscr.getmaxyx()
+    cx = max(0, (sw - len(text)) // 2)
+    if pair:
+        _cstr(stdscr, row, cx, text, pair, bold=bold, dim=dim)
+    else:
+        scr.addstr(stdscr, row, cx, text, bold=bold, dim=dim)
+
+
+# ── Crust glyphs ───────────────────────────────────────────────
+_DENSITY = ((0.05, None), (0.2, "\u00b7"), (0.45, "\u2218"), (0.7, "o"))   # · ∘ o, then O
+_LEADS   = 0.12   # algae share this far from even shows who leads
+
+
+def _glyph(cover: float) -> str | None:
+    for top, ch in _DENSITY:
+        if cover < top:
+            return ch
+    return "O"
+
+
+def _pair(a: float, f: float) -> int:
+    share = a / (a + f)
+    if share > 0.5 + _LEADS:
+        return CP_GREEN
+    if share < 0.5 - _LEADS:
+        return CP_YELLOW
+    return CP_CYAN
+
+
+# ── Arena / camera ─────────────────────────────────────────────
+_ARENA_TOP = 2
+
+
+def _draw_world(stdscr, ls: w.LevelState, crust: bool) -> None:
+    h, sw = stdscr.getmaxyx()
+    vh    = max(0, h - 2 - _ARENA_TOP)
+    x0, y0, ox, oy = scr.camera(ls.px, ls.py, sw, vh, w.WORLD_W, w.WORLD_H)
+    low   = scr.low_bandwidth()   # no bare-rock dots
+    g     = ls.mix.grids
+    algae, fungus, rock = g["algae"], g["fungus"], g["rock"]
+
+    for ry in range(y0, min(w.WORLD_H, y0 + vh)):
+        sr = _ARENA_TOP + oy + ry - y0
+        ra, rf, rr = algae[ry], fungus[ry], rock[ry]
+        for rx in range(x0, min(w.WORLD_W, x0 + sw)):
+            sc = ox + rx - x0
+            a, f = ra[rx], rf[rx]
+            ch   = _glyph(a + f) if crust else None
+            if ch is not None:
+                _cch(stdscr, sr, sc, ch, _pair(a, f), bold=a + f >= 0.7)
+            elif not crust and a > 0.05:
+                _cch(stdscr, sr, sc, "\u00b7", CP_GREEN, dim=True)
+            elif rr[rx] <= 1.0 - w.WEATHERED_AT:
+                scr.addch(stdscr, sr, sc, ",", dim=True)
+            elif not low and (ry * 17 + rx * 11) % 19 == 0:
+                scr.addch(stdscr, sr, sc, ".", dim=True)
+
+    sr, sc = _ARENA_TOP + oy + ls.py - y0, ox + ls.px - x0
+    if 0 <= sr < h - 2 and 0 <= sc < sw:
+        scr.addch(stdscr, sr, sc, "@", bold=True)
+
+
+# ── Meet view ──────────────────────────────────────────────────
+def draw_meet(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_world(stdscr, ls, crust=False)
+    if msg:
+        _draw_centered(stdscr, h // 2, msg, dim=True)
+    scr.addstr(stdscr, h - 2, 2, "w / \u2191 to reach", dim=True)
+    scr.present(stdscr)
+
+
+# ── Crust view ─────────────────────────────────────────────────
+def draw_crust(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, sw = stdscr.getmaxyx()
+
+    # HUD — weathering progress meter
+    progress = min(1.0, w.get_weathered_fraction(ls) / w.WIN_WEATHERED)
+    bar_w    = 20
+    filled   = int(progress * bar_w)
+    bar      = "\u2588" * filled + "\u2591" * (bar_w - filled)
+    _cstr(stdscr, 0, 2, f"weathered [{bar}] {int(progress * 100)}%", CP_CYAN)
+
+    # HUD — balance between the partners, fungus left, algae right
+    span    = 15
+    mark    = round(ls.balance * (span - 1))
+    meter   = "".join("\u2502" if i == mark else "\u2500" for i in range(span))
+    strain  = w.strain(ls)
+    pair    = CP_GREEN if strain > 0 else CP_YELLOW if strain < 0 else CP_CYAN
+    bal_str = f"fungus {meter} algae"
+    _cstr(stdscr, 0, max(0, sw - len(bal_str) - 2), bal_str, pair, bold=bool(strain))
+
+    # HUD row 1 — season and the player's lean (right-aligned)
+    season  = "wet" if w.season(ls) >= 0 else "dry"
+    lean    = "\u25c2" * -ls.lean if ls.lean < 0 else "\u25b8" * ls.lean or "\u00b7"   # ◂ ▸ ·
+    row_str = f"{season}  lean {lean:<{w.LEAN_MAX}}"
+    _cstr(stdscr, 1, max(0, sw - len(row_str) - 2), row_str, CP_WHITE, dim=True)
+
+    _draw_world(stdscr, ls, crust=True)
+
+    if msg:
+        scr.addstr(stdscr, h - 2, 2, msg, dim=True)
+    scr.addstr(stdscr, h - 1, 2, "wasd / arrows to move  q e to lean", dim=True)
+    scr.present(stdscr)
+
+
+# ── Win / dissolve ─────────────────────────────────────────────
+def draw_win(stdscr, msg: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_CYAN)
+
+
+def draw_dissolve_line(stdscr, line: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, line, dim=True)
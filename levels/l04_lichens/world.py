@@ -0,0 +1,292 @@
+# levels/l04_lichens/world.py
+# Pure engine logic. No curses imports.
+# Phase 1: meet — a thread of fungus finds a drifting alga (3 steps).
+# Phase 2: crust — the lichen spreads over bare rock as two partners on one grid
+#           (reaction.py). The alga makes sugar where the fungus keeps it wet;
+#           the fungus lives on the sugar and weathers the rock it grips. Either
+#           one alone dies back. Wet and dry seasons favour one partner over the
+#           other; the player leans the partnership back toward balance and
+#           scatters propagules where it has not reached.
+
+from __future__ import annotations
+import math
+import random
+from dataclasses import dataclass, field
+
+import reaction
+import resample
+import snapshot
+from substrate import SubstrateMap, quality
+
+# ── World dimensions ───────────────────────────────────────────
+# Bigger than the screen — the view follows the player.
+WORLD_W = 120
+WORLD_H = 40
+
+# ── Species ────────────────────────────────────────────────────
+# name → diffusion (cells² per unit time). "rock" is the unweathered fraction
+# of each tile, 1.0 = bare; it doesn't move.
+SPECIES = {"algae": 0.02, "fungus": 0.08, "rock": 0.0}
+DT      = 0.5          # time per tick — large; the stepping is implicit
+
+# ── Partnership ────────────────────────────────────────────────
+PARTNER_HALF   = 0.1    # partner density at which help is half what it can be
+ALGAE_GROWTH   = 0.8
+FUNGUS_GROWTH  = 0.6
+ALGAE_DEATH    = 0.04
+FUNGUS_DEATH   = 0.04
+APART_DEATH    = 0.25   # extra death rate for a partner left on its own
+GRIP_BARE      = 0.7    # fungus growth on bare rock …
+GRIP_WEATHERED = 1.3    # … and on fully weathered rock
+WEATHER_RATE   = 0.01   # rock weathered per unit fungus per unit time
+
+# ── Seasons and lean ───────────────────────────────────────────
+SEASON       = 200.0   # time per wet-and-dry cycle
+SEASON_SWING = 0.5     # wet: algae grow up to 50% faster, fungus 50% slower
+LEAN_MAX     = 4       # lean steps either way
+LEAN_SHIFT   = 0.5     # full lean moves growth 50% from one partner to the other
+
+# ── Seeding ────────────────────────────────────────────────────
+CARRY_FUNGUS    = 0.25   # fungus where the last network made full soil
+CARRY_WEATHERED = 0.2    # rock already weathered there
+ALGAE_SPECKLE   = 0.02   # chance a tile starts with a drifted-in alga
+ALGAE_SEED      = 0.3
+START_RADIUS    = 2
+START_DENSITY   = 0.3
+PROPAGULE       = 0.15   # of each partner, left wherever the player moves
+
+# ── Win ────────────────────────────────────────────────────────
+WEATHERED_AT  = 0.5    # a tile counts as weathered once half its rock is gone
+COVER_AT      = 0.2    # … and as covered by the lichen above this density
+WIN_WEATHERED = 0.5    # fraction of tiles that must be weathered
+STRAIN        = 0.2    # balance further than this from even strains the partnership
+
+# ── Meeting ────────────────────────────────────────────────────
+MEET_STEPS = 3
+
+
+def _mixture() -> reaction.Mixture:
+    return reaction.Mixture(WORLD_W, WORLD_H, SPECIES)
+
+
+@dataclass
+class LevelState:
+    phase: str = "meet"
+
+    mix: reaction.Mixture = field(default_factory=_mixture)
+
+    py: int = 0
+    px: int = 0
+
+    lean:      int = 0          # −LEAN_MAX (toward fungus) … LEAN_MAX (toward algae)
+    meet_step: int = MEET_STEPS
+
+    tick:     int   = 0
+    balance:  float = 0.5       # algae share of the lichen, 0 = all fungus
+    weathered_count: int = 0
+    strained: bool  = False
+    won:      bool  = False
+
+    weather_msgs_shown: set = field(default_factory=set)
+
+    origin_x: float = 0.5
+    origin_y: float = 0.5
+
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+
+# ── Generation ─────────────────────────────────────────────────
+def generate_state(carry, seed: int | None = None) -> LevelState:
+    origin_x = getattr(carry, "origin_x", 0.5)
+    origin_y = getattr(carry, "origin_y", 0.5)
+    soil     = _read_soil(carry.maps.get("fungus"))
+
+    rng = random.Random(seed)
+    mix = _mixture()
+    algae, fungus, rock = mix.grids["algae"], mix.grids["fungus"], mix.grids["rock"]
+    for y in range(WORLD_H):
+        for x in range(WORLD_W):
+            q = soil[y][x] if soil else 0.0
+            fungus[y][x] = CARRY_FUNGUS * q
+            rock[y][x]   = 1.0 - CARRY_WEATHERED * q
+            if rng.random() < ALGAE_SPECKLE:
+                algae[y][x] = ALGAE_SEED
+
+    px = max(1, min(WORLD_W - 2, int(origin_x * (WORLD_W - 1))))
+    py = max(1, min(WORLD_H - 2, int(origin_y * (WORLD_H - 1))))
+    for y in range(py - START_RADIUS, py + START_RADIUS + 1):
+        for x in range(px - START_RADIUS, px + START_RADIUS + 1):
+            if 0 <= y < WORLD_H and 0 <= x < WORLD_W:
+                algae[y][x]  = max(algae[y][x],  START_DENSITY)
+                fungus[y][x] = max(fungus[y][x], START_DENSITY)
+
+    ls = LevelState(mix=mix, py=py, px=px, origin_x=origin_x, origin_y=origin_y, rng=rng)
+    _measure(ls)
+    return ls
+
+
+def _read_soil(soil: SubstrateMap | None) -> list | None:
+    """The fungus level's soil as WORLD_H rows of 0.0–1.0 on the lichen grid."""
+    if soil is None:
+        return None
+    return resample.field(soil, WORLD_W, WORLD_H)
+
+
+# ── Meet phase ─────────────────────────────────────────────────
+def meet_step(ls: LevelState) -> str:
+    from . import text as txt
+    if ls.meet_step <= 0:
+        return ""
+    ls.meet_step -= 1
+    if ls.meet_step == 0:
+        return txt.MEET_ARRIVE
+    return txt.MEET_TEXT[(MEET_STEPS - ls.meet_step - 1) % len(txt.MEET_TEXT)]
+
+
+# ── Crust phase ────────────────────────────────────────────────
+def crust_tick(ls: LevelState) -> None:
+    ls.tick += 1
+    ls.mix.step(DT, _kinetics(ls))
+    _measure(ls)
+    if ls.weathered_count >= WIN_WEATHERED * WORLD_W * WORLD_H:
+        ls.won = True
+
+
+def _kinetics(ls: LevelState):
+    """Rates for one step, row by row. Each partner grows on what the other
+    gives it, into the space the two leave free, and dies faster alone."""
+    wet  = SEASON_SWING * season(ls)
+    lean = LEAN_SHIFT * ls.lean / LEAN_MAX
+    ga   = ALGAE_GROWTH  * (1.0 + wet) * (1.0 + lean)
+    gf   = FUNGUS_GROWTH * (1.0 - wet) * (1.0 - lean)
+    k    = PARTNER_HALF
+    grip = GRIP_WEATHERED - GRIP_BARE
+    none = [0.0] * WORLD_W
+
+    # v / (v + k) is how much a partner at density v helps the other; k / (v + k)
+    # is how far short of full help that falls. 1 − u − v is the free space.
+    def rates(y: int, rows: dict) -> dict:
+        a, f, q = rows["algae"], rows["fungus"], rows["rock"]
+        return {
+            "algae":  ([ga * u * v / (v + k) * (1.0 - u - v if u + v < 1.0 else 0.0)
+                        for u, v in zip(a, f)],
+                       [ALGAE_DEATH + APART_DEATH * k / (v + k) for v in f]),
+            "fungus": ([gf * v * u / (u + k) * (1.0 - u - v if u + v < 1.0 else 0.0)
+                        * (GRIP_WEATHERED - grip * r)
+                        for u, v, r in zip(a, f, q)],
+                       [FUNGUS_DEATH + APART_DEATH * k / (u + k) for u in a]),
+            "rock":   (none, [WEATHER_RATE * v for v in f]),
+        }
+    return rates
+
+
+def season(ls: LevelState) -> float:
+    """+1 at the height of the wet season, −1 at the height of the dry."""
+    return math.sin(2 * math.pi * ls.mix.t / SEASON)
+
+
+def _measure(ls: LevelState) -> None:
+    g  = ls.mix.grids
+    ta = ls.mix.total("algae")
+    tf = ls.mix.total("fungus")
+    ls.balance = ta / (ta + tf) if ta + tf > 0.0 else 0.5
+    ls.weathered_count = sum(1 for row in g["rock"] for r in row if r <= 1.0 - WEATHERED_AT)
+
+
+def player_move(ls: LevelState, dy: int, dx: int) -> None:
+    ls.py = max(0, min(WORLD_H - 1, ls.py + dy))
+    ls.px = max(0, min(WORLD_W - 1, ls.px + dx))
+    ls.mix.add("algae",  ls.px, ls.py, PROPAGULE)
+    ls.mix.add("fungus", ls.px, ls.py, PROPAGULE)
+
+
+def shift_lean(ls: LevelState, step: int) -> None:
+    """Shift the partnership one step toward the algae (+1) or the fungus (−1)."""
+    ls.lean = max(-LEAN_MAX, min(LEAN_MAX, ls.lean + step))
+
+
+def strain(ls: LevelState) -> int:
+    """+1 when the algae have run ahead of the fungus past STRAIN, −1 the other
+    way, 0 while the two are near enough even."""
+    if ls.balance > 0.5 + STRAIN:
+        return 1
+    if ls.balance < 0.5 - STRAIN:
+        return -1
+    return 0
+
+
+def cell(ls: LevelState, y: int, x: int) -> tuple[float, float, float]:
+    """(algae, fungus, weathered) at (y, x)."""
+    g = ls.mix.grids
+    return g["algae"][y][x], g["fungus"][y][x], 1.0 - g["rock"][y][x]
+
+
+def get_weathered_fraction(ls: LevelState) -> float:
+    return ls.weathered_count / (WORLD_W * WORLD_H)
+
+
+def get_cover_fraction(ls: LevelState) -> float:
+    g = ls.mix.grids
+    covered = sum(1 for ra, rf in zip(g["algae"], g["fungus"])
+                  for a, f in zip(ra, rf) if a + f > COVER_AT)
+    return covered / (WORLD_W * WORLD_H)
+
+
+# ── Carry serialization ────────────────────────────────────────
+def serialize_for_carry(ls: LevelState) -> dict:
+    return {
+        "weathered": round(get_weathered_fraction(ls), 3),
+        "cover":     round(get_cover_fraction(ls), 3),
+        "balance":   round(ls.balance, 3),
+        "origin_x":  round(ls.px / (WORLD_W - 1), 3),
+        "origin_y":  round(ls.py / (WORLD_H - 1), 3),
+        "map":       _crust_map(ls),
+    }
+
+
+def _crust_map(ls: LevelState) -> SubstrateMap:
+    """Tile quality from how far the rock has weathered, with a little more
+    where the lichen still lies on it."""
+    g = ls.mix.grids
+    return SubstrateMap.from_rows(
+        [quality(min(1.0, 0.8 * (1.0 - r) + 0.2 * min(1.0, a + f)))
+         for a, f, r in zip(ra, rf, rr)]
+        for ra, rf, rr in zip(g["algae"], g["fungus"], g["rock"])
+    )
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 1
+PHASES      = ("meet", "crust")
+WEATHER_MSG = (25, 50, 75)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBHHBb", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.py, ls.px,
+          ls.meet_step, ls.lean)
+    p.put("I??B", ls.tick, ls.strained, ls.won,
+          snapshot.pack_set(ls.weather_msgs_shown, WEATHER_MSG))
+    p.put("dd", ls.origin_x, ls.origin_y)
+    p.blob(reaction.pack(ls.mix))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, py, px, meet_step, lean = u.get("BBHHBb")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    tick, strained, won, shown = u.get("I??B")
+    origin_x, origin_y         = u.get("dd")
+    mix = reaction.unpack(u.blob(), WORLD_W, WORLD_H, SPECIES)
+    ls = LevelState(
+        phase=PHASES[phase], mix=mix, py=py, px=px, lean=lean, meet_step=meet_step,
+        tick=tick, strained=strained, won=won,
+        weather_msgs_shown=snapshot.unpack_set(shown, WEATHER_MSG),
+        origin_x=origin_x, origin_y=origin_y,
+    )
+    _measure(ls)
+    return ls
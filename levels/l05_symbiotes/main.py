@@ -0,0 +1,84 @@
+# levels/l05_symbiotes/main.py
+# Level 5 — Symbiotes.
+# Two phases: touch (a root meets a thread, 3 steps) then network (the player
+# grows the fungal network out to the plants until enough of them thrive on
+# what it trades them). Sugar one way, minerals the other — the network is
+# the mechanic.
+#
+# The loop, journal and dissolve are runtime.py's; this file declares the level.
+
+import runtime
+from state import CarryState
+from . import world, view
+from . import text as txt
+
+CARRY_KEY = "symbiotes"   # names this level in carry, maps and snapshots
+
+TICK_INTERVAL       = 0.2     # seconds between network ticks
+TOUCH_STEP_INTERVAL = 1.5     # minimum seconds between touch steps
+
+
+def run(carry: CarryState) -> CarryState:
+    return runtime.run(LEVEL, carry)
+
+
+def _tick(ls: world.LevelState) -> str:
+    """One network tick. Returns a message to show, or ''."""
+    world.network_tick(ls)
+    if ls.won:
+        return ""
+
+    # The threads going hungry, once each time they run short of sugar
+    hungry = world.hungry(ls)
+    if hungry and not ls.starved:
+        ls.starved = True
+        return ls.rng.choice(txt.HUNGER)
+    if not hungry and ls.starved:
+        ls.starved = False
+        return ls.rng.choice(txt.FED)
+
+    # Thriving progress threshold messages
+    progress_pct = int(world.get_thriving_fraction(ls) * 100)
+    for threshold, pool in [
+        (25, txt.THRIVE_25),
+        (50, txt.THRIVE_50),
+        (75, txt.THRIVE_75),
+    ]:
+        if progress_pct >= threshold and threshold not in ls.thrive_msgs_shown:
+            ls.thrive_msgs_shown.add(threshold)
+            return ls.rng.choice(pool)
+    return ""
+
+
+# ── Keys ──────────────────────────────────────────────────────
+# Shared by the play loop and journal replay — keep them free of timing.
+def _grow(dy: int, dx: int):
+    return lambda ls: world.player_move(ls, dy, dx)
+
+
+def _touched(ls: world.LevelState) -> str | None:
+    return "network" if ls.touch_step == 0 else None
+
+
+LEVEL = runtime.Level(
+    key           = CARRY_KEY,
+    world         = world,
+    view          = view,
+    text          = txt,
+    generate      = world.generate_state,
+    tick          = _tick,
+    tick_interval = TICK_INTERVAL,
+    epitaph       = "symbiotes — a trade with no end to it",
+    phases        = [
+        # Touching is slow — steps closer together than TOUCH_STEP_INTERVAL are dropped.
+        runtime.Phase("touch", view.draw_touch, after=_touched,
+                      keys=runtime.keys(("w", "UP"), world.touch_step),
+                      step_keys=("w", "UP"), step_interval=TOUCH_STEP_INTERVAL),
+        runtime.Phase("network", view.draw_network, ticks=True, keys={
+            **runtime.keys(("w", "UP"),    _grow(-1, 0)),
+            **runtime.keys(("s", "DOWN"),  _grow(1, 0)),
+            **runtime.keys(("a", "LEFT"),  _grow(0, -1)),
+            **runtime.keys(("d", "RIGHT"), _grow(0, 1)),
+        }),
+    ],
+)
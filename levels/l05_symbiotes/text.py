@@ -0,0 +1,50 @@
+# levels/l05_symbiotes/text.py
+# All flavor text for the symbiote level.
+# Lowercase. No exclamation points. The organism is never named.
+
+# ── Touch phase ────────────────────────────────────────────────
+TOUCH_TEXT = [
+    "dark. damp. the ground is softer than it was.",
+    "something pushes down from above. a root, blind, looking.",
+]
+
+TOUCH_ARRIVE = "a thread finds it. sugar one way, stone the other."
+
+# ── Network phase ──────────────────────────────────────────────
+# The network going hungry — more thread than the plants can feed.
+HUNGER = [
+    "the threads run thin. not enough sugar reaches them.",
+    "too much reaching, too little coming back.",
+]
+
+FED = [
+    "sugar moves again along the threads.",
+]
+
+# Thriving threshold messages
+THRIVE_25 = [
+    "a leaf unfolds where there was only a shoot.",
+    "one of them stands a little taller.",
+]
+
+THRIVE_50 = [
+    "what one finds, the others get.",
+    "the roots are talking. slowly, in sugar and stone.",
+]
+
+THRIVE_75 = [
+    "seedlings come up where nothing asked them to.",
+    "the network feeds things it never touched.",
+]
+
+# ── Win / dissolve ─────────────────────────────────────────────
+WIN_MESSAGE = "the roots and the threads are one thing now."
+
+DISSOLVE_LINES = [
+    "the threads go on under everything.",
+    "no plant here stands alone, though each looks it.",
+    "what was taken was given back.",
+    "something will walk on this and never know.",
+]
+
+DISSOLVED = "the network. a trade with no end to it."
@@ -0,0 +1,185 @@
+# levels/l05_symbiotes/view.py
+# Curses rendering for the symbiote level. Relationships need space now: every
+# link is drawn where it runs, and a thread's glyph shows which ways it joins.
+# Phase 1 (touch): dark ground, the player at the origin.
+# Phase 2 (network): threads in box-drawing lines — yellow, bold where they carry
+#   sugar enough to sprout, dim where they hunger. Plants in green by health,
+#   dim while they stand alone. Ground the lichens left shows as ','.
+#   HUD: thriving meter, plants joined to the network, links laid.
+
+import curses
+import screen as scr
+from . import world as w
+
+# ── Color pairs ────────────────────────────────────────────────
+CP_WHITE  = 1   # player, HUD
+CP_GREEN  = 2   # plants
+CP_YELLOW = 3   # threads
+CP_CYAN   = 4   # progress
+
+
+def init_colors() -> None:
+    curses.start_color()
+    curses.use_default_colors()
+    curses.init_pair(CP_WHITE,  curses.COLOR_WHITE,  -1)
+    curses.init_pair(CP_GREEN,  curses.COLOR_GREEN,  -1)
+    curses.init_pair(CP_YELLOW, curses.COLOR_YELLOW, -1)
+    curses.init_pair(CP_CYAN,   curses.COLOR_CYAN,   -1)
+
+
+# ── Color helpers ──────────────────────────────────────────────
+def _cattr(pair: int, bold: bool = False, dim: bool = False) -> int:
+    attr = curses.color_pair(pair)
+    if bold:
+        attr |= curses.A_BOLD
+    if dim:
+        attr |= curses.A_DIM
+    return attr
+
+
+def _cch(win, y: int, x: int, ch: str,
+         pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, ch, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _cstr(win, y: int, x: int, text: str,
+          pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, text, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _draw_centered(stdscr, row: int, text: str,
+                   bold: bool = False, dim: bool = False,
+                   pair: int = 0) -> None:
+    _, sw = stdscr.getmaxyx()
+    cx = max(0, (sw - len(text)) // 2)
+    if pair:
+        _cstr(stdscr, row, cx, text, pair, bold=bold, dim=dim)
+    else:
+        scr.addstr(stdscr, row, cx, text, bold=bold, dim=dim)
+
+
+# ── Network glyphs ─────────────────────────────────────────────
+# A thread's glyph by the directions it links in: up 1, right 2, down 4, left 8.
+_JOINS = ("\u00b7\u2575\u2576\u2514\u2577\u2502\u250c\u251c"    # · ╵ ╶ └ ╷ │ ┌ ├
+          "\u2574\u2518\u2500\u2534\u2510\u2524\u252c\u253c")   # ╴ ┘ ─ ┴ ┐ ┤ ┬ ┼
+_BIT    = {(0, -1): 1, (1, 0): 2, (0, 1): 4, (-1, 0): 8}
+_SPAN   = {2: "\u2500", 4: "\u2502"}   # between the ends of a long link
+
+
+def _plant_glyph(health: float) -> str:
+    if health < 0.4:
+        return ","
+    if health < w.THRIVE:
+        return "\u03c4"   # τ
+    return "\u2663"       # ♣
+
+
+def _sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+# ── Arena / camera ─────────────────────────────────────────────
+_ARENA_TOP = 2
+
+
+def _draw_world(stdscr, ls: w.LevelState, lit: bool) -> None:
+    h, sw = stdscr.getmaxyx()
+    vh    = max(0, h - 2 - _ARENA_TOP)
+    x0, y0, ox, oy = scr.camera(ls.nx[ls.tip], ls.ny[ls.tip], sw, vh, w.WORLD_W, w.WORLD_H)
+    x1, y1 = min(w.WORLD_W, x0 + sw), min(w.WORLD_H, y0 + vh)
+    low    = scr.low_bandwidth()   # no ground marks
+
+    def put(x: int, y: int, ch: str, pair: int, bold: bool = False, dim: bool = False) -> None:
+        if x0 <= x < x1 and y0 <= y < y1:
+            _cch(stdscr, _ARENA_TOP + oy + y - y0, ox + x - x0, ch, pair, bold=bold, dim=dim)
+
+    if not low:
+        for y in range(y0, y1):
+            row = ls.ground[y]
+            for x in range(x0, x1):
+                if row[x] >= 128 and (y * 17 + x * 11) % 7 == 0:
+                    scr.addch(stdscr, _ARENA_TOP + oy + y - y0, ox + x - x0, ",", dim=True)
+    if not lit:
+        put(ls.nx[ls.tip], ls.ny[ls.tip], "@", CP_WHITE, bold=True)
+        return
+
+    net, nx, ny = ls.net, ls.nx, ls.ny
+    for n, (x, y, k) in enumerate(zip(nx, ny, ls.plant)):
+        if not (x0 - 2 <= x < x1 + 2 and y0 - 2 <= y < y1 + 2):
+            continue
+        joins = 0
+        for m in net.neighbours(n):
+            dx, dy = nx[m] - x, ny[m] - y
+            bit = _BIT.get((_sign(dx), _sign(dy)), 0) if not (dx and dy) else 0
+            joins |= bit
+            # A long link, drawn from its left or upper end.
+            if bit in (2, 4) and abs(dx) + abs(dy) > 1:
+                for i in range(1, abs(dx) + abs(dy)):
+                    put(x + i * _sign(dx), y + i * _sign(dy), _SPAN[bit], CP_YELLOW, dim=True)
+        if k:
+            v = ls.health[n]
+            put(x, y, _plant_glyph(v), CP_GREEN, bold=v >= w.THRIVE, dim=not net.degree(n))
+        else:
+            u = ls.sugar[n]
+            put(x, y, _JOINS[joins], CP_YELLOW, bold=u > w.SPROUT_AT, dim=u < w.HUNGRY)
+
+    put(nx[ls.tip], ny[ls.tip], "@", CP_WHITE, bold=True)
+
+
+# ── Touch view ─────────────────────────────────────────────────
+def draw_touch(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_world(stdscr, ls, lit=False)
+    if msg:
+        _draw_centered(stdscr, h // 2, msg, dim=True)
+    scr.addstr(stdscr, h - 2, 2, "w / \u2191 to reach", dim=True)
+    scr.present(stdscr)
+
+
+# ── Network view ───────────────────────────────────────────────
+def draw_network(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, sw = stdscr.getmaxyx()
+
+    # HUD — thriving progress meter
+    progress = w.get_thriving_fraction(ls)
+    bar_w    = 20
+    filled   = int(progress * bar_w)
+    bar      = "\u2588" * filled + "\u2591" * (bar_w - filled)
+    _cstr(stdscr, 0, 2, f"thriving [{bar}] {int(progress * 100)}%", CP_CYAN)
+
+    # HUD — plants, and how many the network reaches (right-aligned)
+    plants, joined = w.plant_count(ls)
+    pl_str = f"plants {plants}  joined {joined}"
+    _cstr(stdscr, 0, max(0, sw - len(pl_str) - 2), pl_str, CP_GREEN)
+
+    # HUD row 1 — links laid, and whether the threads hunger
+    ln_str = f"{'hungry  ' if ls.starved else ''}links {ls.net.links}"
+    _cstr(stdscr, 1, max(0, sw - len(ln_str) - 2), ln_str, CP_YELLOW, dim=not ls.starved)
+
+    _draw_world(stdscr, ls, lit=True)
+
+    if msg:
+        scr.addstr(stdscr, h - 2, 2, msg, dim=True)
+    scr.addstr(stdscr, h - 1, 2, "wasd / arrows to grow", dim=True)
+    scr.present(stdscr)
+
+
+# ── Win / dissolve ─────────────────────────────────────────────
+def draw_win(stdscr, msg: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_GREEN)
+
+
+def draw_dissolve_line(stdscr, line: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, line, dim=True)
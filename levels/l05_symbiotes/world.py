@@ -0,0 +1,393 @@
+# levels/l05_symbiotes/world.py
+# Pure engine logic. No curses imports.
+# Phase 1: touch — a root tip meets a thread in the dark (3 steps).
+# Phase 2: network — plants on the ground the lichens made, and a fungal network
+#           under them (graph.py), seeded from the threads the fungus level laid.
+#           Plants make sugar and need minerals; the fungus gathers minerals from
+#           the ground and lives on sugar. Both move through the links. A plant
+#           on its own gets by on its own roots, barely. The player is the
+#           growing tip of the network: moving lays a new link or joins two
+#           nodes. A fed network sprouts on its own, plants that thrive seed
+#           more plants, and seedlings next to a thread take it up.
+
+from __future__ import annotations
+import random
+from array import array
+from dataclasses import dataclass, field
+
+import graph
+import resample
+import snapshot
+from substrate import SubstrateMap, quality
+
+# ── World dimensions ───────────────────────────────────────────
+# Bigger than the screen — the view follows the player.
+WORLD_W = 96
+WORLD_H = 32
+
+# ── Carry ──────────────────────────────────────────────────────
+NETWORK_AT  = 0.6    # fungus-level tiles at or above this quality were network
+GROUND_BARE = 0.15   # ground quality where no lichen came before
+
+# ── Links ──────────────────────────────────────────────────────
+HYPHA      = 1.0     # weight of a fungus–fungus link
+MYCORRHIZA = 0.5     # weight of a fungus–plant link
+SUGAR_FLOW   = 0.3   # time of diffusion over the links per tick, sugar …
+MINERAL_FLOW = 0.3   # … and minerals
+FLOW_PASSES  = 3     # passes per flow: the network is small, and one would slow the spread
+
+# ── Plants ─────────────────────────────────────────────────────
+PLANTS      = 18     # plants at the start
+PLANTS_NEAR = 3      # of them, within NEAR of the player
+NEAR        = 6
+SEEDLING    = 0.25   # health a new plant starts with
+PHOTO       = 0.1    # sugar a plant makes per tick at full health
+UPTAKE      = 0.05   # minerals a plant wants per tick
+ROOTS       = 0.3    # share of that its own roots find in full ground
+HEAL        = 0.03   # health gained per tick, fully fed
+WILT        = 0.02   # health lost per tick, unfed
+THRIVE      = 0.7    # health at which a plant thrives
+SEED_CHANCE = 0.004  # per tick per thriving plant
+SEED_REACH  = 4
+PLANT_CAP   = 60
+
+# ── Fungus ─────────────────────────────────────────────────────
+GATHER        = 0.08   # minerals a node gathers per tick from full ground, well fed
+SUGAR_HALF    = 0.2    # sugar at which a node gathers half as well as it can
+RESPIRE       = 0.02   # share of sugar spent per tick, every node
+LEACH         = 0.01   # share of minerals lost per tick, every node
+SPROUT_AT     = 0.5    # sugar above which a node may sprout a new thread
+SPROUT_CHANCE = 0.02
+LINK_CHANCE   = 0.05   # per tick, for a lone plant next to a fed thread
+NODE_CAP      = 3000
+
+# ── Win ────────────────────────────────────────────────────────
+WIN_THRIVING = 24    # thriving plants joined to the network
+HUNGRY       = 0.05  # mean sugar per fungus node below which the network hungers
+
+# ── Touch ──────────────────────────────────────────────────────
+TOUCH_STEPS = 3
+
+_STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+@dataclass
+class LevelState:
+    phase: str = "touch"
+
+    net: graph.Graph = field(default_factory=graph.Graph)
+
+    # Per node, indexed like net.
+    nx:       list = field(default_factory=list)
+    ny:       list = field(default_factory=list)
+    plant:    list = field(default_factory=list)   # 1.0 for a plant, 0.0 for fungus
+    soil:     list = field(default_factory=list)   # ground quality under the node, 0.0–1.0
+    sugar:    list = field(default_factory=list)
+    minerals: list = field(default_factory=list)
+    health:   list = field(default_factory=list)   # plants only; 0.0 for fungus
+
+    ground: list = field(default_factory=list)     # WORLD_H × WORLD_W ints 0–255
+    at:     dict = field(default_factory=dict)     # (x, y) → node; rebuilt from nx, ny
+
+    tip:        int = 0        # the node the player is
+    touch_step: int = TOUCH_STEPS
+
+    tick:     int  = 0
+    thriving: int  = 0         # thriving plants joined to the network
+    starved:  bool = False
+    won:      bool = False
+
+    thrive_msgs_shown: set = field(default_factory=set)
+
+    origin_x: float = 0.5
+    origin_y: float = 0.5
+
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+
+# ── Generation ─────────────────────────────────────────────────
+def generate_state(carry, seed: int | None = None) -> LevelState:
+    origin_x = getattr(carry, "origin_x", 0.5)
+    origin_y = getattr(carry, "origin_y", 0.5)
+
+    rng = random.Random(seed)
+    ls  = LevelState(ground=_read_ground(carry.maps.get("lichens")),
+                     origin_x=origin_x, origin_y=origin_y, rng=rng)
+    ox = max(2, min(WORLD_W - 3, int(origin_x * (WORLD_W - 1))))
+    oy = max(2, min(WORLD_H - 3, int(origin_y * (WORLD_H - 1))))
+
+    # The fungus level's network, or a small cross of threads at the origin.
+    nodes, links = _read_network(carry.maps.get("fungus"))
+    if not nodes:
+        nodes = [(ox + dx * r, oy + dy * r) for r in (1, 2) for dx, dy in _STEPS]
+        nodes.append((ox, oy))
+        links = [(8, i) for i in range(4)] + [(i, i + 4) for i in range(4)]
+    for x, y in nodes:
+        _add_node(ls, x, y, 0.0, 0.0)
+    for a, b in links:
+        ls.net.link(a, b, HYPHA)
+    ls.net.commit()
+    ls.tip = min(range(len(nodes)), key=lambda n: (abs(ls.nx[n] - ox) + abs(ls.ny[n] - oy), n))
+
+    # Plants — a few near the player, the rest where the ground lets them take.
+    tx, ty = ls.nx[ls.tip], ls.ny[ls.tip]
+    for k in range(PLANTS):
+        near = k < PLANTS_NEAR
+        for _ in range(50):
+            if near:
+                x = tx + rng.randint(-NEAR, NEAR)
+                y = ty + rng.randint(-NEAR, NEAR)
+            else:
+                x, y = rng.randrange(WORLD_W), rng.randrange(WORLD_H)
+            if (0 <= x < WORLD_W and 0 <= y < WORLD_H and (x, y) not in ls.at
+                    and (near or rng.random() < _ground(ls, x, y) + GROUND_BARE)):
+                _add_node(ls, x, y, 1.0, SEEDLING)
+                break
+    _measure(ls)
+    return ls
+
+
+def _read_ground(m: SubstrateMap | None) -> list:
+    """The lichen level's weathered rock as WORLD_H rows of 0–255."""
+    if m is None:
+        return [[quality(GROUND_BARE)] * WORLD_W for _ in range(WORLD_H)]
+    m = resample.resample(m, WORLD_W, WORLD_H)
+    return [list(m.row(y)) for y in range(WORLD_H)]
+
+
+def _read_network(m: SubstrateMap | None) -> tuple[list, list]:
+    """The fungus level's network as (node positions, links) on this grid: one
+    node per network tile, one link per pair of neighbouring network tiles.
+    Tiles that land on the same cell here share a node."""
+    if m is None:
+        return [], []
+    at, cell = {}, {}
+    top = quality(NETWORK_AT)
+    for y in range(m.h):
+        for x in range(m.w):
+            if m.get(x, y) >= top:
+                pos = (min(WORLD_W - 1, (2 * x + 1) * WORLD_W // (2 * m.w)),
+                       min(WORLD_H - 1, (2 * y + 1) * WORLD_H // (2 * m.h)))
+                cell[(x, y)] = at.setdefault(pos, len(at))
+    links = {(min(a, b), max(a, b))
+             for (x, y), a in cell.items()
+             for b in (cell.get((x + 1, y)), cell.get((x, y + 1)))
+             if b is not None and b != a}
+    return list(at), sorted(links)
+
+
+def _add_node(ls: LevelState, x: int, y: int, plant: float, health: float) -> int:
+    n = ls.net.add_node()
+    ls.nx.append(x)
+    ls.ny.append(y)
+    ls.plant.append(plant)
+    ls.soil.append(_ground(ls, x, y))
+    ls.sugar.append(0.0)
+    ls.minerals.append(0.0)
+    ls.health.append(health)
+    ls.at[(x, y)] = n
+    return n
+
+
+def _ground(ls: LevelState, x: int, y: int) -> float:
+    return ls.ground[y][x] / 255
+
+
+def _weight(ls: LevelState, a: int, b: int) -> float:
+    return MYCORRHIZA if ls.plant[a] or ls.plant[b] else HYPHA
+
+
+# ── Touch phase ────────────────────────────────────────────────
+def touch_step(ls: LevelState) -> str:
+    from . import text as txt
+    if ls.touch_step <= 0:
+        return ""
+    ls.touch_step -= 1
+    if ls.touch_step == 0:
+        return txt.TOUCH_ARRIVE
+    return txt.TOUCH_TEXT[(TOUCH_STEPS - ls.touch_step - 1) % len(txt.TOUCH_TEXT)]
+
+
+# ── Network phase ──────────────────────────────────────────────
+def network_tick(ls: LevelState) -> None:
+    ls.tick += 1
+    _exchange(ls)
+    _grow(ls)
+    _measure(ls)
+    if ls.thriving >= WIN_THRIVING:
+        ls.won = True
+
+
+def _exchange(ls: LevelState) -> None:
+    """One tick of trade, node by node, then both goods flow over the links.
+    Plants take minerals and make sugar; fungus spends sugar and gathers
+    minerals, better the more sugar it has. Every node loses a little of each."""
+    p, s, h = ls.plant, ls.soil, ls.health
+    took = [(v if v < UPTAKE else UPTAKE) * k for v, k in zip(ls.minerals, p)]
+    fed  = [t / UPTAKE + ROOTS * q for t, q in zip(took, s)]
+    fed  = [f if f < 1.0 else 1.0 for f in fed]
+    ls.health = [v + k * (HEAL * f * (1.0 - v) - WILT * (1.0 - f) * v)
+                 for v, k, f in zip(h, p, fed)]
+    c = ls.sugar
+    m = [v * (1.0 - LEACH) - t + GATHER * q * u / (u + SUGAR_HALF) * (1.0 - k)
+         for v, t, q, u, k in zip(ls.minerals, took, s, c, p)]
+    c = [u * (1.0 - RESPIRE) + PHOTO * v * k for u, v, k in zip(c, h, p)]
+    ls.sugar    = ls.net.flow(c, SUGAR_FLOW, FLOW_PASSES)
+    ls.minerals = ls.net.flow(m, MINERAL_FLOW, FLOW_PASSES)
+
+
+def _grow(ls: LevelState) -> None:
+    """The network and the plants spreading by themselves. Everything this
+    tick links goes to the graph as one batch."""
+    rng, net = ls.rng, ls.net
+    n = len(net)
+
+    # Fed threads sprout, sharing their sugar with the new node.
+    for i in range(n):
+        if (not ls.plant[i] and ls.sugar[i] > SPROUT_AT and len(net) < NODE_CAP
+                and rng.random() < SPROUT_CHANCE):
+            dx, dy = _STEPS[rng.randrange(4)]
+            x, y   = ls.nx[i] + dx, ls.ny[i] + dy
+            if 0 <= x < WORLD_W and 0 <= y < WORLD_H and (x, y) not in ls.at:
+                j = _add_node(ls, x, y, 0.0, 0.0)
+                ls.sugar[i] *= 0.5
+                ls.sugar[j]  = ls.sugar[i]
+                net.link(i, j, HYPHA)
+
+    plants = [i for i in range(n) if ls.plant[i]]
+
+    # Thriving plants seed.
+    for i in plants:
+        if (ls.health[i] >= THRIVE and len(plants) < PLANT_CAP
+                and rng.random() < SEED_CHANCE):
+            x = ls.nx[i] + rng.randint(-SEED_REACH, SEED_REACH)
+            y = ls.ny[i] + rng.randint(-SEED_REACH, SEED_REACH)
+            if (0 <= x < WORLD_W and 0 <= y < WORLD_H and (x, y) not in ls.at
+                    and rng.random() < _ground(ls, x, y) + GROUND_BARE):
+                plants.append(_add_node(ls, x, y, 1.0, SEEDLING))
+
+    # A lone plant beside a thread with sugar to spare takes it up.
+    for i in plants:
+        if net.degree(i) == 0 and rng.random() < LINK_CHANCE:
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    j = ls.at.get((ls.nx[i] + dx, ls.ny[i] + dy))
+                    if j is not None and not ls.plant[j] and ls.sugar[j] > SPROUT_AT:
+                        net.link(i, j, MYCORRHIZA)
+    net.commit()
+
+
+def _measure(ls: LevelState) -> None:
+    net = ls.net
+    ls.thriving = sum(1 for i, (k, v) in enumerate(zip(ls.plant, ls.health))
+                      if k and v >= THRIVE and net.degree(i))
+
+
+def player_move(ls: LevelState, dy: int, dx: int) -> None:
+    """Grow the tip one cell. Onto an empty cell it lays a new thread; onto a
+    node it joins the two, and the tip moves there either way."""
+    x, y = ls.nx[ls.tip] + dx, ls.ny[ls.tip] + dy
+    if not (0 <= x < WORLD_W and 0 <= y < WORLD_H):
+        return
+    n = ls.at.get((x, y))
+    if n is None:
+        if len(ls.net) >= NODE_CAP:
+            return
+        n = _add_node(ls, x, y, 0.0, 0.0)
+    ls.net.link(ls.tip, n, _weight(ls, ls.tip, n))
+    ls.net.commit()
+    ls.tip = n
+
+
+def hungry(ls: LevelState) -> bool:
+    """True while the threads hold less sugar, on average, than HUNGRY."""
+    threads = [u for u, k in zip(ls.sugar, ls.plant) if not k]
+    return sum(threads) < HUNGRY * len(threads)
+
+
+def plant_count(ls: LevelState) -> tuple[int, int]:
+    """(plants, plants joined to the network)."""
+    plants = [i for i, k in enumerate(ls.plant) if k]
+    return len(plants), sum(1 for i in plants if ls.net.degree(i))
+
+
+def get_thriving_fraction(ls: LevelState) -> float:
+    return min(1.0, ls.thriving / WIN_THRIVING)
+
+
+# ── Carry serialization ────────────────────────────────────────
+def serialize_for_carry(ls: LevelState) -> dict:
+    plants, joined = plant_count(ls)
+    return {
+        "plants":   plants,
+        "joined":   joined,
+        "thriving": ls.thriving,
+        "links":    ls.net.links,
+        "origin_x": round(ls.nx[ls.tip] / (WORLD_W - 1), 3),
+        "origin_y": round(ls.ny[ls.tip] / (WORLD_H - 1), 3),
+        "map":      _root_map(ls),
+    }
+
+
+def _root_map(ls: LevelState) -> SubstrateMap:
+    """Tile quality from the ground, raised where threads run and more where
+    plants stand, by how well they did."""
+    rows = [[0.6 * q / 255 for q in row] for row in ls.ground]
+    for x, y, k, v in zip(ls.nx, ls.ny, ls.plant, ls.health):
+        if not k:
+            rows[y][x] = max(rows[y][x], 0.7)
+            continue
+        for yy in range(max(0, y - 1), min(WORLD_H, y + 2)):
+            for xx in range(max(0, x - 1), min(WORLD_W, x + 2)):
+                rows[yy][xx] = max(rows[yy][xx], 0.6 + 0.4 * v)
+    return SubstrateMap.from_rows([quality(v) for v in row] for row in rows)
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 1
+PHASES     = ("touch", "network")
+THRIVE_MSG = (25, 50, 75)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBIB", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.tip, ls.touch_step)
+    p.put("I??B", ls.tick, ls.starved, ls.won,
+          snapshot.pack_set(ls.thrive_msgs_shown, THRIVE_MSG))
+    p.put("dd", ls.origin_x, ls.origin_y)
+    p.blob(snapshot.pack_grid(ls.ground))
+    p.blob(array("H", ls.nx).tobytes())
+    p.blob(array("H", ls.ny).tobytes())
+    for values in (ls.plant, ls.sugar, ls.minerals, ls.health):
+        p.blob(array("d", values).tobytes())
+    p.blob(graph.pack(ls.net))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, tip, touch = u.get("BBIB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    tick, starved, won, shown = u.get("I??B")
+    origin_x, origin_y = u.get("dd")
+    ground = snapshot.unpack_grid(u.blob(), WORLD_W, WORLD_H)
+    nx, ny = array("H", u.blob()).tolist(), array("H", u.blob()).tolist()
+    plant, sugar, minerals, health = (array("d", u.blob()).tolist() for _ in range(4))
+    net = graph.unpack(u.blob())
+    if not len(net) == len(nx) == len(ny) == len(plant) == len(sugar) \
+            == len(minerals) == len(health) or not 0 <= tip < len(net):
+        raise ValueError("node lists differ in length")
+    ls = LevelState(
+        phase=PHASES[phase], net=net, nx=nx, ny=ny, plant=plant,
+        sugar=sugar, minerals=minerals, health=health, ground=ground,
+        at={(x, y): n for n, (x, y) in enumerate(zip(nx, ny))},
+        tip=tip, touch_step=touch, tick=tick, starved=starved, won=won,
+        thrive_msgs_shown=snapshot.unpack_set(shown, THRIVE_MSG),
+        origin_x=origin_x, origin_y=origin_y,
+    )
+    ls.soil = [_ground(ls, x, y) for x, y in zip(nx, ny)]
+    _measure(ls)
+    return ls
@@ -0,0 +1,81 @@
+# levels/l06_beetles/main.py
+# Level 6 — Beetles.
+# Two phases: wake (3 steps) then forage (the player is one beetle among
+# hundreds, chewing through litter and carrying seed, until enough of the
+# ground is enriched and the beetles hold their numbers). The first level
+# that moves through the world rather than growing through it.
+#
+# The loop, journal and dissolve are runtime.py's; this file declares the level.
+
+import runtime
+from state import CarryState
+from . import world, view
+from . import text as txt
+
+CARRY_KEY = "beetles"   # names this level in carry, maps and snapshots
+
+TICK_INTERVAL      = 0.1     # seconds between forage ticks — beetles are quick
+WAKE_STEP_INTERVAL = 1.5    # minimum seconds between wake steps
+
+
+def run(carry: CarryState) -> CarryState:
+    return runtime.run(LEVEL, carry)
+
+
+def _tick(ls: world.LevelState) -> str:
+    """One forage tick. Returns a message to show, or ''."""
+    world.forage_tick(ls)
+    if ls.won:
+        return ""
+
+    # Dusk and dawn
+    dark = world.night(ls)
+    if dark != ls.night_shown:
+        ls.night_shown = dark
+        return ls.rng.choice(txt.NIGHT if dark else txt.DAY)
+
+    # Enrichment progress threshold messages
+    progress_pct = int(world.get_enriched_fraction(ls) / world.WIN_ENRICHED * 100)
+    for threshold, pool in [
+        (25, txt.SOIL_25),
+        (50, txt.SOIL_50),
+        (75, txt.SOIL_75),
+    ]:
+        if progress_pct >= threshold and threshold not in ls.soil_msgs_shown:
+            ls.soil_msgs_shown.add(threshold)
+            return ls.rng.choice(pool)
+    return ""
+
+
+# ── Keys ──────────────────────────────────────────────────────
+# Shared by the play loop and journal replay — keep them free of timing.
+def _move(dy: int, dx: int):
+    return lambda ls: world.player_move(ls, dy, dx)
+
+
+def _woken(ls: world.LevelState) -> str | None:
+    return "forage" if ls.wake_step == 0 else None
+
+
+LEVEL = runtime.Level(
+    key           = CARRY_KEY,
+    world         = world,
+    view          = view,
+    text          = txt,
+    generate      = world.generate_state,
+    tick          = _tick,
+    tick_interval = TICK_INTERVAL,
+    epitaph       = "beetles — the many going everywhere at once",
+    phases        = [
+        # Waking is slow — steps closer together than WAKE_STEP_INTERVAL are dropped.
+        runtime.Phase("wake", view.draw_wake, after=_woken,
+                      keys=runtime.keys(("w", "UP"), world.wake_step),
+                      step_keys=("w", "UP"), step_interval=WAKE_STEP_INTERVAL),
+        runtime.Phase("forage", view.draw_forage, ticks=True, keys={
+            **runtime.keys(("w", "UP"),    _move(-1, 0)),
+            **runtime.keys(("s", "DOWN"),  _move(1, 0)),
+            **runtime.keys(("a", "LEFT"),  _move(0, -1)),
+            **runtime.keys(("d", "RIGHT"), _move(0, 1)),
+        }),
+    ],
+)
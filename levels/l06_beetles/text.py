@@ -0,0 +1,50 @@
+# levels/l06_beetles/text.py
+# All flavor text for the beetle level.
+# Lowercase. No exclamation points. The organism is never named.
+
+# ── Wake phase ─────────────────────────────────────────────────
+WAKE_TEXT = [
+    "under the leaves, something hard-shelled and still.",
+    "legs. more than you expected. they all answer.",
+]
+
+WAKE_ARRIVE = "the ground is wide. you can cross it."
+
+# ── Forage phase ───────────────────────────────────────────────
+NIGHT = [
+    "dark. everything that hid comes out.",
+    "the cool comes down. the ground is busy.",
+]
+
+DAY = [
+    "light again. the others go under the leaves.",
+    "the sun finds the open ground. nothing stays on it.",
+]
+
+# Enrichment threshold messages
+SOIL_25 = [
+    "what falls does not stay fallen long.",
+    "the leaves are going back into the ground.",
+]
+
+SOIL_50 = [
+    "the soil is darker where the many have been.",
+    "green comes up where the litter was.",
+]
+
+SOIL_75 = [
+    "the ground is eating, through all of you.",
+    "nothing here is wasted anymore.",
+]
+
+# ── Win / dissolve ─────────────────────────────────────────────
+WIN_MESSAGE = "the ground is alive with small feet."
+
+DISSOLVE_LINES = [
+    "the litter goes on falling.",
+    "something goes on eating it.",
+    "none of them know the way. the ground knows it for them.",
+    "the soil is deeper than it was.",
+]
+
+DISSOLVED = "the beetles. the many going everywhere at once."
@@ -0,0 +1,169 @@
+# levels/l06_beetles/view.py
+# Curses rendering for the beetle level. Full 2D and busy: the beetles are the
+# picture. Where the ground is crowded it shows as colour and weight, not as
+# one glyph per beetle.
+# Phase 1 (wake): the ground under the leaves, the player still.
+# Phase 2 (forage): soil darkening as it is enriched, litter in yellow, plants
+#   in green, stone. Beetles in red — one, a few, a crowd. Everything dims by
+#   night except the beetles.
+#   HUD: enrichment meter, beetle count, the time of day and seed carried.
+
+import curses
+import screen as scr
+from . import world as w
+
+# ── Color pairs ────────────────────────────────────────────────
+CP_WHITE  = 1   # player, HUD, stone
+CP_GREEN  = 2   # plants
+CP_YELLOW = 3   # litter
+CP_RED    = 4   # beetles
+CP_CYAN   = 5   # progress
+
+
+def init_colors() -> None:
+    curses.start_color()
+    curses.use_default_colors()
+    curses.init_pair(CP_WHITE,  curses.COLOR_WHITE,  -1)
+    curses.init_pair(CP_GREEN,  curses.COLOR_GREEN,  -1)
+    curses.init_pair(CP_YELLOW, curses.COLOR_YELLOW, -1)
+    curses.init_pair(CP_RED,    curses.COLOR_RED,    -1)
+    curses.init_pair(CP_CYAN,   curses.COLOR_CYAN,   -1)
+
+
+# ── Color helpers ──────────────────────────────────────────────
+def _cattr(pair: int, bold: bool = False, dim: bool = False) -> int:
+    attr = curses.color_pair(pair)
+    if bold:
+        attr |= curses.A_BOLD
+    if dim:
+        attr |= curses.A_DIM
+    return attr
+
+
+def _cch(win, y: int, x: int, ch: str,
+         pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, ch, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _cstr(win, y: int, x: int, text: str,
+          pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, text, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _draw_centered(stdscr, row: int, text: str,
+                   bold: bool = False, dim: bool = False,
+                   pair: int = 0) -> None:
+    _, sw = stdscr.getmaxyx()
+    cx = max(0, (sw - len(text)) // 2)
+    if pair:
+        _cstr(stdscr, row, cx, text, pair, bold=bold, dim=dim)
+    else:
+        scr.addstr(stdscr, row, cx, text, bold=bold, dim=dim)
+
+
+# ── Glyphs ─────────────────────────────────────────────────────
+_TERRAIN = {
+    w.LITTER: ("%",      CP_YELLOW),
+    w.PLANT:  ("\u2663", CP_GREEN),    # ♣
+    w.STONE:  ("\u25aa", CP_WHITE),    # ▪
+}
+_CROWD = ("\u00b7", "\u2234", "\u2237")   # · ∴ ∷ — one, a few, a crowd
+
+
+# ── Arena / camera ─────────────────────────────────────────────
+_ARENA_TOP = 2
+
+
+def _draw_world(stdscr, ls: w.LevelState, busy: bool) -> None:
+    h, sw = stdscr.getmaxyx()
+    vh    = max(0, h - 2 - _ARENA_TOP)
+    x0, y0, ox, oy = scr.camera(ls.px, ls.py, sw, vh, w.WORLD_W, w.WORLD_H)
+    x1, y1 = min(w.WORLD_W, x0 + sw), min(w.WORLD_H, y0 + vh)
+    low    = scr.low_bandwidth()   # no soil marks
+    dark   = w.night(ls)
+    kind, soil = ls.kind, ls.soil
+
+    for y in range(y0, y1):
+        sr = _ARENA_TOP + oy + y - y0
+        for x in range(x0, x1):
+            c  = y * w.WORLD_W + x
+            sc = ox + x - x0
+            t  = _TERRAIN.get(kind[c])
+            if t is not None:
+                _cch(stdscr, sr, sc, t[0], t[1], dim=dark)
+            elif not low and soil[c] >= w.ENRICHED_AT:
+                scr.addch(stdscr, sr, sc, ",", dim=True)
+
+    if busy:
+        crowd = {}
+        for x, y in w.beetle_cells(ls):
+            if x0 <= x < x1 and y0 <= y < y1:
+                crowd[(x, y)] = crowd.get((x, y), 0) + 1
+        for (x, y), n in crowd.items():
+            _cch(stdscr, _ARENA_TOP + oy + y - y0, ox + x - x0,
+                 _CROWD[min(n, 3) - 1], CP_RED, bold=n >= 3)
+
+    sr, sc = _ARENA_TOP + oy + ls.py - y0, ox + ls.px - x0
+    if 0 <= sr < h - 2 and 0 <= sc < sw:
+        scr.addch(stdscr, sr, sc, "@", bold=True)
+
+
+# ── Wake view ──────────────────────────────────────────────────
+def draw_wake(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_world(stdscr, ls, busy=False)
+    if msg:
+        _draw_centered(stdscr, h // 2, msg, dim=True)
+    scr.addstr(stdscr, h - 2, 2, "w / \u2191 to stir", dim=True)
+    scr.present(stdscr)
+
+
+# ── Forage view ────────────────────────────────────────────────
+def draw_forage(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, sw = stdscr.getmaxyx()
+
+    # HUD — enrichment progress meter
+    progress = min(1.0, w.get_enriched_fraction(ls) / w.WIN_ENRICHED)
+    bar_w    = 20
+    filled   = int(progress * bar_w)
+    bar      = "\u2588" * filled + "\u2591" * (bar_w - filled)
+    _cstr(stdscr, 0, 2, f"enriched [{bar}] {int(progress * 100)}%", CP_CYAN)
+
+    # HUD — how many beetles (right-aligned), bold while there are enough
+    count   = len(ls.bx)
+    cnt_str = f"beetles {count}"
+    _cstr(stdscr, 0, max(0, sw - len(cnt_str) - 2), cnt_str, CP_RED,
+          bold=count >= w.WIN_BEETLES)
+
+    # HUD row 1 — time of day, and seed carried
+    seeds   = "\u2218" * ls.seeds    # ∘ per seed
+    day_str = f"{seeds}{'  ' if seeds else ''}{'night' if w.night(ls) else 'day'}"
+    _cstr(stdscr, 1, max(0, sw - len(day_str) - 2), day_str, CP_WHITE, dim=True)
+
+    _draw_world(stdscr, ls, busy=True)
+
+    if msg:
+        scr.addstr(stdscr, h - 2, 2, msg, dim=True)
+    scr.addstr(stdscr, h - 1, 2, "wasd / arrows to move", dim=True)
+    scr.present(stdscr)
+
+
+# ── Win / dissolve ─────────────────────────────────────────────
+def draw_win(stdscr, msg: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_RED)
+
+
+def draw_dissolve_line(stdscr, line: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, line, dim=True)
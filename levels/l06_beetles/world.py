@@ -0,0 +1,483 @@
+# levels/l06_beetles/world.py
+# Pure engine logic. No curses imports.
+# Phase 1: wake — something stirs under the leaves (3 steps).
+# Phase 2: forage — hundreds of beetles over the ground the network left:
+#           open soil, plants to shelter under, litter the plants drop, stones.
+#           Every beetle wants one of a few things — food, shelter, a mate —
+#           and steers to it by one lookup in a shared flow field
+#           (flowfield.py). Fields are patched as litter falls and is eaten
+#           and plants spread, never rebuilt per beetle. Eaten litter passes
+#           through a beetle and enriches the soil wherever it walks, and
+#           plants take on enriched soil. The player is one
+#           beetle: it chews through litter and carries seed from plants to
+#           enriched ground.
+
+from __future__ import annotations
+import random
+from array import array
+from dataclasses import dataclass, field
+
+import flowfield
+import resample
+import snapshot
+from substrate import SubstrateMap, quality
+
+# ── World dimensions ───────────────────────────────────────────
+# Bigger than the screen — the view follows the player.
+WORLD_W = 100
+WORLD_H = 36
+
+# ── Terrain ────────────────────────────────────────────────────
+OPEN   = 0
+LITTER = 1
+PLANT  = 2
+STONE  = 3
+
+COST = {OPEN: 2, LITTER: 6, PLANT: 3, STONE: flowfield.WALL}   # to walk into
+
+PLANT_AT     = 0.75   # symbiote-level tiles at or above this quality were plants
+CARRY_SOIL   = 0.4    # soil a tile starts with, per unit of carried quality;
+                      # full under the plants
+STONE_CHANCE = 0.06   # per tile, scaled by how poor the ground is
+PLANTS_BARE  = 24     # plants scattered when nothing came before
+LITTER_START = 0.3    # chance a tile beside a plant starts under litter
+LITTER_REACH = 2      # how far from a plant its litter falls
+LITTER_DROP  = 0.01   # per plant per tick
+
+# ── Beetles ────────────────────────────────────────────────────
+BEETLES     = 150
+BEETLE_CAP  = 400
+JITTER      = 0.15    # chance a beetle ignores the field for a step
+HUNGRY      = 0.5     # energy below which a beetle looks for food
+BURN        = 0.004   # energy spent per tick
+BURN_REST   = 0.001   # … sheltering by day
+BITE        = 0.02    # litter eaten per bite
+MEAL        = 0.05    # energy per bite
+MATURE      = 150     # ticks before a new beetle can mate
+REST        = 200     # ticks between matings
+MATE_ENERGY = 0.6     # energy a beetle needs to mate
+BROOD_COST  = 0.3     # energy each parent gives a new beetle
+MATE_EVERY  = 10      # ticks between rebuilds of the mate fields
+
+# ── Soil ───────────────────────────────────────────────────────
+ENRICH       = 0.015  # soil a bite of litter is worth, once passed
+FRASS        = 0.005  # soil a fed beetle leaves on its tile per tick
+BODY         = 0.1    # soil gained where a beetle dies
+ENRICHED_AT  = 0.5
+GROW_AT      = 0.6    # soil on which a plant can take
+GROW_TRIES   = 4      # random tiles tried per tick
+GROW_CHANCE  = 0.2
+
+# ── Player ─────────────────────────────────────────────────────
+CHEW   = 0.25         # litter the player clears per step onto it
+SEEDS  = 5            # seeds the player carries away from a plant
+SOW_AT = 0.4          # soil the player can sow on
+
+# ── Day ────────────────────────────────────────────────────────
+DAY = 240             # ticks per day and night
+
+# ── Win ────────────────────────────────────────────────────────
+WIN_ENRICHED = 0.25   # fraction of tiles that must be enriched …
+WIN_BEETLES  = 100    # … with this many beetles alive
+
+# ── Waking ─────────────────────────────────────────────────────
+WAKE_STEPS = 3
+
+
+@dataclass
+class LevelState:
+    phase: str = "wake"
+
+    kind:   bytearray = field(default_factory=bytearray)   # per tile, row-major
+    litter: list = field(default_factory=list)             # per tile, 0.0–1.0
+    soil:   list = field(default_factory=list)             # per tile, 0.0–1.0
+    paths:  flowfield.FlowFields | None = None
+
+    # Beetles, one entry each, indexed alike.
+    bx:     list = field(default_factory=list)
+    by:     list = field(default_factory=list)
+    energy: list = field(default_factory=list)
+    gut:    list = field(default_factory=list)   # soil still to pass
+    sex:    list = field(default_factory=list)
+    ready:  list = field(default_factory=list)   # ticks until it can mate
+
+    py: int = 0
+    px: int = 0
+    seeds:     int = 0
+    wake_step: int = WAKE_STEPS
+
+    tick:           int  = 0
+    enriched_count: int  = 0
+    night_shown:    bool = False
+    won:            bool = False
+
+    soil_msgs_shown: set = field(default_factory=set)
+
+    origin_x: float = 0.5
+    origin_y: float = 0.5
+
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+
+# ── Generation ─────────────────────────────────────────────────
+def generate_state(carry, seed: int | None = None) -> LevelState:
+    origin_x = getattr(carry, "origin_x", 0.5)
+    origin_y = getattr(carry, "origin_y", 0.5)
+    ground   = _read_ground(carry.maps.get("symbiotes"))
+
+    rng  = random.Random(seed)
+    n    = WORLD_W * WORLD_H
+    kind = bytearray(n)
+    for c in range(n):
+        if ground is not None and ground[c] >= PLANT_AT:
+            kind[c] = PLANT
+        elif rng.random() < STONE_CHANCE * (1.0 - (ground[c] if ground else 0.0)):
+            kind[c] = STONE
+    if ground is None:
+        for _ in range(PLANTS_BARE):
+            kind[rng.randrange(n)] = PLANT
+    plants = [c for c in range(n) if kind[c] == PLANT]
+    for c in plants:
+        for t in _around(c, LITTER_REACH):
+            if kind[t] == OPEN and rng.random() < LITTER_START:
+                kind[t] = LITTER
+
+    px = max(0, min(WORLD_W - 1, int(origin_x * (WORLD_W - 1))))
+    py = max(0, min(WORLD_H - 1, int(origin_y * (WORLD_H - 1))))
+    kind[py * WORLD_W + px] = OPEN
+
+    ls = LevelState(
+        kind=kind,
+        litter=[1.0 if k == LITTER else 0.0 for k in kind],
+        soil=[1.0 if k == PLANT else CARRY_SOIL * q for k, q in zip(kind, ground)]
+             if ground is not None else [0.0] * n,
+        py=py, px=px, origin_x=origin_x, origin_y=origin_y, rng=rng,
+    )
+    for _ in range(BEETLES):
+        c = rng.randrange(n)
+        while kind[c] == STONE:
+            c = rng.randrange(n)
+        _hatch(ls, c % WORLD_W, c // WORLD_W, rng.random() * 0.5 + 0.5, rng.randrange(2),
+               rng.randrange(MATURE))
+    _build_paths(ls, set(), set())
+    _measure(ls)
+    return ls
+
+
+def _read_ground(m: SubstrateMap | None) -> list | None:
+    """The symbiote level's ground as one 0.0–1.0 value per tile, row-major."""
+    if m is None:
+        return None
+    m = resample.resample(m, WORLD_W, WORLD_H)
+    return [q / 255 for q in m.data]
+
+
+def _around(c: int, r: int) -> list:
+    x, y = c % WORLD_W, c // WORLD_W
+    return [yy * WORLD_W + xx
+            for yy in range(max(0, y - r), min(WORLD_H, y + r + 1))
+            for xx in range(max(0, x - r), min(WORLD_W, x + r + 1))
+            if (xx, yy) != (x, y)]
+
+
+def _build_paths(ls: LevelState, mate0: set, mate1: set) -> None:
+    """Fields for food (litter), shelter (plants) and mates — mateN leads to
+    where the ready beetles of sex N were at the last rebuild."""
+    kind = ls.kind
+    ls.paths = flowfield.FlowFields(WORLD_W, WORLD_H, [COST[k] for k in kind])
+    ls.paths.define("food",    [c for c, k in enumerate(kind) if k == LITTER])
+    ls.paths.define("shelter", [c for c, k in enumerate(kind) if k == PLANT])
+    ls.paths.define("mate0",   mate0)
+    ls.paths.define("mate1",   mate1)
+
+
+def _hatch(ls: LevelState, x: int, y: int, energy: float, sex: int, ready: int) -> None:
+    ls.bx.append(x)
+    ls.by.append(y)
+    ls.energy.append(energy)
+    ls.gut.append(0.0)
+    ls.sex.append(sex)
+    ls.ready.append(ready)
+
+
+# ── Terrain changes ────────────────────────────────────────────
+# Every change goes through here, so the paths are patched to match.
+def _set_kind(ls: LevelState, c: int, k: int) -> None:
+    old = ls.kind[c]
+    if old == k:
+        return
+    ls.kind[c] = k
+    paths = ls.paths
+    if old == LITTER:
+        paths.remove_goal("food", c)
+    if old == PLANT:
+        paths.remove_goal("shelter", c)
+    paths.set_cost(c, COST[k])
+    if k == LITTER:
+        paths.add_goal("food", c)
+    if k == PLANT:
+        paths.add_goal("shelter", c)
+
+
+def _eat(ls: LevelState, c: int, amount: float) -> float:
+    """Take up to amount of the litter at c. Returns the soil it is worth."""
+    took = min(amount, ls.litter[c])
+    ls.litter[c] -= took
+    if ls.litter[c] <= 1e-9:
+        ls.litter[c] = 0.0
+        _set_kind(ls, c, OPEN)
+    return ENRICH * took / BITE
+
+
+def _enrich(ls: LevelState, c: int, amount: float) -> None:
+    before = ls.soil[c]
+    ls.soil[c] = min(1.0, before + amount)
+    if before < ENRICHED_AT <= ls.soil[c]:
+        ls.enriched_count += 1
+
+
+# ── Wake phase ─────────────────────────────────────────────────
+def wake_step(ls: LevelState) -> str:
+    from . import text as txt
+    if ls.wake_step <= 0:
+        return ""
+    ls.wake_step -= 1
+    if ls.wake_step == 0:
+        return txt.WAKE_ARRIVE
+    return txt.WAKE_TEXT[(WAKE_STEPS - ls.wake_step - 1) % len(txt.WAKE_TEXT)]
+
+
+# ── Forage phase ───────────────────────────────────────────────
+def forage_tick(ls: LevelState) -> None:
+    ls.tick += 1
+    if ls.tick % MATE_EVERY == 0:
+        for s in (0, 1):
+            ls.paths.define(f"mate{s}", _ready_cells(ls, s))
+    _move_beetles(ls)
+    _feed_and_breed(ls)
+    _plants(ls)
+    if ls.enriched_count >= WIN_ENRICHED * WORLD_W * WORLD_H and len(ls.bx) >= WIN_BEETLES:
+        ls.won = True
+
+
+def night(ls: LevelState) -> bool:
+    return ls.tick % DAY >= DAY // 2
+
+
+def _ready_cells(ls: LevelState, sex: int) -> set:
+    return {y * WORLD_W + x
+            for x, y, s, r, e in zip(ls.bx, ls.by, ls.sex, ls.ready, ls.energy)
+            if s == sex and not r and e > MATE_ENERGY}
+
+
+def _goal(ls: LevelState, i: int, dark: bool) -> str:
+    if ls.energy[i] < HUNGRY:
+        return "food"
+    if not dark:
+        return "shelter"
+    if not ls.ready[i] and ls.energy[i] > MATE_ENERGY:
+        return "mate1" if ls.sex[i] == 0 else "mate0"
+    return "food"
+
+
+def _move_beetles(ls: LevelState) -> None:
+    """Each beetle takes one step toward what it wants — a lookup in that
+    goal's field — or now and then a step anywhere. Heavy going may stop it."""
+    rng, kind, fields = ls.rng, ls.kind, ls.paths.fields
+    dirs, walk = flowfield.DIRS, COST[OPEN]
+    dark = night(ls)
+    bx, by = ls.bx, ls.by
+    for i in range(len(bx)):
+        x, y = bx[i], by[i]
+        s = fields[_goal(ls, i, dark)].step[y * WORLD_W + x]
+        if s == flowfield.NONE or rng.random() < JITTER:
+            s = rng.randrange(8)
+        dx, dy = dirs[s]
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < WORLD_W and 0 <= ny < WORLD_H:
+            k = kind[ny * WORLD_W + nx]
+            if k != STONE and rng.random() * COST[k] < walk:
+                bx[i], by[i] = nx, ny
+
+
+def _feed_and_breed(ls: LevelState) -> None:
+    rng, kind = ls.rng, ls.kind
+    dark = night(ls)
+    n = len(ls.bx)
+    energy, ready, gut = ls.energy, ls.ready, ls.gut
+    waiting = {}    # (tile, sex) → a ready beetle there
+    for i in range(n):
+        c = ls.by[i] * WORLD_W + ls.bx[i]
+        sheltered = not dark and kind[c] == PLANT
+        energy[i] -= BURN_REST if sheltered else BURN
+        if ready[i]:
+            ready[i] -= 1
+        if gut[i] > 0.0:
+            drop = min(gut[i], FRASS)
+            gut[i] -= drop
+            _enrich(ls, c, drop)
+        if kind[c] == LITTER:
+            gut[i] += _eat(ls, c, BITE)
+            energy[i] = min(1.0, energy[i] + MEAL)
+        if dark and not ready[i] and energy[i] > MATE_ENERGY:
+            waiting.setdefault((c, ls.sex[i]), i)
+
+    # Pairs: a ready beetle with a ready one of the other sex on or beside it.
+    for (c, s), i in list(waiting.items()):
+        if ready[i] or len(ls.bx) >= BEETLE_CAP:
+            continue
+        for t in [c] + _around(c, 1):
+            j = waiting.get((t, 1 - s))
+            if j is not None and not ready[j]:
+                ready[i] = ready[j] = REST
+                energy[i] -= BROOD_COST
+                energy[j] -= BROOD_COST
+                _hatch(ls, ls.bx[i], ls.by[i], 2 * BROOD_COST, rng.randrange(2), MATURE)
+                break
+
+    # The starved go back to the soil.
+    dead = [i for i, e in enumerate(energy) if e <= 0.0]
+    if dead:
+        for i in dead:
+            _enrich(ls, ls.by[i] * WORLD_W + ls.bx[i], BODY + gut[i])
+        keep = [e > 0.0 for e in energy]
+        for name in ("bx", "by", "energy", "gut", "sex", "ready"):
+            setattr(ls, name, [v for v, k in zip(getattr(ls, name), keep) if k])
+
+
+def _plants(ls: LevelState) -> None:
+    """Plants drop litter around them; on enriched soil new plants take."""
+    rng, kind = ls.rng, ls.kind
+    n = WORLD_W * WORLD_H
+    for c in sorted(ls.paths.goals("shelter")):
+        if rng.random() < LITTER_DROP:
+            t = rng.choice(_around(c, LITTER_REACH))
+            if kind[t] == OPEN and t != ls.py * WORLD_W + ls.px:
+                ls.litter[t] = 1.0
+                _set_kind(ls, t, LITTER)
+    for _ in range(GROW_TRIES):
+        c = rng.randrange(n)
+        if kind[c] == OPEN and ls.soil[c] >= GROW_AT and rng.random() < GROW_CHANCE:
+            _set_kind(ls, c, PLANT)
+
+
+def _measure(ls: LevelState) -> None:
+    ls.enriched_count = sum(1 for v in ls.soil if v >= ENRICHED_AT)
+
+
+def player_move(ls: LevelState, dy: int, dx: int) -> None:
+    """Step one tile. Litter in the way is chewed, not walked through; a plant
+    gives seed, and enriched ground takes it."""
+    x, y = ls.px + dx, ls.py + dy
+    if not (0 <= x < WORLD_W and 0 <= y < WORLD_H):
+        return
+    c = y * WORLD_W + x
+    k = ls.kind[c]
+    if k == STONE:
+        return
+    if k == LITTER:
+        _enrich(ls, c, _eat(ls, c, CHEW))
+        return
+    ls.px, ls.py = x, y
+    if k == PLANT:
+        ls.seeds = SEEDS
+    elif ls.seeds and ls.soil[c] >= SOW_AT:
+        ls.seeds -= 1
+        _set_kind(ls, c, PLANT)
+
+
+def tile(ls: LevelState, y: int, x: int) -> int:
+    return ls.kind[y * WORLD_W + x]
+
+
+def beetle_cells(ls: LevelState) -> list:
+    return list(zip(ls.bx, ls.by))
+
+
+def get_enriched_fraction(ls: LevelState) -> float:
+    return ls.enriched_count / (WORLD_W * WORLD_H)
+
+
+# ── Carry serialization ────────────────────────────────────────
+def serialize_for_carry(ls: LevelState) -> dict:
+    return {
+        "enriched": round(get_enriched_fraction(ls), 3),
+        "beetles":  len(ls.bx),
+        "plants":   len(ls.paths.goals("shelter")),
+        "origin_x": round(ls.px / (WORLD_W - 1), 3),
+        "origin_y": round(ls.py / (WORLD_H - 1), 3),
+        "map":      _soil_map(ls),
+    }
+
+
+def _soil_map(ls: LevelState) -> SubstrateMap:
+    """Tile quality from the soil, full where plants stand, nothing on stone."""
+    q = [0 if k == STONE else quality(1.0 if k == PLANT else v)
+         for k, v in zip(ls.kind, ls.soil)]
+    return SubstrateMap.from_rows(q[y * WORLD_W:(y + 1) * WORLD_W] for y in range(WORLD_H))
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 1
+PHASES   = ("wake", "forage")
+SOIL_MSG = (25, 50, 75)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBHHBB", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.py, ls.px,
+          ls.wake_step, ls.seeds)
+    p.put("I??B", ls.tick, ls.night_shown, ls.won,
+          snapshot.pack_set(ls.soil_msgs_shown, SOIL_MSG))
+    p.put("dd", ls.origin_x, ls.origin_y)
+    p.blob(bytes(ls.kind))
+    p.blob(array("d", ls.litter).tobytes())
+    p.blob(array("d", ls.soil).tobytes())
+    p.blob(array("H", ls.bx).tobytes())
+    p.blob(array("H", ls.by).tobytes())
+    p.blob(array("d", ls.energy).tobytes())
+    p.blob(array("d", ls.gut).tobytes())
+    p.blob(bytes(ls.sex))
+    p.blob(array("H", ls.ready).tobytes())
+    # The mate fields are rebuilt every MATE_EVERY ticks from where the ready
+    # beetles were then — not from where they are now.
+    for name in ("mate0", "mate1"):
+        p.blob(array("l", sorted(ls.paths.goals(name))).tobytes())
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, py, px, wake_step, seeds = u.get("BBHHBB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    tick, night_shown, won, shown = u.get("I??B")
+    origin_x, origin_y            = u.get("dd")
+    n    = WORLD_W * WORLD_H
+    kind = bytearray(u.blob())
+    litter, soil = array("d", u.blob()).tolist(), array("d", u.blob()).tolist()
+    if not len(kind) == len(litter) == len(soil) == n or max(kind, default=0) > STONE:
+        raise ValueError("terrain has the wrong size")
+    bx, by = array("H", u.blob()).tolist(), array("H", u.blob()).tolist()
+    energy = array("d", u.blob()).tolist()
+    gut    = array("d", u.blob()).tolist()
+    sex    = list(u.blob())
+    ready  = array("H", u.blob()).tolist()
+    if not len(bx) == len(by) == len(energy) == len(gut) == len(sex) == len(ready):
+        raise ValueError("beetle lists differ in length")
+    mates = [set(array("l", u.blob())) for _ in range(2)]
+    if any(not 0 <= c < n for m in mates for c in m):
+        raise ValueError("mate goal off the map")
+    ls = LevelState(
+        phase=PHASES[phase], kind=kind, litter=litter, soil=soil,
+        bx=bx, by=by, energy=energy, gut=gut, sex=sex, ready=ready,
+        py=py, px=px, seeds=seeds, wake_step=wake_step,
+        tick=tick, night_shown=night_shown, won=won,
+        soil_msgs_shown=snapshot.unpack_set(shown, SOIL_MSG),
+        origin_x=origin_x, origin_y=origin_y,
+    )
+    _build_paths(ls, *mates)
+    _measure(ls)
+    return ls
@@ -0,0 +1,81 @@
+# levels/l07_worms/main.py
+# Level 7 — Worms.
+# Two phases: surface (the player turns down into the ground, 3 steps) then
+# burrow (eating through sand and leaf, casting loam behind, until the worms
+# have made enough of it). The ground is the picture now — every grain of it
+# falls, slides or holds.
+#
+# The loop, journal and dissolve are runtime.py's; this file declares the level.
+
+import runtime
+from state import CarryState
+from . import world, view
+from . import text as txt
+
+CARRY_KEY = "worms"   # names this level in carry, maps and snapshots
+
+TICK_INTERVAL         = 0.1     # seconds between burrow ticks — grains fall fast
+SURFACE_STEP_INTERVAL = 1.5     # minimum seconds between surface steps
+
+
+def run(carry: CarryState) -> CarryState:
+    return runtime.run(LEVEL, carry)
+
+
+def _tick(ls: world.LevelState) -> str:
+    """One burrow tick. Returns a message to show, or ''."""
+    world.burrow_tick(ls)
+    if ls.won:
+        return ""
+
+    # Rain coming and going
+    wet = world.raining(ls)
+    if wet != ls.rain_shown:
+        ls.rain_shown = wet
+        return ls.rng.choice(txt.RAIN if wet else txt.DRY)
+
+    # Loam progress threshold messages
+    progress_pct = int(world.get_made_fraction(ls) * 100)
+    for threshold, pool in [
+        (25, txt.MADE_25),
+        (50, txt.MADE_50),
+        (75, txt.MADE_75),
+    ]:
+        if progress_pct >= threshold and threshold not in ls.made_msgs_shown:
+            ls.made_msgs_shown.add(threshold)
+            return ls.rng.choice(pool)
+    return ""
+
+
+# ── Keys ──────────────────────────────────────────────────────
+# Shared by the play loop and journal replay — keep them free of timing.
+def _move(dy: int, dx: int):
+    return lambda ls: world.player_move(ls, dy, dx)
+
+
+def _under(ls: world.LevelState) -> str | None:
+    return "burrow" if ls.surface_step == 0 else None
+
+
+LEVEL = runtime.Level(
+    key           = CARRY_KEY,
+    world         = world,
+    view          = view,
+    text          = txt,
+    generate      = world.generate_state,
+    tick          = _tick,
+    tick_interval = TICK_INTERVAL,
+    epitaph       = "worms — the ground itself",
+    phases        = [
+        # Turning down is slow — steps closer together than SURFACE_STEP_INTERVAL are dropped.
+        runtime.Phase("surface", view.draw_surface, after=_under,
+                      keys=runtime.keys(("s", "DOWN"), world.surface_step),
+                      step_keys=("s", "DOWN"), step_interval=SURFACE_STEP_INTERVAL),
+        runtime.Phase("burrow", view.draw_burrow, ticks=True, keys={
+            **runtime.keys(("w", "UP"),    _move(-1, 0)),
+            **runtime.keys(("s", "DOWN"),  _move(1, 0)),
+            **runtime.keys(("a", "LEFT"),  _move(0, -1)),
+            **runtime.keys(("d", "RIGHT"), _move(0, 1)),
+        }),
+    ],
+)
@@ -0,0 +1,50 @@
+# levels/l07_worms/text.py
+# All flavor text for the worm level.
+# Lowercase. No exclamation points. The organism is never named.
+
+# ── Surface phase ──────────────────────────────────────────────
+SURFACE_TEXT = [
+    "under the litter, something soft and long.",
+    "no eyes. the light is only a warmth to turn from.",
+]
+
+SURFACE_ARRIVE = "the ground takes you in."
+
+# ── Burrow phase ───────────────────────────────────────────────
+RAIN = [
+    "rain. it finds the burrows before it finds anything else.",
+    "the ground above goes heavy and cold.",
+]
+
+DRY = [
+    "the rain has gone down past you.",
+    "the wet sinks away. the ground breathes again.",
+]
+
+# Loam threshold messages
+MADE_25 = [
+    "what went in as sand comes out as something else.",
+    "the leaves are underground now.",
+]
+
+MADE_50 = [
+    "the ground holds its shape where you have been.",
+    "dark crumbs behind you. they stay.",
+]
+
+MADE_75 = [
+    "you are making the ground. it has always been this way.",
+    "everything that grows here will owe this.",
+]
+
+# ── Win / dissolve ─────────────────────────────────────────────
+WIN_MESSAGE = "the ground is made."
+
+DISSOLVE_LINES = [
+    "the leaves go on falling.",
+    "something goes on taking them down.",
+    "the rain goes in by the ways you left.",
+    "roots find the burrows and follow them.",
+]
+
+DISSOLVED = "the worms. the ground itself."
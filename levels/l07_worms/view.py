@@ -0,0 +1,176 @@
+# levels/l07_worms/view.py
+# Curses rendering for the worm level. Particle and procedural: the ground in
+# section, one glyph per grain, drawn a run of like grains at a time.
+# Phase 1 (surface): the ground from just under the litter, the player still.
+# Phase 2 (burrow): sand in yellow, loam dark red, leaf green, water blue, stone.
+#   Burrows are the gaps. The other worms in magenta, the player as '@' and a
+#   trailing body.
+#   HUD: loam meter, what the gut holds, depth and rain.
+
+import curses
+from itertools import groupby
+
+import screen as scr
+from . import world as w
+
+# ── Color pairs ────────────────────────────────────────────────
+CP_WHITE   = 1   # player, HUD, stone
+CP_GREEN   = 2   # leaf
+CP_YELLOW  = 3   # sand
+CP_RED     = 4   # loam
+CP_BLUE    = 5   # water
+CP_MAGENTA = 6   # the other worms
+CP_CYAN    = 7   # progress
+
+
+def init_colors() -> None:
+    curses.start_color()
+    curses.use_default_colors()
+    curses.init_pair(CP_WHITE,   curses.COLOR_WHITE,   -1)
+    curses.init_pair(CP_GREEN,   curses.COLOR_GREEN,   -1)
+    curses.init_pair(CP_YELLOW,  curses.COLOR_YELLOW,  -1)
+    curses.init_pair(CP_RED,     curses.COLOR_RED,     -1)
+    curses.init_pair(CP_BLUE,    curses.COLOR_BLUE,    -1)
+    curses.init_pair(CP_MAGENTA, curses.COLOR_MAGENTA, -1)
+    curses.init_pair(CP_CYAN,    curses.COLOR_CYAN,    -1)
+
+
+# ── Color helpers ──────────────────────────────────────────────
+def _cattr(pair: int, bold: bool = False, dim: bool = False) -> int:
+    attr = curses.color_pair(pair)
+    if bold:
+        attr |= curses.A_BOLD
+    if dim:
+        attr |= curses.A_DIM
+    return attr
+
+
+def _cch(win, y: int, x: int, ch: str,
+         pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, ch, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _cstr(win, y: int, x: int, text: str,
+          pair: int, bold: bool = False, dim: bool = False) -> None:
+    try:
+        win.addstr(y, x, text, _cattr(pair, bold, dim))
+    except curses.error:
+        pass
+
+
+def _draw_centered(stdscr, row: int, text: str,
+                   bold: bool = False, dim: bool = False,
+                   pair: int = 0) -> None:
+    _, sw = stdscr.getmaxyx()
+    cx = max(0, (sw - len(text)) // 2)
+    if pair:
+        _cstr(stdscr, row, cx, text, pair, bold=bold, dim=dim)
+    else:
+        scr.addstr(stdscr, row, cx, text, bold=bold, dim=dim)
+
+
+# ── Glyphs ─────────────────────────────────────────────────────
+# material → (glyph, pair, dim); open space isn't drawn.
+_GRAIN = {
+    w.WATER:   ("\u2248", CP_BLUE,   False),   # ≈
+    w.ORGANIC: ("%",      CP_GREEN,  False),
+    w.SAND:    ("\u2591", CP_YELLOW, True),    # ░
+    w.LOAM:    ("\u2593", CP_RED,    False),   # ▓
+    w.STONE:   ("\u2588", CP_WHITE,  True),    # █
+}
+_BODY = "\u2022"   # •
+_GUT  = {w.ORGANIC: "%", w.SAND: "\u2591", w.LOAM: "\u2593"}   # ░ ▓
+
+
+# ── Arena / camera ─────────────────────────────────────────────
+_ARENA_TOP = 2
+
+
+def _draw_world(stdscr, ls: w.LevelState, busy: bool) -> None:
+    h, sw = stdscr.getmaxyx()
+    vh    = max(0, h - 2 - _ARENA_TOP)
+    x0, y0, ox, oy = scr.camera(*w.head(ls), sw, vh, w.WORLD_W, w.WORLD_H)
+    x1, y1 = min(w.WORLD_W, x0 + sw), min(w.WORLD_H, y0 + vh)
+    low    = scr.low_bandwidth()   # no sand fill
+    cell   = ls.soil.cell
+
+    # A row at a time, a run of one material at a time.
+    for y in range(y0, y1):
+        sr = _ARENA_TOP + oy + y - y0
+        sc = ox
+        for m, run in groupby(cell[y * w.WORLD_W + x0:y * w.WORLD_W + x1]):
+            n = len(list(run))
+            g = _GRAIN.get(m)
+            if g is not None and not (low and m == w.SAND):
+                _cstr(stdscr, sr, sc, g[0] * n, g[1], dim=g[2])
+            sc += n
+
+    def put(x: int, y: int, ch: str, pair: int, bold: bool = False) -> None:
+        if x0 <= x < x1 and y0 <= y < y1:
+            _cch(stdscr, _ARENA_TOP + oy + y - y0, ox + x - x0, ch, pair, bold=bold)
+
+    if busy:
+        for worm in ls.worms[1:]:
+            for x, y in worm.body:
+                put(x, y, _BODY, CP_MAGENTA)
+    player = ls.worms[0].body
+    for x, y in reversed(player[1:]):
+        put(x, y, "o", CP_WHITE)
+    put(*player[0], "@", CP_WHITE, bold=True)
+
+
+# ── Surface view ───────────────────────────────────────────────
+def draw_surface(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_world(stdscr, ls, busy=False)
+    if msg:
+        _draw_centered(stdscr, h // 2, msg, dim=True)
+    scr.addstr(stdscr, h - 2, 2, "s / \u2193 to turn down", dim=True)
+    scr.present(stdscr)
+
+
+# ── Burrow view ────────────────────────────────────────────────
+def draw_burrow(stdscr, ls: w.LevelState, msg: str = "") -> None:
+    stdscr.erase()
+    h, sw = stdscr.getmaxyx()
+
+    # HUD — loam progress meter
+    progress = w.get_made_fraction(ls)
+    bar_w    = 20
+    filled   = int(progress * bar_w)
+    bar      = "\u2588" * filled + "\u2591" * (bar_w - filled)
+    _cstr(stdscr, 0, 2, f"loam [{bar}] {int(progress * 100)}%", CP_CYAN)
+
+    # HUD — what the gut holds (right-aligned), bold while leaf binds it
+    worm    = ls.worms[0]
+    gut_str = "gut " + "".join(_GUT.get(m, "?") for m in worm.gut)
+    _cstr(stdscr, 0, max(0, sw - len(gut_str) - 2), gut_str, CP_RED, bold=worm.digest > 0)
+
+    # HUD row 1 — depth, and rain
+    _, hy   = w.head(ls)
+    dep_str = f"{'rain  ' if w.raining(ls) else ''}depth {max(0, hy - w.SKY)}"
+    _cstr(stdscr, 1, max(0, sw - len(dep_str) - 2), dep_str, CP_BLUE, dim=not w.raining(ls))
+
+    _draw_world(stdscr, ls, busy=True)
+
+    if msg:
+        scr.addstr(stdscr, h - 2, 2, msg, dim=True)
+    scr.addstr(stdscr, h - 1, 2, "wasd / arrows to burrow", dim=True)
+    scr.present(stdscr)
+
+
+# ── Win / dissolve ─────────────────────────────────────────────
+def draw_win(stdscr, msg: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, msg, bold=True, pair=CP_RED)
+
+
+def draw_dissolve_line(stdscr, line: str) -> None:
+    stdscr.erase()
+    h, _ = stdscr.getmaxyx()
+    _draw_centered(stdscr, h // 2, line, dim=True)
@@ -0,0 +1,380 @@
+# levels/l07_worms/world.py
+# Pure engine logic. No curses imports.
+# Phase 1: surface — something soft under the litter turns downward (3 steps).
+# Phase 2: burrow — the ground in section, cell by cell (grains.py): sand,
+#           loam, water, fallen leaf, stone, and the burrows between. Sand pours
+#           and slides, water runs and pools, loam holds its shape. A worm eats
+#           what is in front of it and casts it out behind; what went through
+#           with leaf comes out as loam. The player is one worm among a few.
+#           Leaves keep falling, rain comes and goes, and only the ground that
+#           is moving costs anything to step.
+
+from __future__ import annotations
+import random
+from array import array
+from dataclasses import dataclass, field
+
+import grains
+import resample
+import snapshot
+from substrate import SubstrateMap, quality
+
+# ── World dimensions ───────────────────────────────────────────
+# Ten screens across and ten down — the view follows the player.
+WORLD_W = 800
+WORLD_H = 240
+
+# ── Materials ──────────────────────────────────────────────────
+AIR     = 0
+BURROW  = 1
+WATER   = 2
+ORGANIC = 3
+SAND    = 4
+LOAM    = 5
+STONE   = 6
+
+# material → (density, how it moves)
+MATERIALS = {
+    AIR:     (0, 0),
+    BURROW:  (0, 0),
+    WATER:   (1, grains.FALL | grains.SLIDE | grains.FLOW),
+    ORGANIC: (2, grains.FALL | grains.HOLD),
+    SAND:    (3, grains.FALL | grains.SLIDE),
+    LOAM:    (3, grains.FALL | grains.HOLD | grains.FIRM),
+    STONE:   (4, grains.FIRM),
+}
+OPEN  = (AIR, BURROW, WATER)        # a worm moves through these
+FOOD  = (ORGANIC, SAND, LOAM)       # … and eats these
+
+# ── Ground ─────────────────────────────────────────────────────
+SKY          = 12     # rows of air above the ground, on average
+SKY_SWAY     = 5      # how far the surface wanders up or down
+TOPSOIL      = 4      # rows under the surface that hold leaf
+ORGANIC_TOP  = 0.35   # chance a topsoil cell is leaf, per unit of richness
+LOAM_DEEP    = 0.5    # chance a deeper cell is loam, per unit of richness
+STONE_CHANCE = 0.04   # per deep cell, scaled by how poor the ground is
+BARE_RICH    = 0.2    # richness everywhere when nothing came before
+SETTLE       = 64     # ticks the new ground gets to settle before play
+
+# ── Worms ──────────────────────────────────────────────────────
+WORM_LEN   = 6        # cells per worm
+WORMS      = 12       # others in the ground with the player
+WORM_EVERY = 2        # ticks between the others' moves
+TURN       = 0.15     # chance another worm turns when it needn't
+SMELL      = 2        # how far off another worm finds leaf
+GUT        = 4        # eaten cells a worm holds before it casts
+DIGEST     = 3        # sand cast as loam per leaf eaten
+
+# ── Weather ────────────────────────────────────────────────────
+LEAF_FALL  = 0.25     # chance per tick a leaf drops somewhere
+RAIN_EVERY = 1200     # ticks from one rain to the next
+RAIN_FOR   = 200      # ticks a rain lasts
+RAIN_DROPS = 3        # drops per tick while it rains
+DRY        = 0.5      # chance per tick one cell of water dries up
+
+# ── Win ────────────────────────────────────────────────────────
+WIN_MADE = 1500       # cells of loam the worms must make
+
+# ── Surfacing ──────────────────────────────────────────────────
+SURFACE_STEPS = 3
+
+
+@dataclass
+class Worm:
+    body:   list                                    # (x, y), head first
+    gut:    bytearray = field(default_factory=bytearray)   # eaten, oldest first
+    digest: int = 0                                 # sand still to cast as loam
+    dx:     int = 0
+    dy:     int = 1
+
+
+def _soil() -> grains.Grains:
+    return grains.Grains(WORLD_W, WORLD_H, MATERIALS)
+
+
+@dataclass
+class LevelState:
+    phase: str = "surface"
+
+    soil:  grains.Grains = field(default_factory=_soil)
+    worms: list = field(default_factory=list)      # the player's first
+    surface_step: int = SURFACE_STEPS
+
+    tick:       int  = 0
+    made:       int  = 0        # cells of loam cast
+    rain_shown: bool = False
+    won:        bool = False
+
+    made_msgs_shown: set = field(default_factory=set)
+
+    origin_x: float = 0.5
+    origin_y: float = 0.5
+
+    # Every random roll the world makes comes from here, so a snapshot plus a
+    # journal of inputs replays exactly.
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+
+# ── Generation ─────────────────────────────────────────────────
+def generate_state(carry, seed: int | None = None) -> LevelState:
+    origin_x = getattr(carry, "origin_x", 0.5)
+    origin_y = getattr(carry, "origin_y", 0.5)
+    rich     = _read_rich(carry.maps.get("beetles"))
+
+    rng  = random.Random(seed)
+    soil = _soil()
+    top  = _surface(rng)
+    cell = soil.cell
+    for x in range(WORLD_W):
+        for y in range(top[x], WORLD_H):
+            q = rich[y][x] if rich else BARE_RICH
+            if y - top[x] < TOPSOIL:
+                m = ORGANIC if rng.random() < ORGANIC_TOP * q else LOAM if rng.random() < q else SAND
+            elif rng.random() < STONE_CHANCE * (1.0 - q):
+                m = STONE
+            else:
+                m = LOAM if rng.random() < LOAM_DEEP * q else SAND
+            cell[y * WORLD_W + x] = m
+    soil.wake_all()
+    soil.settle(SETTLE)
+
+    px = max(0, min(WORLD_W - 1, int(origin_x * (WORLD_W - 1))))
+    ls = LevelState(soil=soil, origin_x=origin_x, origin_y=origin_y, rng=rng)
+    # The player lies just under the litter, head down, in a burrow of its own
+    # and in soft ground: no stone either side of it.
+    body = [(px, min(WORLD_H - 1, top[px] + WORM_LEN - 1 - i)) for i in range(WORM_LEN)]
+    for x, y in body:
+        soil.set(x, y, BURROW)
+        for xx in (x - 1, x + 1):
+            if 0 <= xx < WORLD_W and soil.get(xx, y) == STONE:
+                soil.set(xx, y, SAND)
+    ls.worms.append(Worm(body=body))
+    for _ in range(WORMS):
+        x = rng.randrange(WORLD_W)
+        y = rng.randrange(top[x] + 1, min(WORLD_H, top[x] + TOPSOIL * 4))
+        ls.worms.append(Worm(body=[(x, y)] * WORM_LEN, dx=rng.choice((-1, 1)), dy=0))
+    return ls
+
+
+def _read_rich(m: SubstrateMap | None) -> list | None:
+    """The beetle level's soil, stood on its side: WORLD_H rows of richness,
+    never poorer than bare ground."""
+    if m is None:
+        return None
+    return [[BARE_RICH + (1.0 - BARE_RICH) * q for q in row]
+            for row in resample.field(m, WORLD_W, WORLD_H)]
+
+
+def _surface(rng: random.Random) -> list:
+    """The row the ground starts at, per column — a walk that never steps more
+    than one, so no slope starts out too steep to stand."""
+    top, y = [], SKY
+    for _ in range(WORLD_W):
+        y = max(SKY - SKY_SWAY, min(SKY + SKY_SWAY, y + rng.choice((-1, 0, 0, 1))))
+        top.append(y)
+    return top
+
+
+# ── Surface phase ──────────────────────────────────────────────
+def surface_step(ls: LevelState) -> str:
+    from . import text as txt
+    if ls.surface_step <= 0:
+        return ""
+    ls.surface_step -= 1
+    if ls.surface_step == 0:
+        return txt.SURFACE_ARRIVE
+    return txt.SURFACE_TEXT[(SURFACE_STEPS - ls.surface_step - 1) % len(txt.SURFACE_TEXT)]
+
+
+# ── Burrow phase ───────────────────────────────────────────────
+def burrow_tick(ls: LevelState) -> None:
+    ls.tick += 1
+    _weather(ls)
+    if ls.tick % WORM_EVERY == 0:
+        for worm in ls.worms[1:]:
+            _wander(ls, worm)
+    ls.soil.step()
+    _drain(ls)
+    if ls.made >= WIN_MADE:
+        ls.won = True
+
+
+def raining(ls: LevelState) -> bool:
+    return ls.tick % RAIN_EVERY >= RAIN_EVERY - RAIN_FOR
+
+
+def _weather(ls: LevelState) -> None:
+    """Leaves and rain in at the top; a little water out, anywhere."""
+    rng, soil = ls.rng, ls.soil
+    if rng.random() < LEAF_FALL:
+        x = rng.randrange(WORLD_W)
+        if soil.get(x, 0) == AIR:
+            soil.set(x, 0, ORGANIC)
+    if raining(ls):
+        for _ in range(RAIN_DROPS):
+            x = rng.randrange(WORLD_W)
+            if soil.get(x, 0) == AIR:
+                soil.set(x, 0, WATER)
+    if rng.random() < DRY:
+        c = soil.cell.find(WATER, rng.randrange(len(soil.cell)))
+        if c < 0:
+            c = soil.cell.find(WATER)
+        if c >= 0:
+            soil.set(c % WORLD_W, c // WORLD_W, AIR)
+
+
+def _drain(ls: LevelState) -> None:
+    """Water that reaches the bottom row soaks away below it."""
+    soil = ls.soil
+    base = (WORLD_H - 1) * WORLD_W
+    c = soil.cell.find(WATER, base)
+    while c >= 0:
+        soil.set(c - base, WORLD_H - 1, BURROW)
+        c = soil.cell.find(WATER, c + 1)
+
+
+def _crawl(ls: LevelState, worm: Worm, dx: int, dy: int) -> bool:
+    """Move a worm's head one cell, eating what is there. Once the gut is
+    full its tail casts behind it, packed into whatever has fallen in there.
+    Back into its own body, it turns round and leads with its tail. False if
+    the way is shut."""
+    soil = ls.soil
+    hx, hy = worm.body[0]
+    x, y = hx + dx, hy + dy
+    if (x, y) == worm.body[1]:
+        worm.body.reverse()
+        return True
+    if not (0 <= x < WORLD_W and 0 <= y < WORLD_H) or (x, y) in worm.body:
+        return False
+    m = soil.get(x, y)
+    if m == STONE:
+        return False
+    # Out in the open it needs ground under it, or to be coming straight up
+    # out of a hole in it.
+    if m == AIR and not (dy < 0 and _walled(soil, hx, hy)) and (
+            y + 1 >= WORLD_H or soil.get(x, y + 1) in OPEN):
+        return False
+    if m in FOOD:
+        worm.gut.append(m)
+        if m == ORGANIC:
+            worm.digest += DIGEST
+        soil.set(x, y, BURROW)
+    worm.body.insert(0, (x, y))
+    tx, ty = worm.body.pop()
+    if len(worm.gut) > GUT and (tx, ty) not in worm.body and soil.get(tx, ty) != STONE:
+        soil.set(tx, ty, _cast(ls, worm))
+    return True
+
+
+def _walled(soil: grains.Grains, x: int, y: int) -> bool:
+    return all(0 <= xx < WORLD_W and soil.get(xx, y) not in OPEN for xx in (x - 1, x + 1))
+
+
+def _cast(ls: LevelState, worm: Worm) -> int:
+    """What comes out: leaf as loam, and sand as loam while leaf is still in
+    the gut to bind it."""
+    m = worm.gut.pop(0)
+    if m == ORGANIC or (m == SAND and worm.digest > 0):
+        if m == SAND:
+            worm.digest -= 1
+        ls.made += 1
+        return LOAM
+    return m
+
+
+_DIRS  = ((1, 0), (0, 1), (-1, 0), (0, -1))
+_TURNS = _DIRS + ((0, -1),)     # a new way, leaning up toward the leaf
+
+
+def _wander(ls: LevelState, worm: Worm) -> None:
+    """The other worms: toward leaf they can smell, else on the way they were
+    going, turning now and then or when the way is shut."""
+    rng, soil = ls.rng, ls.soil
+    hx, hy = worm.body[0]
+    for y in range(max(0, hy - SMELL), min(WORLD_H, hy + SMELL + 1)):
+        for x in range(max(0, hx - SMELL), min(WORLD_W, hx + SMELL + 1)):
+            if soil.get(x, y) == ORGANIC:
+                dx, dy = (x > hx) - (x < hx), (y > hy) - (y < hy)
+                worm.dx, worm.dy = (dx, 0) if dx and (not dy or rng.random() < 0.5) else (0, dy)
+                if _crawl(ls, worm, worm.dx, worm.dy):
+                    return
+    if rng.random() < TURN or not _crawl(ls, worm, worm.dx, worm.dy):
+        worm.dx, worm.dy = rng.choice(_TURNS)
+
+
+def player_move(ls: LevelState, dy: int, dx: int) -> None:
+    _crawl(ls, ls.worms[0], dx, dy)
+
+
+def head(ls: LevelState) -> tuple[int, int]:
+    return ls.worms[0].body[0]
+
+
+def get_made_fraction(ls: LevelState) -> float:
+    return min(1.0, ls.made / WIN_MADE)
+
+
+# ── Carry serialization ────────────────────────────────────────
+# Tile quality by material: loam best, then leaf, then the open burrows.
+_QUALITY = bytes(quality(q) for q in (0.0, 0.6, 0.5, 0.8, 0.2, 1.0, 0.0)).ljust(256, b"\0")
+
+
+def serialize_for_carry(ls: LevelState) -> dict:
+    x, y = head(ls)
+    soil = ls.soil
+    return {
+        "made":     ls.made,
+        "loam":     round(soil.count(LOAM) / (WORLD_W * WORLD_H), 3),
+        "burrows":  soil.count(BURROW),
+        "origin_x": round(x / (WORLD_W - 1), 3),
+        "origin_y": round(y / (WORLD_H - 1), 3),
+        "map":      SubstrateMap(w=WORLD_W, h=WORLD_H, data=soil.cell.translate(_QUALITY)),
+    }
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+SNAPSHOT_VERSION = 1
+PHASES   = ("surface", "burrow")
+MADE_MSG = (25, 50, 75)
+
+
+def pack_state(ls: LevelState) -> bytes:
+    p = snapshot.Packer()
+    p.put("BBB", SNAPSHOT_VERSION, PHASES.index(ls.phase), ls.surface_step)
+    p.put("II??B", ls.tick, ls.made, ls.rain_shown, ls.won,
+          snapshot.pack_set(ls.made_msgs_shown, MADE_MSG))
+    p.put("dd", ls.origin_x, ls.origin_y)
+    p.blob(grains.pack(ls.soil))
+    p.put("H", len(ls.worms))
+    for worm in ls.worms:
+        p.put("Ibb", worm.digest, worm.dx, worm.dy)
+        p.blob(array("H", [v for xy in worm.body for v in xy]).tobytes())
+        p.blob(bytes(worm.gut))
+    return p.bytes()
+
+
+def unpack_state(data: bytes) -> LevelState:
+    u = snapshot.Unpacker(data)
+    version, phase, surface_step = u.get("BBB")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("snapshot from another version")
+    tick, made, rain_shown, won, shown = u.get("II??B")
+    origin_x, origin_y                 = u.get("dd")
+    soil  = grains.unpack(u.blob(), WORLD_W, WORLD_H, MATERIALS)
+    worms = []
+    for _ in range(u.one("H")):
+        digest, dx, dy = u.get("Ibb")
+        xy = array("H", u.blob())
+        if not xy or len(xy) % 2 or any(x >= WORLD_W for x in xy[::2]) \
+                or any(y >= WORLD_H for y in xy[1::2]):
+            raise ValueError("worm off the map")
+        worms.append(Worm(body=list(zip(xy[::2], xy[1::2])), gut=bytearray(u.blob()),
+                          digest=digest, dx=dx, dy=dy))
+    if not worms:
+        raise ValueError("no worms")
+    return LevelState(
+        phase=PHASES[phase], soil=soil, worms=worms, surface_step=surface_step,
+        tick=tick, made=made, rain_shown=rain_shown, won=won,
+        made_msgs_shown=snapshot.unpack_set(shown, MADE_MSG),
+        origin_x=origin_x, origin_y=origin_y,
+    )
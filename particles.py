@@ -0,0 +1,174 @@
+# particles.py
+# Particles on a grid — l02's oxygen bubbles, the wipe's drifting dust.
+#
+# Storage is preallocated: one slot per particle in flat arrays (spawn point,
+# velocity, birth and death tick), and a free list of empty slots. A dead
+# particle's slot goes back on the free list and is the next one handed out, so
+# nothing is allocated while particles come and go.
+#
+# Motion is ballistic — each particle keeps the velocity it was born with — so
+# integration is closed-form: a particle's position is its spawn point plus
+# velocity × age, worked out only when someone asks for positions(). Its death
+# tick (end of life, or the tick it leaves the grid) is known at spawn, and the
+# slot is filed under that tick. step() is then one counter increment and one
+# bucket of frees: its cost follows how many particles are born and die, not how
+# many are alive.
+#
+# spawn_mask() emits from every true cell of a mask with the same chance, but
+# doesn't roll per cell: it draws the gap to the next emitting cell from the
+# geometric distribution, one roll per particle spawned.
+
+from __future__ import annotations
+import math
+import random
+from array import array
+from itertools import chain, compress, count
+
+import snapshot
+
+LIFE_MAX = 1 << 30   # ticks — "until it leaves the grid"
+
+
+class Particles:
+    def __init__(self, capacity: int, w: int, h: int) -> None:
+        self.capacity = capacity
+        self.w        = w
+        self.h        = h
+        self.t        = 0                             # ticks stepped
+        self.x0       = array("f", bytes(4 * capacity))
+        self.y0       = array("f", bytes(4 * capacity))
+        self.vx       = array("f", bytes(4 * capacity))
+        self.vy       = array("f", bytes(4 * capacity))
+        self.born     = array("q", bytes(8 * capacity))
+        self.dies     = array("q", bytes(8 * capacity))   # 0 = free slot
+        self.free     = array("I", range(capacity - 1, -1, -1))   # pops lowest first
+        self.top      = 0                             # slots below this have been used
+        self.wheel    = {}                            # death tick → slots
+
+    def __len__(self) -> int:
+        return self.capacity - len(self.free)
+
+    # ── Spawning ──────────────────────────────────────────────
+    def spawn(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+              life: int = LIFE_MAX) -> bool:
+        """Add one particle at (x, y) now. False if it is off the grid or there is no room."""
+        if not (0 <= x < self.w and 0 <= y < self.h) or life <= 0 or not self.free:
+            return False
+        self._put(x, y, vx, vy, life)
+        return True
+
+    def spawn_mask(self, mask, chance: float, rng: random.Random,
+                   dx: int = 0, dy: int = 0, vx: float = 0.0, vy: float = 0.0,
+                   life: int = LIFE_MAX) -> int:
+        """Each true cell of mask (rows of bools) emits one particle at (x+dx, y+dy)
+        with probability chance. Returns how many were spawned."""
+        if chance <= 0.0 or life <= 0 or not mask:
+            return 0
+        mw, w, h = len(mask[0]), self.w, self.h
+        cells    = list(compress(count(), chain.from_iterable(mask)))
+        roll     = rng.random
+        lq       = math.log(1.0 - chance) if chance < 1.0 else -math.inf
+        free     = self.free
+        n        = 0
+        i        = int(math.log(1.0 - roll()) / lq)
+        while i < len(cells) and free:
+            c = cells[i]
+            x, y = c % mw + dx, c // mw + dy
+            if 0 <= x < w and 0 <= y < h:
+                self._put(x, y, vx, vy, life)
+                n += 1
+            i += 1 + int(math.log(1.0 - roll()) / lq)
+        return n
+
+    def _put(self, x: float, y: float, vx: float, vy: float, life: int) -> None:
+        s = self.free.pop()
+        x0, y0, fvx, fvy = self.x0, self.y0, self.vx, self.vy
+        x0[s], y0[s], fvx[s], fvy[s] = x, y, vx, vy
+        # Read back: the exit tick must come from the float32 values positions() will use.
+        if fvx[s]:
+            life = min(life, _exit(x0[s], fvx[s], self.w))
+        if fvy[s]:
+            life = min(life, _exit(y0[s], fvy[s], self.h))
+        dies = self.t + life
+        self.born[s], self.dies[s] = self.t, dies
+        bucket = self.wheel.get(dies)
+        if bucket is None:
+            self.wheel[dies] = [s]
+        else:
+            bucket.append(s)
+        if s >= self.top:
+            self.top = s + 1
+
+    # ── Stepping ──────────────────────────────────────────────
+    def step(self) -> None:
+        """Advance one tick; particles whose time is up free their slots."""
+        self.t += 1
+        dead = self.wheel.pop(self.t, None)
+        if dead:
+            for s in dead:
+                self.dies[s] = 0
+            self.free.extend(dead)
+
+    def positions(self) -> list:
+        """(x, y) grid cell of every live particle."""
+        return [(int(x), int(y)) for x, y in self.points()]
+
+    def points(self) -> list:
+        """(x, y) of every live particle, unrounded — where in its cell it is."""
+        t, w, h = self.t, self.w, self.h
+        x0, y0, vx, vy, born, dies = self.x0, self.y0, self.vx, self.vy, self.born, self.dies
+        out = []
+        for s in range(self.top):
+            if dies[s] > t:
+                age = t - born[s]
+                x, y = x0[s] + vx[s] * age, y0[s] + vy[s] * age
+                if 0 <= int(x) < w and 0 <= int(y) < h:
+                    out.append((x, y))
+        return out
+
+    def _live(self) -> list:
+        """Every live particle as (born, dies, x0, y0, vx, vy), ages relative to now —
+        sorted, so equal sets of particles pack the same whatever slots they sit in."""
+        t = self.t
+        return sorted(
+            (self.born[s] - t, self.dies[s] - t, self.x0[s], self.y0[s], self.vx[s], self.vy[s])
+            for s in range(self.top) if self.dies[s] > t
+        )
+
+
+def _exit(p: float, v: float, size: int) -> int:
+    """Ticks until a particle at p moving v (not 0) per tick leaves [0, size)."""
+    if v > 0:
+        return math.ceil((size - p) / v)
+    return math.floor(p / -v) + 1
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+_PARTICLE = "iiffff"
+
+
+def pack(p: Particles) -> bytes:
+    out = snapshot.Packer()
+    live = p._live()
+    out.put("I", len(live))
+    for rec in live:
+        out.put(_PARTICLE, *rec)
+    return out.bytes()
+
+
+def unpack(data: bytes, capacity: int, w: int, h: int) -> Particles:
+    p = Particles(capacity, w, h)
+    u = snapshot.Unpacker(data)
+    n = u.one("I")
+    if n > capacity:
+        raise ValueError("more particles than slots")
+    for s in range(n):
+        born, dies, x0, y0, vx, vy = u.get(_PARTICLE)
+        if dies <= 0:
+            raise ValueError("particle already dead")
+        p.x0[s], p.y0[s], p.vx[s], p.vy[s] = x0, y0, vx, vy
+        p.born[s], p.dies[s] = born, dies
+        p.wheel.setdefault(dies, []).append(s)
+    del p.free[len(p.free) - n:]
+    p.top = n
+    return p
@@ -0,0 +1,156 @@
+# persist.py
+# Crash-safe file writes, off the UI thread.
+#
+# write_atomic: temp file → fsync → rename. A kill at any instant leaves either the
+# old file or the new one, never half of each. The previous good copy is kept as
+# <path>.bak so a reader can fall back if the newest file is somehow bad.
+#
+# BackgroundWriter: one daemon thread that owns the disk. submit() returns at once;
+# rapid saves to the same path coalesce so only the latest content is written.
+# Removals go through the same queue, so a delete can't be undone by a write
+# that was still in flight.
+
+from __future__ import annotations
+import atexit
+import os
+import shutil
+import threading
+
+BACKUP_EXT = ".bak"
+TEMP_EXT   = ".tmp"
+
+
+def write_atomic(path: str, data: bytes, keep_backup: bool = True) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    tmp = path + TEMP_EXT
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if keep_backup and os.path.exists(path):
+        _backup(path)
+
+    os.replace(tmp, path)
+    _fsync_dir(directory)
+
+
+def backup_path(path: str) -> str:
+    return path + BACKUP_EXT
+
+
+def read_with_fallback(path: str, validate):
+    """Return validate(bytes) for path, or for its backup if path is missing or bad.
+    validate raises ValueError to reject. Returns None if neither copy is usable."""
+    for candidate in (path, backup_path(path)):
+        try:
+            with open(candidate, "rb") as f:
+                blob = f.read()
+        except OSError:
+            continue
+        try:
+            return validate(blob)
+        except ValueError:
+            continue
+    return None
+
+
+def _backup(path: str) -> None:
+    # Hard link so the live path never disappears; copy where links aren't allowed.
+    bak = backup_path(path)
+    try:
+        if os.path.exists(bak):
+            os.remove(bak)
+        os.link(path, bak)
+    except OSError:
+        shutil.copy2(path, bak)
+
+
+def _remove(path: str) -> None:
+    for p in (path, backup_path(path)):
+        try:
+            os.remove(p)
+        except FileNotFoundError:
+            pass
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return   # not every platform lets a directory be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# ── Background writer ─────────────────────────────────────────
+class BackgroundWriter:
+    """Single writer thread. Pending writes are keyed by path; a newer submit
+    for the same path replaces the older one before it ever reaches the disk."""
+
+    def __init__(self) -> None:
+        self._pending: dict = {}            # path → (payload, keep_backup)
+        self._cond    = threading.Condition()
+        self._busy    = False
+        self._thread  = None
+        self.last_error: Exception | None = None
+
+    def submit(self, path: str, payload, keep_backup: bool = True) -> None:
+        """Queue a write. payload is bytes, or a zero-arg callable returning bytes
+        that runs on the writer thread (for encoding work the UI shouldn't pay for)."""
+        with self._cond:
+            # Re-queue at the back: writes land in the order they were last asked for.
+            self._pending.pop(path, None)
+            self._pending[path] = (payload, keep_backup)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def remove(self, path: str) -> None:
+        """Queue deletion of path and its backup."""
+        self.submit(path, None)
+
+    def flush(self) -> None:
+        """Block until everything submitted so far is on disk."""
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="persist",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            try:
+                for path, (payload, keep_backup) in batch.items():
+                    try:
+                        if payload is None:
+                            _remove(path)
+                            continue
+                        data = payload() if callable(payload) else payload
+                        write_atomic(path, data, keep_backup)
+                    except Exception as e:
+                        # A payload that fails to encode loses its own write, not
+                        # the thread: flush() must still come back.
+                        self.last_error = e
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+writer = BackgroundWriter()
+atexit.register(writer.flush)
@@ -0,0 +1,272 @@
+# raster.py
+# Pixels on the terminal — a framebuffer drawn several pixels to a cell.
+#
+# Two ways to cut a cell:
+#   HALF     1 × 2 pixels: "▀" in the top pixel's colour over the bottom one's.
+#            Cells are about twice as tall as wide, so the pixels come out square.
+#   BRAILLE  2 × 4 pixels: one braille pattern, a dot per lit pixel. A cell has
+#            one colour — where its dots differ, the highest ink wins.
+#
+# The framebuffer is a bytearray, a byte per pixel, row-major. What a byte means
+# is up to the caller: a palette, 256 bytes, turns each value into an ink — NONE,
+# PLAIN (the terminal's own foreground) or one of seven colours. NONE is
+# see-through: whatever the view drew under the raster shows.
+#
+# A frame is worked out a row of cells at a time, not a pixel at a time. Each
+# pixel row goes through one bytes.translate (palette and shift, or palette and
+# dot bit, in a single table) and int.from_bytes; ORing a cell row's pixel rows
+# together gives every cell its key in one go — top ink × 16 + bottom ink for
+# HALF, the dots and a bit per ink present for BRAILLE. A table then gives each
+# key its glyph and colour pair.
+#
+# The raster draws into a curses pad of its own, kept from frame to frame, and
+# remembers the keys of every row it drew. A row whose keys haven't changed
+# costs one comparison; in one that has, only the changed cells are written,
+# a run of cells in one colour per addstr. The pad is then laid over the window
+# in C, blanks see-through. Views go on erasing and redrawing their window every
+# frame; curses sends the terminal only what differs from the last.
+#
+# MANDALA_RASTER=1 turns on the views that can draw through a raster. They fall
+# back to glyphs in low-bandwidth mode: colour changes cost escape sequences.
+
+from __future__ import annotations
+import curses
+import os
+import re
+from functools import lru_cache
+from itertools import groupby
+
+import screen as scr
+
+RASTER_ENV = "MANDALA_RASTER"   # "1" draws through a raster where a view can
+
+HALF    = "half"
+BRAILLE = "braille"
+MODES   = {HALF: (1, 2), BRAILLE: (2, 4)}   # mode → pixels across, down a cell
+
+# Inks
+NONE    = 0
+PLAIN   = 1
+RED     = 2
+GREEN   = 3
+YELLOW  = 4
+BLUE    = 5
+MAGENTA = 6
+CYAN    = 7
+WHITE   = 8
+
+INKS = bytes(min(v, WHITE) for v in range(256))   # the default palette: value = ink
+
+PAIR_BASE = 16      # the raster's colour pairs start here, clear of the levels' own
+
+_CURSES = (-1, -1, curses.COLOR_RED, curses.COLOR_GREEN, curses.COLOR_YELLOW,
+           curses.COLOR_BLUE, curses.COLOR_MAGENTA, curses.COLOR_CYAN, curses.COLOR_WHITE)
+
+# Braille dot bits by (column, pixel row) within a cell.
+_DOTS = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+
+_CHANGED = re.compile(rb"[^\x00]+")
+
+
+def wanted() -> bool:
+    return os.environ.get(RASTER_ENV) == "1" and not scr.low_bandwidth()
+
+
+def palette(inks: dict) -> bytes:
+    """A palette from {pixel value: ink}; any other value is NONE."""
+    return bytes(inks.get(v, NONE) for v in range(256))
+
+
+class Raster:
+    def __init__(self, cols: int, rows: int, mode: str = HALF,
+                 palette: bytes = INKS, attr: int = 0) -> None:
+        """cols × rows cells. attr: curses attributes for every cell, e.g. A_DIM."""
+        if mode not in MODES:
+            raise ValueError(f"unknown raster mode {mode!r}")
+        if len(palette) != 256 or max(palette) > WHITE:
+            raise ValueError("a palette is 256 inks")
+        sx, sy       = MODES[mode]
+        self.cols    = cols
+        self.rows    = rows
+        self.mode    = mode
+        self.w       = cols * sx                 # pixels across
+        self.h       = rows * sy                 # pixels down
+        self.px      = bytearray(self.w * self.h)
+        self.palette = bytes(palette)
+        self.attr    = attr
+        self._pad    = None                      # drawn cells, kept between frames
+        self._on     = None                      # the window the pad was made for
+        self._shown  = [None] * rows             # keys of each cell row, as drawn
+
+    # ── Pixels ────────────────────────────────────────────────
+    def clear(self) -> None:
+        self.px[:] = bytes(len(self.px))
+
+    def get(self, x: int, y: int) -> int:
+        return self.px[y * self.w + x]
+
+    def set(self, x: int, y: int, v: int) -> None:
+        """Off the frame is ignored."""
+        if 0 <= x < self.w and 0 <= y < self.h:
+            self.px[y * self.w + x] = v
+
+    def fill(self, x0: int, y0: int, x1: int, y1: int, v: int) -> None:
+        """Set every pixel with x0 ≤ x < x1 and y0 ≤ y < y1, clipped to the frame."""
+        x0, x1 = max(0, x0), min(self.w, x1)
+        if x1 <= x0:
+            return
+        run = bytes([v]) * (x1 - x0)
+        for y in range(max(0, y0), min(self.h, y1)):
+            self.px[y * self.w + x0:y * self.w + x1] = run
+
+    # ── Drawing ───────────────────────────────────────────────
+    def draw(self, win, top: int, left: int) -> int:
+        """Lay the frame over win, its corner at (top, left), clipped to win.
+        Returns how many cells changed since the last draw."""
+        if self._pad is None or win is not self._on:
+            self._pad   = curses.newpad(self.rows, self.cols + 1)
+            self._on    = win
+            self._shown = [None] * self.rows
+        t       = _tables(self.mode, self.palette)
+        look    = _looks(self.mode, _colours(), self.attr)
+        stride  = 1 if self.mode == HALF else 2
+        changed = 0
+        for r in range(self.rows):
+            keys = self._keys(r, t)
+            if keys != self._shown[r]:
+                changed += self._emit(r, keys, self._shown[r], look, stride)
+                self._shown[r] = keys
+
+        h, w = win.getmaxyx()
+        rows, cols = min(self.rows, h - top), min(self.cols, w - left)
+        if rows > 0 and cols > 0 and top >= 0 and left >= 0:
+            try:
+                self._pad.overlay(win, 0, 0, top, left, top + rows - 1, left + cols - 1)
+            except curses.error:
+                pass
+        return changed
+
+    def _keys(self, r: int, t: _Tables) -> bytes:
+        """Every cell of cell row r as its key: a byte per cell for HALF, two
+        (dots, inks) for BRAILLE."""
+        w, px = self.w, self.px
+        if self.mode == HALF:
+            y = 2 * r * w
+            key = (int.from_bytes(px[y:y + w].translate(t.high), "big")
+                   | int.from_bytes(px[y + w:y + 2 * w].translate(t.low), "big"))
+            return key.to_bytes(self.cols, "big")
+        dots, inks = 0, 0
+        for k in range(4):
+            row = px[(4 * r + k) * w:(4 * r + k + 1) * w]
+            for c in (0, 1):
+                half  = row[c::2]
+                dots |= int.from_bytes(half.translate(t.dots[k][c]), "big")
+                inks |= int.from_bytes(half.translate(t.inks), "big")
+        keys = bytearray(2 * self.cols)
+        keys[0::2] = dots.to_bytes(self.cols, "big")
+        keys[1::2] = inks.to_bytes(self.cols, "big")
+        return bytes(keys)
+
+    def _emit(self, r: int, keys: bytes, old: bytes | None, look, stride: int) -> int:
+        """Write the cells of row r that differ from old into the pad."""
+        if old is None:
+            spans = [(0, len(keys))]
+        else:
+            diff  = (int.from_bytes(keys, "big") ^ int.from_bytes(old, "big")).to_bytes(len(keys), "big")
+            spans = [(m.start() // stride * stride, -(-m.end() // stride) * stride)
+                     for m in _CHANGED.finditer(diff)]
+        n = 0
+        for a, b in spans:
+            if stride == 1:
+                cells = [look[k] for k in keys[a:b]]
+            else:
+                cells = [(_BRAILLE[d], look[i]) for d, i in zip(keys[a:b:2], keys[a + 1:b:2])]
+            x = a // stride
+            for attr, run in groupby(cells, key=lambda cell: cell[1]):
+                text = "".join(ch for ch, _ in run)
+                try:
+                    self._pad.addstr(r, x, text, attr)
+                except curses.error:
+                    pass
+                x += len(text)
+            n += (b - a) // stride
+        return n
+
+
+# ── Tables ────────────────────────────────────────────────────
+class _Tables:
+    """Translate tables for one mode and palette. HALF: high, low — the ink,
+    shifted for the top pixel. BRAILLE: dots[k][c] — the dot a lit pixel makes in
+    pixel row k, column c; inks — a bit per ink."""
+    def __init__(self, mode: str, pal: bytes) -> None:
+        if mode == HALF:
+            self.high = bytes(i << 4 for i in pal)
+            self.low  = pal
+        else:
+            self.dots = [[bytes(bit if i else 0 for i in pal) for bit in bits] for bits in _DOTS]
+            self.inks = bytes(1 << (i - 1) if i else 0 for i in pal)
+
+
+@lru_cache(maxsize=16)
+def _tables(mode: str, pal: bytes) -> _Tables:
+    return _Tables(mode, pal)
+
+
+_BRAILLE = [" "] + [chr(0x2800 + d) for d in range(1, 256)]
+
+_colour_pairs: int | None = None     # 0: no colour; 1: on the default background; 2: any
+
+
+def _colours() -> int:
+    """Set up the raster's colour pairs, once."""
+    global _colour_pairs
+    if _colour_pairs is not None:
+        return _colour_pairs
+    _colour_pairs = 0
+    try:
+        if not curses.has_colors():
+            return 0
+        curses.start_color()
+        curses.use_default_colors()
+    except curses.error:
+        return 0
+    if curses.COLOR_PAIRS < PAIR_BASE + 8:
+        return 0
+    backs = WHITE + 1 if curses.COLOR_PAIRS >= PAIR_BASE + 8 * (WHITE + 1) else 1
+    for bg in range(backs):
+        for fg in range(PLAIN, WHITE + 1):
+            curses.init_pair(_pair(fg, bg), _CURSES[fg], _CURSES[bg])
+    _colour_pairs = 2 if backs > 1 else 1
+    return _colour_pairs
+
+
+def _pair(fg: int, bg: int) -> int:
+    return PAIR_BASE + bg * 8 + fg - 1
+
+
+@lru_cache(maxsize=8)
+def _looks(mode: str, colours: int, attr: int) -> list:
+    """Key → (glyph, attributes) for HALF; inks → attributes for BRAILLE."""
+    def ink(fg: int, bg: int = NONE) -> int:
+        if not colours:
+            return attr
+        return curses.color_pair(_pair(fg, bg if colours == 2 else NONE)) | attr
+
+    if mode == BRAILLE:
+        return [ink(i.bit_length()) if i else 0 for i in range(256)]
+
+    def half(top: int, bot: int) -> tuple[str, int]:
+        if top == bot:
+            return ("\u2588", ink(top)) if top else (" ", 0)   # █
+        if not bot:
+            return "\u2580", ink(top)                          # ▀
+        if not top:
+            return "\u2584", ink(bot)                          # ▄
+        if colours < 2:
+            return "\u2580", ink(top)                          # the bottom is lost
+        if bot == PLAIN:                                      # PLAIN has no background
+            return "\u2584", ink(bot, top)
+        return "\u2580", ink(top, bot)
+
+    return [half(k >> 4, k & 15) if k >> 4 <= WHITE and k & 15 <= WHITE else (" ", 0)
+            for k in range(256)]
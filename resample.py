@@ -0,0 +1,92 @@
+# resample.py
+# Maps a carried substrate field from one level's grid onto another's.
+# Every level sees the same patch of earth at its own resolution — l01 nav is 22×16,
+# l02 bloom 40×14, l03 48×15 — so a map is stretched per axis to the new shape.
+#
+# Separable: rows first, then columns. Each axis picks its own filter:
+#   shrinking  → area average (every destination cell is the mean of what it covers)
+#   growing    → bilinear (cell centres aligned, edges clamped)
+# Tap tables depend only on the shapes, so they are built once per
+# (source shape, destination shape) and reused.
+
+from __future__ import annotations
+from functools import lru_cache
+
+from substrate import SubstrateMap, quality
+
+
+def field(m: SubstrateMap, w: int, h: int) -> list:
+    """Resample m to h rows of w floats, 0.0–1.0."""
+    cols, rows = _plan(m.w, m.h, w, h)
+    scale = 1.0 / 255
+
+    # Horizontal pass — one list per source row.
+    data   = m.data
+    mw     = m.w
+    wide   = []
+    for y in range(m.h):
+        src = data[y * mw:(y + 1) * mw]
+        wide.append([
+            sum(src[i] * wt for i, wt in taps) * scale
+            for taps in cols
+        ])
+
+    # Vertical pass — blend whole rows at once.
+    out = []
+    for taps in rows:
+        if len(taps) == 1:
+            out.append(list(wide[taps[0][0]]))
+            continue
+        acc = [0.0] * w
+        for i, wt in taps:
+            src = wide[i]
+            acc = [a + v * wt for a, v in zip(acc, src)]
+        out.append(acc)
+    return out
+
+
+def resample(m: SubstrateMap, w: int, h: int) -> SubstrateMap:
+    """Resample m to a new w×h map."""
+    if (m.w, m.h) == (w, h):
+        return SubstrateMap(w=w, h=h, data=bytearray(m.data))
+    return SubstrateMap.from_rows(
+        [quality(v) for v in row] for row in field(m, w, h)
+    )
+
+
+# ── Tap tables ────────────────────────────────────────────────
+@lru_cache(maxsize=64)
+def _plan(src_w: int, src_h: int, dst_w: int, dst_h: int) -> tuple:
+    return _axis(src_w, dst_w), _axis(src_h, dst_h)
+
+
+@lru_cache(maxsize=64)
+def _axis(src: int, dst: int) -> tuple:
+    """One tuple of (source index, weight) taps per destination index."""
+    if dst >= src:
+        return tuple(_bilinear(src, dst, i) for i in range(dst))
+    return tuple(_area(src, dst, i) for i in range(dst))
+
+
+def _bilinear(src: int, dst: int, i: int) -> tuple:
+    x  = (i + 0.5) * src / dst - 0.5
+    x  = max(0.0, min(src - 1.0, x))
+    x0 = int(x)
+    t  = x - x0
+    if t == 0.0 or x0 + 1 >= src:
+        return ((x0, 1.0),)
+    return ((x0, 1.0 - t), (x0 + 1, t))
+
+
+def _area(src: int, dst: int, i: int) -> tuple:
+    span = src / dst
+    lo   = i * span
+    hi   = lo + span
+    taps = []
+    j = int(lo)
+    while j < hi and j < src:
+        overlap = min(hi, j + 1) - max(lo, j)
+        if overlap > 1e-9:
+            taps.append((j, overlap / span))
+        j += 1
+    return tuple(taps)
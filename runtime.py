@@ -0,0 +1,186 @@
+# runtime.py
+# The play loop, once, for every level.
+#
+# A level's main.py declares a Level: its phases (what each draws, which keys do
+# what, whether the world ticks, when it moves on), its tick function and rate,
+# its world and view modules, and the line it leaves in carry.dissolved. This
+# module does the rest — resume from the journal, the loop (simulation via
+# simthread, frames via frames, keys via io, messages), the dissolve ceremony
+# and the carry out.
+#
+# Everything a Level's key actions and tick touch must be free of timing: the
+# journal and session replay re-run them with no clock. Timing lives here.
+
+from __future__ import annotations
+import curses
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import frames
+import journal
+import screen as scr
+import session
+import simthread
+import timeline
+from state import CarryState
+
+MSG_DURATION = 8.0     # seconds a message stays visible
+
+WIN_BEAT     = 4.5     # seconds the win message holds
+LINE_BEAT    = 1.5     # seconds per dissolve line
+STILL_BEAT   = 5.0     # final stillness before the carry
+
+
+@dataclass
+class Phase:
+    name:  str
+    draw:  Callable                  # draw(stdscr, ls, msg)
+    keys:  dict = field(default_factory=dict)   # key → action(ls) -> str | None
+    ticks: bool = False              # does the world tick in this phase
+    after: Callable | None = None    # after(ls) -> next phase name or None, after any key
+    # Slow keys: presses closer together than step_interval are dropped.
+    step_keys:     tuple = ()
+    step_interval: float = 0.0
+
+
+@dataclass
+class Level:
+    key:           str               # names the level in carry, maps and snapshots
+    world:         object            # pack_state, unpack_state, serialize_for_carry
+    view:          object            # draw_win, draw_dissolve_line, optional init_colors
+    text:          object            # WIN_MESSAGE, DISSOLVE_LINES, DISSOLVED
+    generate:      Callable          # generate(carry) -> LevelState
+    phases:        list
+    tick:          Callable          # tick(ls) -> message or ''
+    tick_interval: float
+    epitaph:       str               # appended to carry.dissolved
+
+    def __post_init__(self) -> None:
+        self.by_name = {p.name: p for p in self.phases}
+
+    def phase(self, ls) -> Phase:
+        return self.by_name[ls.phase]
+
+    def ticking(self, ls) -> bool:
+        return self.phase(ls).ticks
+
+    def apply_key(self, ls, key: str) -> str:
+        """Apply one key to the world. Returns flavor text, or ''."""
+        phase  = self.phase(ls)
+        action = phase.keys.get(key)
+        m      = (action(ls) or "") if action else ""
+        if phase.after is not None:
+            nxt = phase.after(ls)
+            if nxt:
+                ls.phase = nxt
+        return m
+
+
+def keys(names: tuple, action: Callable) -> dict:
+    """Bind every key in names to one action: {**keys(("w", "UP"), up), ...}."""
+    return dict.fromkeys(names, action)
+
+
+# ── Entry ─────────────────────────────────────────────────────
+def run(level: Level, carry: CarryState) -> CarryState:
+    return curses.wrapper(_run_wrapped, level, carry)
+
+
+def _run_wrapped(stdscr, level: Level, carry: CarryState) -> CarryState:
+    scr.init_screen(stdscr)
+    init_colors(level)
+    ls = journal.recover(level.key, level.world.unpack_state, level.tick, level.apply_key)
+    if ls is None:
+        ls = level.generate(carry)
+    play(level, stdscr, ls, session.live_io(level.world.__package__))
+    return dissolve(level, stdscr, ls, carry)
+
+
+def init_colors(level: Level) -> None:
+    if hasattr(level.view, "init_colors"):
+        level.view.init_colors()
+
+
+# ── The loop ──────────────────────────────────────────────────
+def play(level: Level, stdscr, ls, io) -> None:
+    """Run until the level is won. stdscr=None plays headless, for replay."""
+    msg       = ""
+    msg_at    = 0.0
+    frame     = frames.FrameClock()
+    last_step = {}                     # phase name → clock value of its last slow key
+    now       = io.now()
+    jr        = io.open_journal(level.key, level.world.pack_state, ls, now)
+    sim       = simthread.start(io, ls, jr, _timed(level.tick), level.apply_key,
+                                level.tick_interval, level.ticking, now)
+
+    while True:
+        now = io.now()
+
+        # ── Simulation ────────────────────────────────────────
+        m = sim.update(now)
+        if sim.won:
+            sim.close()
+            io.close(ls)
+            return
+        if m:
+            msg, msg_at = m, now
+        view_ls = sim.view    # this thread's alone to read — see simthread.py
+        phase   = level.phase(view_ls)
+
+        # ── Render ────────────────────────────────────────────
+        if stdscr is not None and frame.due(now, sim.next_tick()):
+            frame.begin(now)
+            phase.draw(stdscr, view_ls, msg if now - msg_at <= MSG_DURATION else "")
+            frame.end()
+
+        # ── Input ─────────────────────────────────────────────
+        for key in io.keys(stdscr):
+            if key in phase.step_keys:
+                if now - last_step.get(phase.name, 0.0) < phase.step_interval:
+                    continue
+                last_step[phase.name] = now
+            m = sim.key(key, now)
+            if m:
+                msg, msg_at = m, now
+
+        sim.idle(now)
+        io.idle()
+
+
+def _timed(tick: Callable) -> Callable:
+    """tick, with its cost shown in the debug overlay."""
+    cost = [0.0]
+
+    def timed(ls) -> str:
+        t0 = time.perf_counter()
+        m  = tick(ls)
+        cost[0] += 0.2 * (time.perf_counter() - t0 - cost[0])
+        scr.note("tick", f"tick {cost[0] * 1000:.1f}ms")
+        return m
+    return timed
+
+
+# ── Dissolve ──────────────────────────────────────────────────
+def dissolve(level: Level, stdscr, ls, carry: CarryState) -> CarryState:
+    timeline.run(stdscr, _dissolution, level)
+
+    data = level.world.serialize_for_carry(ls)
+    carry.maps[level.key] = data.pop("map")
+    carry.substrate[level.key] = data
+    carry.origin_x = data["origin_x"]
+    carry.origin_y = data["origin_y"]
+    carry.dissolved.append(level.epitaph)
+    return carry
+
+
+def _dissolution(h: int, w: int, rng, level: Level):
+    """Win beat, the dissolve lines, final stillness — a timeline."""
+    view, txt = level.view, level.text
+    yield "win"
+    yield (lambda win: view.draw_win(win, txt.WIN_MESSAGE)), WIN_BEAT
+    yield "dissolve"
+    for line in txt.DISSOLVE_LINES:
+        yield (lambda win, line=line: view.draw_dissolve_line(win, line)), LINE_BEAT
+    yield "still"
+    yield (lambda win: view.draw_dissolve_line(win, txt.DISSOLVED)), STILL_BEAT
@@ -1,8 +1,28 @@
 # screen.py
 # Shared curses utilities. Monochrome-first — no color pairs for level 1.
 # Later levels can call curses.start_color() and extend as needed.
+#
+# Output metering: start_meter() puts a pty between curses and the real terminal
+# and relays both ways, counting every byte curses emits. Views end each frame
+# with present(), which refreshes and books the frame's bytes. When the link to the
+# terminal is the bottleneck (the relay spends most of its time blocked writing)
+# and throughput is under LOW_BPS, low-bandwidth mode comes on: frame_interval()
+# stretches, and views drop decorative layers and keep attributes steady so
+# curses emits fewer escape sequences. MANDALA_DEBUG=1 shows the meter on screen,
+# along with anything other modules note().
 
+import atexit
 import curses
+import fcntl
+import os
+import select
+import signal
+import struct
+import termios
+import threading
+import time
+import tty
+from collections import deque
 
 
 def init_screen(stdscr) -> None:
@@ -29,6 +49,54 @@ def get_key(stdscr) -> str:
     return str(key)
 
 
+# ── Input queue ───────────────────────────────────────────────
+# A held arrow key auto-repeats faster than a slow frame can use it. get_keys
+# drains everything waiting each loop iteration; movement past MOVE_BUDGET in one
+# drain is stale repeat and goes — the newest moves are the ones kept, so letting
+# go stops the player at once and a reversal is never lost. Other keys all pass.
+MOVE_KEYS   = frozenset({"w", "a", "s", "d", "UP", "DOWN", "LEFT", "RIGHT"})
+MOVE_BUDGET = 2        # movement keys applied per loop iteration (≤ one frame)
+DRAIN_MAX   = 64       # keys read per drain, at most
+
+_key_at: float | None = None             # when the oldest undrawn key was read
+_latency = deque(maxlen=256)             # key → present() seconds, newest last
+
+
+def get_keys(stdscr) -> list:
+    """Every key waiting, movement trimmed to MOVE_BUDGET."""
+    global _key_at
+    keys = []
+    for _ in range(DRAIN_MAX):
+        key = get_key(stdscr)
+        if not key:
+            break
+        keys.append(key)
+    if keys and _key_at is None:
+        _key_at = time.monotonic()
+    return coalesce(keys)
+
+
+def coalesce(keys: list, budget: int = MOVE_BUDGET) -> list:
+    moves = sum(1 for k in keys if k in MOVE_KEYS)
+    drop  = moves - budget
+    out   = []
+    for k in keys:
+        if k in MOVE_KEYS and drop > 0:
+            drop -= 1
+            continue
+        out.append(k)
+    return out
+
+
+def latency() -> tuple[float, float, float] | None:
+    """(p50, p99, max) seconds from reading a key to the next present(), recent keys."""
+    if not _latency:
+        return None
+    ordered = sorted(_latency)
+    n = len(ordered)
+    return ordered[n // 2], ordered[min(n - 1, n * 99 // 100)], ordered[-1]
+
+
 def addstr(win, y: int, x: int, text: str,
            bold: bool = False, dim: bool = False) -> None:
     try:
@@ -51,3 +119,218 @@ def _attr(bold: bool, dim: bool) -> int:
     if dim:
         return curses.A_DIM
     return curses.A_NORMAL
+
+
+# ── Camera ────────────────────────────────────────────────────
+def camera(x: int, y: int, vw: int, vh: int,
+           world_w: int, world_h: int) -> tuple[int, int, int, int]:
+    """(world x, world y) of a vw × vh view's corner, and its screen offset, for
+    a world bigger than the screen with the player at (x, y). The view turns a
+    half page at a time as the player nears its edge — the player moves across
+    a still screen, not the screen under a still player. Centred on an axis
+    where the view is bigger than the world."""
+    def axis(p: int, view: int, world: int) -> tuple[int, int]:
+        if view >= world:
+            return 0, (view - world) // 2
+        step = max(1, view // 2)
+        return max(0, min(world - view, p // step * step - step // 2)), 0
+    x0, ox = axis(x, vw, world_w)
+    y0, oy = axis(y, vh, world_h)
+    return x0, y0, ox, oy
+
+
+# ── Output metering ───────────────────────────────────────────
+METER_ENV  = "MANDALA_METER"    # "1" always meter, "0" never; unset meters over ssh
+LOWBW_ENV  = "MANDALA_LOWBW"    # "1" forces low-bandwidth mode
+DEBUG_ENV  = "MANDALA_DEBUG"    # "1" draws the meter overlay
+
+LOW_BPS            = 64_000     # bytes/s — a saturated link slower than this is "low"
+SATURATED          = 0.5        # fraction of a window spent blocked on the terminal
+CALM               = 0.1        # ... below which the link has room again
+LOW_HOLD           = 30.0       # seconds low mode stays on before trying full output
+LOW_FRAME_INTERVAL = 0.2        # ~5 fps while low
+WINDOW             = 1.0        # seconds per throughput sample
+
+
+class _Relay:
+    """curses ↔ pty ↔ this thread ↔ the real terminal, with byte counts."""
+
+    def __init__(self) -> None:
+        self.real_in  = os.dup(0)
+        self.real_out = os.dup(1)
+        self.master, slave = os.openpty()
+        termios.tcsetattr(slave, termios.TCSANOW, termios.tcgetattr(self.real_out))
+        self.size = _winsize(self.real_out)
+        fcntl.ioctl(slave, termios.TIOCSWINSZ, self.size)
+        self.saved = termios.tcgetattr(self.real_in)
+        # The real terminal passes bytes through untouched; the pty's line
+        # discipline does whatever cooking curses asks for.
+        tty.setraw(self.real_in)
+        os.dup2(slave, 0)
+        os.dup2(slave, 1)
+        os.close(slave)
+
+        self.total    = 0           # bytes read from curses so far
+        self.rate     = 0.0         # bytes/s delivered, last window
+        self.busy     = 0.0         # fraction of the last window blocked writing
+        self.low      = False
+        self.low_at   = 0.0
+        self._sent    = 0
+        self._blocked = 0.0
+        self._window  = time.monotonic()
+        self._stop    = False
+        self._thread  = threading.Thread(target=self._run, name="meter", daemon=True)
+        self._thread.start()
+
+    def pending(self) -> int:
+        """Bytes curses has written that the relay hasn't picked up yet."""
+        try:
+            n = fcntl.ioctl(self.master, termios.FIONREAD, b"\0\0\0\0")
+        except OSError:
+            return 0
+        return struct.unpack("i", n)[0]
+
+    def _run(self) -> None:
+        while not self._stop:
+            try:
+                ready, _, _ = select.select([self.master, self.real_in], [], [], 0.1)
+            except InterruptedError:
+                continue
+            if self.master in ready:
+                self._relay_out()
+            if self.real_in in ready:
+                self._relay_in()
+            self._check_size()
+            self._sample()
+
+    def _relay_out(self) -> None:
+        try:
+            data = os.read(self.master, 65536)
+        except OSError:
+            self._stop = True
+            return
+        self.total += len(data)
+        t0 = time.monotonic()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.real_out, view):]
+        self._blocked += time.monotonic() - t0
+        self._sent    += len(data)
+
+    def _relay_in(self) -> None:
+        data = os.read(self.real_in, 1024)
+        if not data:
+            self._stop = True
+            return
+        # The pty isn't our controlling terminal, so it can't signal us: do it here.
+        attrs = termios.tcgetattr(0)
+        if attrs[3] & termios.ISIG and attrs[6][termios.VINTR] in data:
+            os.kill(os.getpid(), signal.SIGINT)
+        os.write(self.master, data)
+
+    def _check_size(self) -> None:
+        size = _winsize(self.real_out)
+        if size != self.size:
+            self.size = size
+            fcntl.ioctl(0, termios.TIOCSWINSZ, size)
+            # curses saw the terminal's SIGWINCH before the pty had the new size.
+            os.kill(os.getpid(), signal.SIGWINCH)
+
+    def _sample(self) -> None:
+        now     = time.monotonic()
+        elapsed = now - self._window
+        if elapsed < WINDOW:
+            return
+        self.rate = self._sent / elapsed
+        self.busy = min(1.0, self._blocked / elapsed)
+        self._sent, self._blocked, self._window = 0, 0.0, now
+        if not self.low and self.busy >= SATURATED and self.rate < LOW_BPS:
+            self.low, self.low_at = True, now
+        elif self.low and self.busy < CALM and now - self.low_at >= LOW_HOLD:
+            self.low = False
+
+    def close(self) -> None:
+        self._stop = True
+        self._thread.join(timeout=1.0)
+        while self.pending():
+            self._relay_out()
+        os.dup2(self.real_in, 0)
+        os.dup2(self.real_out, 1)
+        termios.tcsetattr(self.real_in, termios.TCSADRAIN, self.saved)
+        for fd in (self.master, self.real_in, self.real_out):
+            os.close(fd)
+
+
+def _winsize(fd: int) -> bytes:
+    return fcntl.ioctl(fd, termios.TIOCGWINSZ, b"\0" * 8)
+
+
+_relay: _Relay | None = None
+_frame_bytes = 0
+_last_total  = 0
+_notes: dict = {}    # extra overlay items, by name
+
+
+def start_meter() -> bool:
+    """Put the byte meter in front of the terminal, if it's wanted and possible.
+    Call before curses starts. Returns whether metering is on."""
+    global _relay
+    if _relay is not None:
+        return True
+    want = os.environ.get(METER_ENV)
+    if want == "0" or (want != "1" and not os.environ.get("SSH_CONNECTION")):
+        return False
+    if not (os.isatty(0) and os.isatty(1)):
+        return False
+    _relay = _Relay()
+    atexit.register(stop_meter)
+    return True
+
+
+def stop_meter() -> None:
+    global _relay
+    if _relay is not None:
+        _relay.close()
+        _relay = None
+
+
+def low_bandwidth() -> bool:
+    return os.environ.get(LOWBW_ENV) == "1" or (_relay is not None and _relay.low)
+
+
+def frame_interval(base: float) -> float:
+    """Seconds between frames: base, stretched while the link is struggling."""
+    return max(base, LOW_FRAME_INTERVAL) if low_bandwidth() else base
+
+
+def present(win) -> None:
+    """End a frame: the overlay if asked for, the refresh, the byte count."""
+    global _frame_bytes, _last_total, _key_at
+    if os.environ.get(DEBUG_ENV) == "1":
+        _draw_overlay(win)
+    win.refresh()
+    if _key_at is not None:
+        _latency.append(time.monotonic() - _key_at)
+        _key_at = None
+        p50, p99, _ = latency()
+        note("lat", f"key {p50 * 1000:.0f}/{p99 * 1000:.0f}ms")
+    if _relay is not None:
+        total = _relay.total + _relay.pending()
+        _frame_bytes, _last_total = total - _last_total, total
+
+
+def note(name: str, value: str) -> None:
+    """Show value in the debug overlay under name, replacing what was there."""
+    _notes[name] = value
+
+
+def _draw_overlay(win) -> None:
+    if _relay is None:
+        line = " meter off"
+    else:
+        line = (f" {_frame_bytes}B/f {_relay.rate / 1024:.1f}kB/s"
+                f" busy {_relay.busy:.0%}")
+    line += "".join(f" {v}" for v in _notes.values())
+    line += (" low" if low_bandwidth() else "") + " "
+    _, w = win.getmaxyx()
+    addstr(win, 0, max(0, w - len(line) - 1), line, bold=True)
@@ -0,0 +1,307 @@
+# session.py
+# Deterministic input recording and max-speed replay.
+#
+# Every level's play loop reads time, keys and pauses through an io object:
+#   LiveIO   — the real clock, the real keyboard, the real journal
+#   RecordIO — LiveIO that also writes a session file
+#   ReplayIO — a recorded session played back with a virtual clock
+#
+# A session file holds the level's packed starting state and full rng state, then one
+# event per key the loop applied, and one per tick that came without a key, each
+# stamped with the exact clock value the loop saw. Replay feeds those same
+# clock values back, jumping straight from one event to the next, so every tick
+# and every gating decision falls exactly where it did live. Nothing waits.
+#
+# Record:  MANDALA_RECORD=<dir> python3 launcher.py
+# Replay:  python3 session.py <file> [--render]
+# Replay prints a checksum of the final LevelState and of serialize_for_carry.
+# Recording leaves the live run's checksum in <file>.sum; replay compares the two.
+
+from __future__ import annotations
+import curses
+import hashlib
+import importlib
+import json
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import journal
+import runtime
+import screen as scr
+import snapshot
+
+RECORD_ENV = "MANDALA_RECORD"
+SUM_EXT    = ".sum"      # recorded run's final checksum, beside the session file
+IDLE_MS    = 10          # live pause per loop iteration
+
+MAGIC   = b"MSR1"
+_EVENT  = struct.Struct("<dB")   # clock value, key length — followed by the key's utf-8
+_TICKED = 0xFF                   # key length marking a tick with no key
+
+
+# ── Live ──────────────────────────────────────────────────────
+class LiveIO:
+    threadable = True     # see simthread.py
+
+    def open_journal(self, key: str, pack, ls, now: float):
+        return journal.Journal(key, pack, ls, now)
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def keys(self, stdscr) -> list:
+        return scr.get_keys(stdscr)
+
+    def idle(self) -> None:
+        curses.napms(IDLE_MS)
+
+    def close(self, ls) -> None:
+        pass
+
+
+class RecordIO(LiveIO):
+    """Live play that writes every key and tick, with its clock value, to path."""
+
+    threadable = False    # a session's clock values must be the loop's own
+
+    def __init__(self, path: str, module: str) -> None:
+        self.path   = path
+        self.module = module
+        self.buf    = bytearray()
+        self.f      = None
+        self._now   = 0.0
+        self._keys  = []
+        self._tick  = False
+
+    def open_journal(self, key: str, pack, ls, now: float):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.f = open(self.path, "wb")
+        self.f.write(_header(self.module, pack(ls), snapshot.pack_rng(ls.rng), now))
+        return _TappedJournal(self, key, pack, ls, now)
+
+    def now(self) -> float:
+        self._now = time.monotonic()
+        return self._now
+
+    def keys(self, stdscr) -> list:
+        self._keys = scr.get_keys(stdscr)
+        return self._keys
+
+    def idle(self) -> None:
+        self._take()
+        if len(self.buf) >= 4096:
+            self._write()
+        super().idle()
+
+    def close(self, ls) -> None:
+        self._take()
+        self._write()
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+        # The screen is still up, so the checksum goes beside the file, not to stdout.
+        with open(self.path + SUM_EXT, "w") as f:
+            f.write(checksum(self.module, ls) + "\n")
+
+    def _take(self) -> None:
+        """Turn this iteration's keys and tick into events, if anything happened.
+        Several keys in one iteration become several events with the same clock
+        value; replay hands them back as one batch, so no tick lands between them."""
+        if self._tick and not self._keys:
+            self.buf += _EVENT.pack(self._now, _TICKED)
+        for key in self._keys:
+            raw = key.encode()[:254]
+            self.buf += _EVENT.pack(self._now, len(raw)) + raw
+        self._keys, self._tick = [], False
+
+    def _write(self) -> None:
+        if self.f is not None and self.buf:
+            self.f.write(self.buf)
+            self.f.flush()
+            self.buf.clear()
+
+
+class _TappedJournal(journal.Journal):
+    def __init__(self, rec: RecordIO, *args) -> None:
+        self.rec = rec
+        super().__init__(*args)
+
+    def tick(self) -> None:
+        super().tick()
+        self.rec._tick = True
+
+
+def live_io(module: str) -> LiveIO:
+    """RecordIO if MANDALA_RECORD names a directory, else LiveIO."""
+    directory = os.environ.get(RECORD_ENV)
+    if not directory:
+        return LiveIO()
+    name = f"{module.rsplit('.', 1)[-1]}-{time.strftime('%Y%m%d-%H%M%S')}.session"
+    return RecordIO(os.path.join(directory, name), module)
+
+
+# ── Replay ────────────────────────────────────────────────────
+class ReplayFinished(Exception):
+    pass
+
+
+class ReplayIO:
+    """Plays a session back. The clock only moves when an event is due."""
+
+    def __init__(self, start: float, events: list) -> None:
+        self.t      = start
+        self.events = events
+        self.next   = 0
+        self.ticks  = 0
+        self._keys  = []
+
+    def open_journal(self, key: str, pack, ls, now: float):
+        return _CountingJournal(self)    # the live journal is never touched
+
+    def now(self) -> float:
+        return self.t
+
+    def keys(self, stdscr) -> list:
+        keys, self._keys = self._keys, []
+        return keys
+
+    def idle(self) -> None:
+        if self.next >= len(self.events):
+            raise ReplayFinished
+        # Events sharing a clock value were one live iteration's keys.
+        self.t = self.events[self.next][0]
+        while self.next < len(self.events) and self.events[self.next][0] == self.t:
+            key = self.events[self.next][1]
+            if key:
+                self._keys.append(key)
+            self.next += 1
+
+    def close(self, ls) -> None:
+        pass
+
+
+class _CountingJournal:
+    def __init__(self, io: ReplayIO) -> None:
+        self.io = io
+
+    def tick(self) -> None:
+        self.io.ticks += 1
+
+    def key_event(self, key: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def poll(self, ls, now: float) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def load(path: str) -> tuple:
+    """(module, packed state, rng, start clock, events) from a session file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError("not a session file")
+    u = snapshot.Unpacker(data[4:])
+    module = u.blob().decode()
+    body   = u.blob()
+    rng    = snapshot.unpack_rng(u.blob())
+    start  = u.one("d")
+    pos    = 4 + u.pos
+    events = []
+    while pos + _EVENT.size <= len(data):
+        t, n = _EVENT.unpack_from(data, pos)
+        pos += _EVENT.size
+        if n == _TICKED:
+            events.append((t, ""))
+            continue
+        if pos + n > len(data):
+            break
+        events.append((t, data[pos:pos + n].decode()))
+        pos += n
+    return module, body, rng, start, events
+
+
+def replay(path: str, render: bool = False) -> dict:
+    """Re-drive a recorded level headlessly (or on this terminal with render=True)."""
+    module, body, rng, start, events = load(path)
+    main  = importlib.import_module(module + ".main")
+    world = importlib.import_module(module + ".world")
+    ls     = world.unpack_state(body)
+    ls.rng = rng
+    io     = ReplayIO(start, events)
+
+    t0 = time.perf_counter()
+    if render:
+        curses.wrapper(_replay_wrapped, main, ls, io)
+    else:
+        _drive(main, None, ls, io)
+    elapsed = time.perf_counter() - t0
+
+    expected = None
+    if os.path.exists(path + SUM_EXT):
+        with open(path + SUM_EXT) as f:
+            expected = f.read().strip()
+
+    result = {
+        "module":   module,
+        "events":   len(events),
+        "ticks":    io.ticks,
+        "seconds":  round(elapsed, 3),
+        "recorded": round(io.t - start, 3),
+        "won":      ls.won,
+        "checksum": checksum(module, ls),
+    }
+    if expected is not None:
+        result["matches"] = result["checksum"] == expected
+    return result
+
+
+def _replay_wrapped(stdscr, main, ls, io) -> None:
+    scr.init_screen(stdscr)
+    runtime.init_colors(main.LEVEL)
+    _drive(main, stdscr, ls, io)
+
+
+def _drive(main, stdscr, ls, io) -> None:
+    try:
+        runtime.play(main.LEVEL, stdscr, ls, io)
+    except ReplayFinished:
+        pass
+
+
+def checksum(module: str, ls) -> str:
+    """sha256 over the final LevelState and what it would carry forward."""
+    world = importlib.import_module(module + ".world")
+    h = hashlib.sha256()
+    h.update(world.pack_state(ls))
+    h.update(snapshot.pack_rng(ls.rng))
+    data = world.serialize_for_carry(ls)
+    m    = data.pop("map", None)
+    h.update(json.dumps(data, sort_keys=True).encode())
+    if m is not None:
+        h.update(bytes(m.data))
+    return h.hexdigest()[:16]
+
+
+def _header(module: str, body: bytes, rng: bytes, start: float) -> bytes:
+    p = snapshot.Packer()
+    p.blob(module.encode()).blob(body).blob(rng).put("d", start)
+    return MAGIC + p.bytes()
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 1:
+        print("usage: session.py <file.session> [--render]", file=sys.stderr)
+        sys.exit(2)
+    result = replay(args[0], render="--render" in sys.argv)
+    print(json.dumps(result, indent=2))
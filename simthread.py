@@ -0,0 +1,170 @@
+# simthread.py
+# Where a level's simulation runs: on the play loop's thread, or on its own.
+#
+# Both steppers take the same pieces from a level — its LevelState, journal,
+# tick(ls) and apply_key(ls, key), the tick interval and a ticking(ls) test — and
+# give the play loop the same handful of calls. The loop renders sim.view.
+#
+#   Inline    — ticks when the loop comes round, exactly as before. The default,
+#               and the only mode recording and replay use: its timing is the loop's.
+#   Threaded  — MANDALA_THREADED=1. A sim thread owns the LevelState: it applies
+#               keys, runs ticks on a steady deadline cadence, writes the journal.
+#               After every change it publishes a deep copy as sim.view. The copy
+#               is never touched again by anyone, so the renderer can't see a
+#               colony or grid half way through a tick. A stalled refresh delays
+#               the next frame, not the next tick.
+
+from __future__ import annotations
+import copy
+import os
+import threading
+import time
+from collections import deque
+
+THREAD_ENV = "MANDALA_THREADED"
+POLL       = 0.25      # longest the sim thread sleeps, so checkpoints still happen
+
+
+def start(io, ls, jr, tick, apply_key, interval: float, ticking, now: float):
+    """Threaded if asked for and io allows it (recording and replay don't), else Inline."""
+    if os.environ.get(THREAD_ENV) == "1" and getattr(io, "threadable", False):
+        return Threaded(ls, jr, tick, apply_key, interval, ticking, now)
+    return Inline(ls, jr, tick, apply_key, interval, ticking, now)
+
+
+class Inline:
+    def __init__(self, ls, jr, tick, apply_key, interval: float, ticking, now: float) -> None:
+        self.view      = ls
+        self.jr        = jr
+        self.tick      = tick
+        self.apply_key = apply_key
+        self.interval  = interval
+        self.ticking   = ticking
+        self.last_tick = now
+
+    @property
+    def won(self) -> bool:
+        return self.view.won
+
+    def update(self, now: float) -> str:
+        """Tick if one is due. Returns a message to show, or ''."""
+        if not self.ticking(self.view) or now - self.last_tick < self.interval:
+            return ""
+        self.jr.tick()
+        m = self.tick(self.view)
+        self.last_tick = now
+        return m
+
+    def next_tick(self) -> float | None:
+        return self.last_tick + self.interval if self.ticking(self.view) else None
+
+    def key(self, key: str, now: float) -> str:
+        self.jr.key_event(key)
+        return self.apply_key(self.view, key)
+
+    def idle(self, now: float) -> None:
+        self.jr.flush()
+        self.jr.poll(self.view, now)
+
+    def close(self) -> None:
+        self.jr.close()
+
+
+class Threaded:
+    def __init__(self, ls, jr, tick, apply_key, interval: float, ticking, now: float) -> None:
+        self.ls        = ls              # the sim thread's from here on
+        self.jr        = jr
+        self.tick      = tick
+        self.apply_key = apply_key
+        self.interval  = interval
+        self.ticking   = ticking
+        self.view      = _freeze(ls)
+        self.won       = False
+        self.error     = None
+        self._keys     = deque()
+        self._msg      = ""
+        self._cond     = threading.Condition()
+        self._stop     = False
+        self._thread   = threading.Thread(target=self._run, name="sim", daemon=True)
+        self._thread.start()
+
+    # ── Play loop side ────────────────────────────────────────
+    def update(self, now: float) -> str:
+        if self.error is not None:
+            raise self.error
+        with self._cond:
+            m, self._msg = self._msg, ""
+        return m
+
+    def next_tick(self) -> float | None:
+        return None                      # ticks don't wait on frames here
+
+    def key(self, key: str, now: float) -> str:
+        with self._cond:
+            self._keys.append(key)
+            self._cond.notify()
+        return ""                        # any message arrives through update()
+
+    def idle(self, now: float) -> None:
+        pass
+
+    def close(self) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        self._thread.join()
+
+    # ── Sim thread ────────────────────────────────────────────
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.jr.close()
+
+    def _loop(self) -> None:
+        ls  = self.ls
+        due = time.monotonic() + self.interval
+        while True:
+            with self._cond:
+                while not (self._stop or self._keys):
+                    now = time.monotonic()
+                    if not self.ticking(ls):
+                        due = now + self.interval
+                    elif now >= due:
+                        break
+                    self._cond.wait(min(POLL, max(0.0, due - now)))
+                if self._stop:
+                    return
+                keys = list(self._keys)
+                self._keys.clear()
+
+            for key in keys:
+                self.jr.key_event(key)
+                self._post(self.apply_key(ls, key))
+
+            now = time.monotonic()
+            if self.ticking(ls) and now >= due:
+                self.jr.tick()
+                self._post(self.tick(ls))
+                # Keep the cadence: the next tick is due from when this one was due,
+                # unless we've fallen a whole tick behind — then don't burst.
+                due = due + self.interval if now - due < self.interval else now + self.interval
+
+            self.jr.flush()
+            self.jr.poll(ls, now)
+            self.view = _freeze(ls)
+            if ls.won:
+                self.won = True
+                return
+
+    def _post(self, m: str) -> None:
+        if m:
+            with self._cond:
+                self._msg = m
+
+
+def _freeze(ls):
+    """A private deep copy for the renderer. The rng stays behind — views don't roll."""
+    return copy.deepcopy(ls, {id(ls.rng): None})
@@ -0,0 +1,181 @@
+# snapshot.py
+# Mid-level save and resume. A level's LevelState, packed small.
+#
+# Only one level is ever in progress, so there is one snapshot file. It names the
+# level it belongs to; a level asking for its snapshot gets None if the file is
+# someone else's. Each world module provides pack_state(ls) -> bytes and
+# unpack_state(bytes) -> LevelState built from the helpers below: bit-packed bool
+# grids, uint8 tile grids, length-prefixed arrays.
+#
+# Packing happens on the UI thread (it is a few hundred bytes); writing happens on
+# the persist writer thread. journal.py decides when to take one.
+
+from __future__ import annotations
+import os
+import random
+import struct
+import zlib
+
+import persist
+
+SNAP_PATH         = os.path.expanduser("~/.mandala/level.snap")
+AUTOSAVE_INTERVAL = 5.0    # seconds between checkpoints during play
+
+# header: magic, key length, crc32 of everything after the header
+MAGIC   = b"MSS1"
+_HEADER = struct.Struct("<4sBI")
+
+
+# ── File ──────────────────────────────────────────────────────
+def save(key: str, body: bytes) -> None:
+    """Queue body as the snapshot for level key."""
+    tail = key.encode() + body
+    persist.writer.submit(SNAP_PATH, _HEADER.pack(MAGIC, len(key), zlib.crc32(tail)) + tail)
+
+
+def load(key: str) -> bytes | None:
+    """Snapshot body for level key, or None if there isn't a usable one."""
+    found = persist.read_with_fallback(SNAP_PATH, _parse)
+    if found is None or found[0] != key:
+        return None
+    return found[1]
+
+
+def exists() -> bool:
+    return peek() is not None
+
+
+def peek() -> str | None:
+    """Key of the level the snapshot belongs to."""
+    persist.writer.flush()
+    found = persist.read_with_fallback(SNAP_PATH, _parse)
+    return found[0] if found else None
+
+
+def clear() -> None:
+    persist.writer.remove(SNAP_PATH)
+
+
+def _parse(blob: bytes) -> tuple[str, bytes]:
+    if len(blob) < _HEADER.size:
+        raise ValueError("snapshot truncated")
+    magic, klen, crc = _HEADER.unpack_from(blob)
+    tail = blob[_HEADER.size:]
+    if magic != MAGIC or zlib.crc32(tail) != crc:
+        raise ValueError("snapshot corrupt")
+    try:
+        key = tail[:klen].decode()
+    except UnicodeDecodeError:
+        raise ValueError("snapshot corrupt") from None
+    return key, tail[klen:]
+
+
+# ── Packing helpers ───────────────────────────────────────────
+class Packer:
+    def __init__(self) -> None:
+        self.buf = bytearray()
+
+    def put(self, fmt: str, *values) -> Packer:
+        self.buf += struct.pack("<" + fmt, *values)
+        return self
+
+    def blob(self, data: bytes) -> Packer:
+        self.buf += struct.pack("<I", len(data)) + data
+        return self
+
+    def bytes(self) -> bytes:
+        return bytes(self.buf)
+
+
+class Unpacker:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos  = 0
+
+    def get(self, fmt: str) -> tuple:
+        s = struct.Struct("<" + fmt)
+        values = s.unpack_from(self.data, self.pos)
+        self.pos += s.size
+        return values
+
+    def one(self, fmt: str):
+        return self.get(fmt)[0]
+
+    def blob(self) -> bytes:
+        n = self.one("I")
+        if self.pos + n > len(self.data):
+            raise ValueError("snapshot blob overruns the body")
+        data = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return data
+
+
+def pack_bits(rows) -> bytes:
+    """Rows of bools → one bit per cell, row-major, LSB first."""
+    out  = bytearray()
+    acc  = 0
+    nbit = 0
+    for row in rows:
+        for cell in row:
+            if cell:
+                acc |= 1 << nbit
+            nbit += 1
+            if nbit == 8:
+                out.append(acc)
+                acc, nbit = 0, 0
+    if nbit:
+        out.append(acc)
+    return bytes(out)
+
+
+def unpack_bits(data: bytes, w: int, h: int) -> list:
+    if len(data) < (w * h + 7) // 8:
+        raise ValueError("bit grid truncated")
+    return [
+        [bool(data[(y * w + x) >> 3] >> ((y * w + x) & 7) & 1) for x in range(w)]
+        for y in range(h)
+    ]
+
+
+def pack_grid(rows) -> bytes:
+    """Rows of ints 0–255 → uint8 tiles, row-major."""
+    out = bytearray()
+    for row in rows:
+        out += bytes(row)
+    return bytes(out)
+
+
+def unpack_grid(data: bytes, w: int, h: int) -> list:
+    if len(data) != w * h:
+        raise ValueError("tile grid has the wrong size")
+    return [list(data[y * w:(y + 1) * w]) for y in range(h)]
+
+
+def pack_set(values, universe) -> int:
+    """A set drawn from a fixed sequence → bitmask by position."""
+    return sum(1 << i for i, v in enumerate(universe) if v in values)
+
+
+def unpack_set(mask: int, universe) -> set:
+    return {v for i, v in enumerate(universe) if mask >> i & 1}
+
+
+_RNG_WORDS = 625   # Mersenne Twister state: 624 words + position
+
+
+def pack_rng(rng: random.Random) -> bytes:
+    """Full generator state, so a restored world rolls exactly what the live one would."""
+    version, words, gauss = rng.getstate()
+    return struct.pack(f"<B{_RNG_WORDS}I?d", version, *words,
+                       gauss is not None, gauss or 0.0)
+
+
+def unpack_rng(data: bytes) -> random.Random:
+    fmt = f"<B{_RNG_WORDS}I?d"
+    if len(data) != struct.calcsize(fmt):
+        raise ValueError("rng state has the wrong size")
+    version, *rest = struct.unpack(fmt, data)
+    words, has_gauss, gauss = tuple(rest[:_RNG_WORDS]), rest[-2], rest[-1]
+    rng = random.Random()
+    rng.setstate((version, words, gauss if has_gauss else None))
+    return rng
@@ -5,9 +5,14 @@
 from __future__ import annotations
 import json
 import os
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+
+import persist
+import substrate
 
 SAVE_PATH = os.path.expanduser("~/.mandala/carry.json")
+MAP_DIR   = os.path.expanduser("~/.mandala/maps")
+MAP_EXT   = ".map"
 
 
 @dataclass
@@ -24,24 +29,101 @@ class CarryState:
     # Keyed by level name; each entry is level-specific data.
     substrate: dict = field(default_factory=dict)
 
-    # Dissolution records — a trace that each mandala happened.
+    # Per-tile conditioned ground, keyed like substrate. SubstrateMap values.
+    # Stored beside carry.json in MAP_DIR, never inside it.
+    maps: dict = field(default_factory=dict)
+
+    # Which pass through the levels this is. Completed cycles move to history.py.
+    cycle: int = 0
+
+    # Dissolution records for the current cycle — a trace that each mandala happened.
     # Not used mechanically. The world noticing itself.
     dissolved: list[str] = field(default_factory=list)
 
 
+# Fields that live outside the json file.
+_BINARY_FIELDS = {"maps"}
+
+# Expected json types — anything else means the file is not a carry state.
+_FIELD_TYPES = {
+    "level_index": int,
+    "cycle":       int,
+    "origin_x":    (int, float),
+    "origin_y":    (int, float),
+    "substrate":   dict,
+    "dissolved":   list,
+}
+
+
 def load_carry() -> CarryState:
-    if os.path.exists(SAVE_PATH):
-        with open(SAVE_PATH) as f:
-            data = json.load(f)
-        cs = CarryState()
+    """Newest valid carry file, else the previous good copy, else a fresh start."""
+    persist.writer.flush()   # a save still in flight is newer than anything on disk
+    cs   = CarryState()
+    data = persist.read_with_fallback(SAVE_PATH, _parse_carry)
+    if data:
         for k, v in data.items():
-            if hasattr(cs, k):
+            if hasattr(cs, k) and k not in _BINARY_FIELDS:
                 setattr(cs, k, v)
-        return cs
-    return CarryState()
+    cs.maps = _load_maps()
+    return cs
 
 
 def save_carry(cs: CarryState) -> None:
-    os.makedirs(os.path.dirname(SAVE_PATH), exist_ok=True)
-    with open(SAVE_PATH, "w") as f:
-        json.dump(asdict(cs), f, indent=2)
+    """Queue the carry state for writing and return immediately.
+    The json is encoded here — it's small — so later changes to cs can't leak
+    into this save; map encoding and all disk work happen on the writer thread."""
+    data = {f.name: getattr(cs, f.name) for f in fields(cs)
+            if f.name not in _BINARY_FIELDS}
+    blob = json.dumps(data, separators=(",", ":")).encode()
+    _save_maps(cs.maps)
+    persist.writer.submit(SAVE_PATH, blob)
+
+
+def flush_carry() -> None:
+    """Block until every queued save is on disk."""
+    persist.writer.flush()
+
+
+def _parse_carry(blob: bytes) -> dict:
+    try:
+        data = json.loads(blob)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"carry unreadable: {e}") from None
+    if not isinstance(data, dict):
+        raise ValueError("carry is not an object")
+    for k, kind in _FIELD_TYPES.items():
+        if k in data and not isinstance(data[k], kind):
+            raise ValueError(f"carry field {k} has the wrong type")
+    if data.get("level_index", 0) < 0:
+        raise ValueError("carry level_index out of range")
+    return data
+
+
+# ── Substrate maps ────────────────────────────────────────────
+def _map_path(key: str) -> str:
+    return os.path.join(MAP_DIR, key + MAP_EXT)
+
+
+def _load_maps() -> dict:
+    maps = {}
+    if not os.path.isdir(MAP_DIR):
+        return maps
+    for name in os.listdir(MAP_DIR):
+        if not name.endswith(MAP_EXT):
+            continue
+        key = name[:-len(MAP_EXT)]
+        m   = persist.read_with_fallback(_map_path(key), substrate.unpack)
+        if m is not None:   # a damaged map is just ground the next level can't read
+            maps[key] = m
+    return maps
+
+
+def _save_maps(maps: dict) -> None:
+    # Only maps changed since the last save are written — unchanged ground stays put.
+    # The tiles are copied now; compression runs on the writer thread.
+    for key, m in maps.items():
+        if not m.dirty:
+            continue
+        frozen = substrate.SubstrateMap(w=m.w, h=m.h, data=bytes(m.data))
+        persist.writer.submit(_map_path(key), lambda frozen=frozen: substrate.pack(frozen))
+        m.dirty = False
@@ -0,0 +1,89 @@
+# substrate.py
+# Per-tile substrate quality maps — the conditioned ground one level leaves for the next.
+# A map is a w×h grid of uint8 qualities (0 = untouched rock, 255 = fully conditioned),
+# stored row-major in a bytearray. Maps live outside carry.json as small binary files,
+# so even large maps load and save as one bulk read or write.
+
+from __future__ import annotations
+import struct
+import zlib
+from dataclasses import dataclass, field
+
+# ── File format ───────────────────────────────────────────────
+# header: magic, width, height, flags, crc32 of the raw (uncompressed) tiles
+MAGIC        = b"MSM1"
+_HEADER      = struct.Struct("<4sHHBI")
+FLAG_ZLIB    = 0x01
+COMPRESS_MIN = 4096     # maps smaller than this are stored raw — not worth the cpu
+
+
+@dataclass
+class SubstrateMap:
+    w:    int
+    h:    int
+    data: bytearray                                   # w*h uint8, row-major
+    dirty: bool = field(default=True, compare=False, repr=False)   # unsaved changes
+
+    @classmethod
+    def blank(cls, w: int, h: int) -> SubstrateMap:
+        return cls(w=w, h=h, data=bytearray(w * h))
+
+    @classmethod
+    def from_rows(cls, rows) -> SubstrateMap:
+        """Build from rows of ints 0–255. All rows must share one width."""
+        rows = list(rows)
+        h = len(rows)
+        w = len(rows[0]) if h else 0
+        data = bytearray()
+        for row in rows:
+            data += bytes(row)
+        return cls(w=w, h=h, data=data)
+
+    def get(self, x: int, y: int) -> int:
+        return self.data[y * self.w + x]
+
+    def row(self, y: int) -> bytes:
+        return bytes(self.data[y * self.w:(y + 1) * self.w])
+
+    def rows(self) -> list[bytes]:
+        return [self.row(y) for y in range(self.h)]
+
+    def mean(self) -> float:
+        """Average quality, 0.0–1.0."""
+        if not self.data:
+            return 0.0
+        return sum(self.data) / (255 * len(self.data))
+
+
+def quality(v: float) -> int:
+    """0.0–1.0 float → 0–255 tile quality."""
+    return max(0, min(255, int(round(v * 255))))
+
+
+# ── Serialization ─────────────────────────────────────────────
+def pack(m: SubstrateMap, compress: bool | None = None) -> bytes:
+    """Encode a map. compress=None lets the map size decide."""
+    raw = bytes(m.data)
+    if compress is None:
+        compress = len(raw) >= COMPRESS_MIN
+    flags   = FLAG_ZLIB if compress else 0
+    payload = zlib.compress(raw, 1) if compress else raw
+    return _HEADER.pack(MAGIC, m.w, m.h, flags, zlib.crc32(raw)) + payload
+
+
+def unpack(blob: bytes) -> SubstrateMap:
+    """Decode a map. Raises ValueError on anything malformed."""
+    if len(blob) < _HEADER.size:
+        raise ValueError("substrate map truncated")
+    magic, w, h, flags, crc = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("not a substrate map")
+    payload = blob[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(f"substrate map corrupt: {e}") from None
+    if len(payload) != w * h or zlib.crc32(payload) != crc:
+        raise ValueError("substrate map corrupt")
+    return SubstrateMap(w=w, h=h, data=bytearray(payload), dirty=False)
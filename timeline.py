@@ -0,0 +1,270 @@
+# timeline.py
+# Ceremonies as timelines — the welcome, the wipe, each level's dissolve.
+#
+# A ceremony is a generator function ceremony(h, w, rng, *args) that yields:
+#   (draw, seconds)  — draw(win) paints over what is already on screen (None paints
+#                      nothing), then the frame holds for seconds
+#   KEY              — wait for any key; the key is sent back into the generator
+#   "name"           — start of a phase, for the timing report; takes no time
+# It never sleeps, refreshes or reads the keyboard. Player does, one step per call,
+# so the same ceremony can be
+#   played live  — Player.update(now, key) once per loop iteration
+#   skipped      — skip(): every remaining draw at once, one refresh
+#   scrubbed     — seek(t): restart and redraw up to t seconds in
+#   headless     — win=None: no draws, no waits, as fast as the generator runs
+#
+# Live frames are scheduled against the wall clock, not slept after: each frame is
+# due when the previous one was due plus its hold, and Player keeps a running
+# measure of what a draw + refresh costs on this terminal. Any frame that will be
+# due by the time a refresh lands is drawn into the same refresh. On a slow link
+# batches grow and refreshes thin out, and the ceremony still takes as long as
+# it says. Every live run appends intended vs actual phase durations to
+# ceremony.log; past LOG_MAX bytes the log moves to ceremony.log.prev and a new
+# one starts, so the two together never hold much more than twice that.
+#
+# A resize restarts the ceremony at the new size and fast-forwards to the frame it
+# was on. Ceremonies take all their randomness from rng, so a restart replays the
+# same gusts and the same survivors.
+
+from __future__ import annotations
+import curses
+import json
+import os
+import random
+import time
+
+import screen as scr
+
+KEY           = object()   # yielded to wait for a keypress
+SKIP_ENV      = "MANDALA_SKIP"
+HEADLESS_SIZE = (24, 80)   # geometry a ceremony is built for with no window
+IDLE_MS       = 10         # longest pause per loop iteration while playing live
+LOG_PATH      = os.path.expanduser("~/.mandala/ceremony.log")
+LOG_MAX       = 64 * 1024  # bytes of log before it rotates to LOG_PATH.prev
+COST_WEIGHT   = 0.3        # how fast the measured draw + refresh cost follows changes
+
+
+class Player:
+    """Steps one ceremony against a window (or None for headless)."""
+
+    def __init__(self, win, ceremony, *args, seed: int | None = None) -> None:
+        self.win       = win
+        self.ceremony  = ceremony
+        self.args      = args
+        self.name      = f"{ceremony.__module__}.{ceremony.__qualname__}"
+        self.seed      = random.randrange(1 << 32) if seed is None else seed
+        self.due       = None    # clock value at which the current frame ends
+        self.cost      = 0.0     # measured seconds for a draw + refresh
+        self.refreshes = 0
+        self.phases    = []      # live timing, one dict per phase
+        self.wait_from = None    # clock value a key wait began at
+        self._start()
+
+    def _start(self) -> None:
+        self.size    = self.win.getmaxyx() if self.win is not None else HEADLESS_SIZE
+        self.gen     = self.ceremony(*self.size, random.Random(self.seed), *self.args)
+        self.t       = 0.0      # ceremony time at which the current frame began
+        self.hold    = 0.0
+        self.steps   = 0
+        self.waiting = False
+        self.done    = False
+
+    # ── Stepping ──────────────────────────────────────────────
+    def _step(self, key: str = "", now: float | None = None) -> None:
+        """Take the next frame from the generator and draw it.
+        now is given only when playing live; it times the phases."""
+        self.t += self.hold
+        self.hold = 0.0
+        while True:
+            try:
+                item = self.gen.send(key if self.steps else None)
+            except StopIteration:
+                self.done    = True
+                self.waiting = False
+                if now is not None:
+                    self._close_phase(now)
+                return
+            self.steps += 1
+            if not isinstance(item, str):
+                break
+            if now is not None:
+                self._open_phase(item, now)
+
+        self.waiting = item is KEY
+        if self.waiting:
+            return
+        draw, self.hold = item
+        if now is not None:
+            if not self.phases:
+                self._open_phase(self.ceremony.__name__, now)
+            self.phases[-1]["intended"] += self.hold
+        if draw is not None and self.win is not None:
+            draw(self.win)
+
+    def update(self, now: float, key: str = "") -> bool:
+        """Advance to clock value now. Returns False once the ceremony is over."""
+        if self.done:
+            return False
+        if self.win is not None and self.win.getmaxyx() != self.size:
+            self._resize()
+        if self.due is None:
+            self.due = now
+
+        # Draw every frame that will be due by the time this refresh lands.
+        began = time.monotonic()
+        drew  = False
+        while not self.done:
+            if self.waiting:
+                if not key:
+                    break
+                if self.phases:
+                    self.phases[-1]["waited"] += now - self.wait_from
+                self._step(key, now)
+                key = ""
+                self.due = now + self.hold        # the schedule restarts after a key
+            elif now + self.cost >= self.due:
+                self._step("", now)
+                self.due += self.hold             # from when it was due, not from now
+            else:
+                break
+            if self.waiting:
+                self.wait_from = now
+            drew = True
+
+        if drew and self.win is not None:
+            scr.present(self.win)
+            self.refreshes += 1
+            self.cost += COST_WEIGHT * (time.monotonic() - began - self.cost)
+        return not self.done
+
+    def pause_ms(self, now: float) -> int:
+        """How long the loop can sleep before the next frame needs drawing."""
+        if self.waiting or self.due is None:
+            return IDLE_MS
+        ahead = self.due - self.cost - now
+        return max(0, min(IDLE_MS, int(ahead * 1000)))
+
+    # ── Timing report ─────────────────────────────────────────
+    def _open_phase(self, name: str, now: float) -> None:
+        self._close_phase(now)
+        self.phases.append({"phase": name, "intended": 0.0, "start": now,
+                            "waited": 0.0, "actual": None})
+
+    def _close_phase(self, now: float) -> None:
+        if self.phases and self.phases[-1]["actual"] is None:
+            p = self.phases[-1]
+            p["actual"] = now - p["start"] - p["waited"]
+
+    def report(self) -> list:
+        """Intended vs actual seconds per phase of a live run. Key waits don't count."""
+        return [
+            {"phase":    p["phase"],
+             "intended": round(p["intended"], 3),
+             "actual":   round(p["actual"], 3)}
+            for p in self.phases if p["actual"] is not None
+        ]
+
+    # ── Skip / scrub ──────────────────────────────────────────
+    def skip(self) -> None:
+        """Run to the end at once. Key waits are answered with no key."""
+        while not self.done:
+            self._step()
+        if self.win is not None:
+            scr.present(self.win)
+
+    def seek(self, t: float, now: float | None = None) -> None:
+        """Jump to t seconds into the ceremony, as if it had played live to there.
+        Key waits before t count as answered and take no time."""
+        now = time.monotonic() if now is None else now
+        self._restart()
+        while not self.done:
+            self._step()
+            if not self.waiting and self.t + self.hold > t:
+                break
+        self.due = now + max(0.0, self.t + self.hold - t)
+        if self.win is not None:
+            scr.present(self.win)
+
+    def elapsed(self, now: float) -> float:
+        """Ceremony time at clock value now."""
+        if self.due is None:
+            return 0.0
+        return self.t + max(0.0, self.hold - max(0.0, self.due - now))
+
+    def _resize(self) -> None:
+        steps = self.steps
+        self._restart()
+        while self.steps < steps and not self.done:
+            self._step()
+        if self.win is not None:
+            scr.present(self.win)
+
+    def _restart(self) -> None:
+        if self.win is not None:
+            self.win.erase()
+        self._start()
+
+
+def run(win, ceremony, *args, seed: int | None = None) -> list:
+    """Play ceremony to the end on win. Blocks; keys go to the ceremony.
+    With win=None, or MANDALA_SKIP set, it runs through without waiting.
+    Returns the timing report (empty unless it played live)."""
+    player = Player(win, ceremony, *args, seed=seed)
+    if win is None or os.environ.get(SKIP_ENV):
+        player.skip()
+        return []
+    while player.update(time.monotonic(), scr.get_key(win)):
+        curses.napms(player.pause_ms(time.monotonic()))
+    _log(player)
+    return player.report()
+
+
+def _log(player: Player) -> None:
+    line = json.dumps({
+        "ceremony":  player.name,
+        "at":        round(time.time()),
+        "cost":      round(player.cost, 4),
+        "refreshes": player.refreshes,
+        "phases":    player.report(),
+    }, separators=(",", ":"))
+    try:
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) >= LOG_MAX:
+            os.replace(LOG_PATH, LOG_PATH + ".prev")
+        with open(LOG_PATH, "a") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass   # timing is a diagnostic; never let it stop the ceremony
+
+
+# ── Draws ─────────────────────────────────────────────────────
+# Small painters for the common frames. Each returns a draw(win).
+def cells(items, bold: bool | None = None, dim: bool | None = None):
+    """Paint ((row, col), (ch, bold, dim)) pairs; bold/dim override each cell's own."""
+    items = list(items)
+
+    def draw(win) -> None:
+        for (row, col), (ch, b, d) in items:
+            scr.addch(win, row, col, ch,
+                      bold=b if bold is None else bold,
+                      dim=d if dim is None else dim)
+    return draw
+
+
+def blank(positions):
+    positions = list(positions)
+
+    def draw(win) -> None:
+        for row, col in positions:
+            scr.addch(win, row, col, " ")
+    return draw
+
+
+def text(row: int, col: int, s: str, bold: bool = False, dim: bool = False):
+    def draw(win) -> None:
+        scr.addstr(win, row, col, s, bold=bold, dim=dim)
+    return draw
+
+
+def clear(win) -> None:
+    win.erase()
@@ -0,0 +1,115 @@
+# transport.py
+# Nutrient carried over a growing network — l03's mycelium.
+#
+# The network is a sparse graph: nodes are ints, edges join neighbours. Each node
+# takes in source(n) per tick, passes nutrient to its neighbours by diffusion and
+# loses a fraction leak of what it holds. The steady state is the screened
+# Laplacian system
+#     (deg(n) + leak) · φ(n)  −  Σ φ(neighbours)  =  source(n)
+# which is symmetric positive definite, so Gauss-Seidel converges for any order
+# of relaxation.
+#
+# Nothing is ever rebuilt. Adding a node or changing a source only puts the
+# nodes it touches on a worklist. relax(budget) relaxes worklist nodes one at a
+# time, in place. When a node's value moves by more than TOLERANCE, its
+# neighbours join the list. Work follows what changed, so a tick on a network of
+# tens of thousands of nodes costs about what it costs on a hundred. A budget
+# that runs out leaves the rest of the list for the next tick.
+#
+# Neighbour lists are kept sorted, and the worklist is first-in first-out. The
+# same sequence of changes then gives the same floats, so journal replay holds.
+
+from __future__ import annotations
+from array import array
+from bisect import insort
+from collections import deque
+
+import snapshot
+
+TOLERANCE = 1e-4
+
+
+class Transport:
+    def __init__(self, leak: float) -> None:
+        self.leak    = leak
+        self.phi     = {}           # node → nutrient held
+        self.nbrs    = {}           # node → sorted neighbour nodes
+        self.source  = {}           # node → intake per tick
+        self.queue   = deque()      # nodes waiting to be relaxed
+        self.queued  = set()
+
+    def __len__(self) -> int:
+        return len(self.phi)
+
+    def __contains__(self, n: int) -> bool:
+        return n in self.phi
+
+    def value(self, n: int) -> float:
+        return self.phi.get(n, 0.0)
+
+    # ── Changes ───────────────────────────────────────────────
+    def add(self, n: int, neighbours, source: float = 0.0) -> None:
+        """Join node n to those of neighbours already in the network."""
+        if n in self.phi:
+            return
+        linked = sorted(m for m in neighbours if m in self.phi)
+        self.nbrs[n]   = linked
+        self.source[n] = source
+        # Start from what the neighbours hold, so relaxation has little to do.
+        self.phi[n] = sum(self.phi[m] for m in linked) / len(linked) if linked else 0.0
+        for m in linked:
+            insort(self.nbrs[m], n)
+            self._touch(m)
+        self._touch(n)
+
+    def set_source(self, n: int, source: float) -> None:
+        if n in self.phi and self.source[n] != source:
+            self.source[n] = source
+            self._touch(n)
+
+    def _touch(self, n: int) -> None:
+        if n not in self.queued:
+            self.queued.add(n)
+            self.queue.append(n)
+
+    # ── Solve ─────────────────────────────────────────────────
+    def relax(self, budget: int) -> int:
+        """Relax up to budget worklist nodes. Returns how many were relaxed."""
+        phi, nbrs, source, leak = self.phi, self.nbrs, self.source, self.leak
+        queue, queued, touch = self.queue, self.queued, self._touch
+        done = 0
+        while queue and done < budget:
+            n = queue.popleft()
+            queued.discard(n)
+            linked = nbrs[n]
+            new = (source[n] + sum(phi[m] for m in linked)) / (len(linked) + leak)
+            moved = abs(new - phi[n])
+            phi[n] = new
+            done += 1
+            if moved > TOLERANCE:
+                for m in linked:
+                    touch(m)
+        return done
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+# The graph and sources follow from the level's grid, and the level rebuilds
+# them. These carry only what relaxation has made of it so far.
+def pack_values(t: Transport) -> bytes:
+    p = snapshot.Packer()
+    p.blob(array("d", [t.phi[n] for n in sorted(t.phi)]).tobytes())
+    p.blob(array("I", t.queue).tobytes())
+    return p.bytes()
+
+
+def unpack_values(t: Transport, data: bytes) -> None:
+    u = snapshot.Unpacker(data)
+    values = array("d", u.blob())
+    nodes  = sorted(t.phi)
+    if len(values) != len(nodes):
+        raise ValueError("nutrient values don't match the network")
+    t.phi   = dict(zip(nodes, values))
+    t.queue = deque(array("I", u.blob()))
+    if any(n not in t.phi for n in t.queue):
+        raise ValueError("worklist names a node off the network")
+    t.queued = set(t.queue)
@@ -11,15 +11,16 @@
 #   5. Five letters remain scattered on a dark screen — seeds.
 #   6. They linger, then the screen clears and level 1 begins.
 #
+# Built as a timeline (see timeline.py): resizing redraws it at the new size.
+#
 # Monochrome only. No curses color pairs.
 
 import curses
 import math
-import random
 import string
-import time
 
 import screen as scr
+import timeline
 
 # ── Constants ─────────────────────────────────────────────────
 _TITLE       = "mandala"
@@ -55,65 +56,60 @@ def play() -> None:
 
 def _run(stdscr) -> None:
     scr.init_screen(stdscr)
-    h, w = stdscr.getmaxyx()
+    timeline.run(stdscr, ceremony)
+
 
+def ceremony(h, w, rng):
+    """The welcome as a timeline, for timeline.Player."""
     cy = h // 2
     cx = w // 2
     rx = w // 2 - 2
     ry = h // 2 - 1
 
-    stdscr.erase()
-
     # 1. Type title — bold, centred, character by character
+    yield "title"
+    yield timeline.clear, 0.0
     title_col  = cx - len(_TITLE) // 2
     title_cells = {}
     for i, ch in enumerate(_TITLE):
         pos = (cy, title_col + i)
         title_cells[pos] = (ch, True, False)
-        scr.addch(stdscr, cy, title_col + i, ch, bold=True)
-        stdscr.refresh()
-        time.sleep(_TITLE_DELAY)
+        yield timeline.text(cy, title_col + i, ch, bold=True), _TITLE_DELAY
 
     # 2. Gentle flash — title alone on empty screen
-    time.sleep(_FLASH_SETTLE)
-    scr.addstr(stdscr, cy, title_col, _TITLE, dim=True)
-    stdscr.refresh()
-    time.sleep(_FLASH_OFF)
-    scr.addstr(stdscr, cy, title_col, _TITLE, bold=True)
-    stdscr.refresh()
-    time.sleep(_FLASH_PAUSE)
+    yield "flash"
+    yield None, _FLASH_SETTLE
+    yield timeline.text(cy, title_col, _TITLE, dim=True), _FLASH_OFF
+    yield timeline.text(cy, title_col, _TITLE, bold=True), _FLASH_PAUSE
 
     # 3. Build fill around the title (no erase — title stays)
+    yield "build"
     fill = _build_fill(h, w, cy, cx, rx, ry, set(title_cells))
-    _phase_build(stdscr, fill, cy, cx, rx, ry)
+    yield from _phase_build(fill, cy, cx, rx, ry)
 
     # 4. Hold, then prompt
-    time.sleep(_HOLD)
+    yield "hold"
+    yield None, _HOLD
     prompt_row = h - 3
     prompt_col = max(0, (w - len(_PROMPT)) // 2)
-    scr.addstr(stdscr, prompt_row, prompt_col, _PROMPT, dim=True)
-    stdscr.refresh()
+    yield timeline.text(prompt_row, prompt_col, _PROMPT, dim=True), 0.0
 
     # Wait for any key
-    stdscr.nodelay(False)
-    stdscr.getch()
-    stdscr.nodelay(True)
+    yield timeline.KEY
 
     # Erase prompt before wipe
-    scr.addstr(stdscr, prompt_row, prompt_col, " " * len(_PROMPT))
-    stdscr.refresh()
-    time.sleep(0.3)
+    yield timeline.text(prompt_row, prompt_col, " " * len(_PROMPT)), 0.3
 
     # 5. Wipe — spare one cell per seed letter
+    yield "wipe"
     all_cells = {**fill, **title_cells}
-    survivors = _pick_survivors(all_cells)
-    _phase_wipe(stdscr, all_cells, survivors, cy, cx, rx, ry)
+    survivors = _pick_survivors(all_cells, rng)
+    yield from _phase_wipe(all_cells, survivors, rng, cy, cx, rx, ry)
 
     # 6. Seeds linger, then screen clears
-    time.sleep(_SEED_LINGER)
-    stdscr.erase()
-    stdscr.refresh()
-    time.sleep(0.4)
+    yield "linger"
+    yield None, _SEED_LINGER
+    yield timeline.clear, 0.4
 
 
 # ── Geometry ──────────────────────────────────────────────────
@@ -190,7 +186,7 @@ def _build_fill(h, w, cy, cx, rx, ry, protected):
 
 # ── Build phase ───────────────────────────────────────────────
 
-def _phase_build(stdscr, grid, cy, cx, rx, ry):
+def _phase_build(grid, cy, cx, rx, ry):
     """Reveal fill centre-outward without erasing (title stays drawn)."""
     cells = sorted(
         grid.items(),
@@ -200,33 +196,29 @@ def _phase_build(stdscr, grid, cy, cx, rx, ry):
         )
     )
     batch = max(1, len(cells) // _BUILD_STEPS)
-    for i, ((row, col), (ch, bold, dim)) in enumerate(cells):
-        scr.addch(stdscr, row, col, ch, bold=bold, dim=dim)
-        if i % batch == 0:
-            stdscr.refresh()
-            time.sleep(_BUILD_DELAY)
-    stdscr.refresh()
+    for i in range(0, len(cells), batch):
+        yield timeline.cells(cells[i:i + batch]), _BUILD_DELAY
 
 
 # ── Survivor selection ────────────────────────────────────────
 
-def _pick_survivors(all_cells):
+def _pick_survivors(all_cells, rng):
     """One randomly chosen cell per unique letter of _TITLE."""
     by_letter = {}
     for pos, (ch, bold, dim) in all_cells.items():
         if ch in _SEEDS:
             by_letter.setdefault(ch, []).append(pos)
     survivors = set()
-    for letter in _SEEDS:
+    for letter in sorted(_SEEDS):
         candidates = by_letter.get(letter, [])
         if candidates:
-            survivors.add(random.choice(candidates))
+            survivors.add(rng.choice(candidates))
     return survivors
 
 
 # ── Wipe phase ────────────────────────────────────────────────
 
-def _phase_wipe(stdscr, all_cells, survivors, cy, cx, rx, ry):
+def _phase_wipe(all_cells, survivors, rng, cy, cx, rx, ry):
     """Gust wipe sparing survivors. Survivors rendered dim after."""
     scored = []
     for pos, cell_data in all_cells.items():
@@ -234,7 +226,7 @@ def _phase_wipe(stdscr, all_cells, survivors, cy, cx, rx, ry):
             continue
         row, col = pos
         r = math.sqrt(((col - cx) / rx) ** 2 + ((row - cy) / ry) ** 2)
-        scored.append((r * 0.55 + random.random() * 0.45, pos, cell_data))
+        scored.append((r * 0.55 + rng.random() * 0.45, pos, cell_data))
     scored.sort(key=lambda x: x[0], reverse=True)
     cells = [(pos, data) for _, pos, data in scored]
 
@@ -242,22 +234,13 @@ def _phase_wipe(stdscr, all_cells, survivors, cy, cx, rx, ry):
     while erased < n:
         remaining = n - erased
         size = max(2, min(remaining,
-                          int(remaining * random.uniform(_GUST_MIN, _GUST_MAX))))
+                          int(remaining * rng.uniform(_GUST_MIN, _GUST_MAX))))
         gust = cells[erased : erased + size]
 
-        for (row, col), (ch, bold, dim) in gust:
-            scr.addch(stdscr, row, col, ch, bold=False, dim=True)
-        stdscr.refresh()
-        time.sleep(_FADE_DUR)
-
-        for (row, col), cell_data in gust:
-            scr.addch(stdscr, row, col, " ")
-        stdscr.refresh()
+        yield timeline.cells(gust, bold=False, dim=True), _FADE_DUR
+        yield timeline.blank(pos for pos, _ in gust), rng.uniform(_PAUSE_MIN, _PAUSE_MAX)
         erased += size
-        time.sleep(random.uniform(_PAUSE_MIN, _PAUSE_MAX))
 
     # Draw survivors dim — the seeds
-    for pos in survivors:
-        ch, bold, dim = all_cells[pos]
-        scr.addch(stdscr, pos[0], pos[1], ch, dim=True)
-    stdscr.refresh()
+    yield timeline.cells(((pos, all_cells[pos]) for pos in survivors),
+                         bold=False, dim=True), 0.0
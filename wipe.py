@@ -5,12 +5,21 @@
 #   from wipe import play_mandala_wipe
 #   play_mandala_wipe(stdscr)
 #
+# Or step ceremony through a timeline.Player to skip, scrub or run it headless.
+#
 # Three phases:
 #   1. Build  — mandala materialises ring by ring, center outward (~4s)
 #   2. Hold   — stillness (~3s)
 #   3. Wipe   — dust blown in the wind: outer cells go first,
 #               in irregular gusts with pauses between them
 #
+# Two wipes, picked by style (or MANDALA_WIPE for play_mandala_wipe):
+#   gusts  — each gust's cells vanish where they stand
+#   drift  — each gust's cells lift off as dust and drift downwind off the
+#            screen, over what is still standing (particles.py). With
+#            MANDALA_RASTER=1 the dust is braille dots, placed within the cell
+#            (raster.py)
+#
 # Pattern: 8-fold rotational symmetry. Each cell is mapped by its
 # elliptical radius (fills the terminal) and aspect-corrected angle.
 # Spokes + concentric rings + petals at intersections.
@@ -18,10 +27,12 @@
 
 import curses
 import math
+import os
 import random
-import time
 
-import screen as scr
+import particles
+import raster
+import timeline
 
 # ── Tuning ────────────────────────────────────────────────────
 SYMMETRY      = 8
@@ -37,6 +48,16 @@ FADE_DURATION = 0.07     # seconds cells dim before vanishing
 PAUSE_MIN     = 0.12     # shortest breath between gusts
 PAUSE_MAX     = 0.52     # longest breath between gusts (~20-28 gusts total ~8-10s)
 
+# Drift wipe — released cells become dust particles, stepped once per frame.
+DRIFT_FRAME   = 0.05     # seconds per dust frame
+DRIFT_SPEED   = (0.6, 1.8)    # cells per frame downwind
+DRIFT_LIFT    = (-0.3, 0.15)  # cells per frame vertically — mostly up
+DUST_LIFE     = (4, 14)  # frames a mote lasts if it doesn't leave the screen first
+DUST_CHARS    = ".,'`"
+
+WIPE_STYLES   = ("gusts", "drift")
+WIPE_ENV      = "MANDALA_WIPE"
+
 # Title flash — "mandala" appears centred after the hold, before the wipe.
 TITLE           = "mandala"
 TITLE_FLASHES   = 3      # on-off cycles
@@ -169,8 +190,7 @@ def _build_grid(h: int, w: int) -> tuple[dict, float, float]:
 
 # ── Build phase ───────────────────────────────────────────────
 
-def _phase_build(stdscr, grid: dict,
-                 cy: int, cx: int, rx: float, ry: float) -> None:
+def _phase_build(grid: dict, cy: int, cx: int, rx: float, ry: float):
     """Reveal center-outward in BUILD_STEPS batches."""
     cells = sorted(
         grid.items(),
@@ -181,35 +201,26 @@ def _phase_build(stdscr, grid: dict,
     )
     batch = max(1, len(cells) // BUILD_STEPS)
 
-    stdscr.erase()
-    for i, ((row, col), (ch, bold, dim)) in enumerate(cells):
-        scr.addch(stdscr, row, col, ch, bold=bold, dim=dim)
-        if i % batch == 0:
-            stdscr.refresh()
-            time.sleep(BUILD_DELAY)
-    stdscr.refresh()
+    yield timeline.clear, 0.0
+    for i in range(0, len(cells), batch):
+        yield timeline.cells(cells[i:i + batch]), BUILD_DELAY
 
 
 # ── Title flash ───────────────────────────────────────────────
 
-def _phase_title(stdscr, cy: int, cx: int) -> None:
+def _phase_title(cy: int, cx: int):
     """Flash TITLE centred on the mandala, then leave it dim as wipe begins."""
     col = cx - len(TITLE) // 2
     for _ in range(TITLE_FLASHES):
-        scr.addstr(stdscr, cy, col, TITLE, bold=True)
-        stdscr.refresh()
-        time.sleep(TITLE_ON)
-        scr.addstr(stdscr, cy, col, TITLE, dim=True)
-        stdscr.refresh()
-        time.sleep(TITLE_OFF)
+        yield timeline.text(cy, col, TITLE, bold=True), TITLE_ON
+        yield timeline.text(cy, col, TITLE, dim=True), TITLE_OFF
 
 
 # ── Wipe phase ────────────────────────────────────────────────
 
-def _phase_wipe(stdscr, grid: dict,
-                cy: int, cx: int, rx: float, ry: float) -> None:
-    """Dissolve like dust in wind — outer cells first, in irregular gusts."""
-
+def _wind_order(grid: dict, rng: random.Random,
+                cy: int, cx: int, rx: float, ry: float) -> list:
+    """Grid cells in the order the wind takes them."""
     # Score each cell: outer cells are less anchored and go first.
     # Randomness makes the order organic rather than ring-perfect.
     scored = []
@@ -217,56 +228,135 @@ def _phase_wipe(stdscr, grid: dict,
         r_ellipse = math.sqrt(
             ((col - cx) / rx) ** 2 + ((row - cy) / ry) ** 2
         )
-        wind_score = r_ellipse * 0.55 + random.random() * 0.45
+        wind_score = r_ellipse * 0.55 + rng.random() * 0.45
         scored.append((wind_score, (row, col), cell_data))
 
     # Sort descending — highest score (outer / random-first) erases first.
     scored.sort(key=lambda x: x[0], reverse=True)
-    cells = [(pos, data) for _, pos, data in scored]
+    return [(pos, data) for _, pos, data in scored]
+
 
+def _phase_wipe(grid: dict, rng: random.Random,
+                cy: int, cx: int, rx: float, ry: float):
+    """Dissolve like dust in wind — outer cells first, in irregular gusts."""
+    cells  = _wind_order(grid, rng, cy, cx, rx, ry)
     n      = len(cells)
     erased = 0
 
     while erased < n:
         remaining  = n - erased
-        gust_frac  = random.uniform(GUST_MIN_FRAC, GUST_MAX_FRAC)
+        gust_frac  = rng.uniform(GUST_MIN_FRAC, GUST_MAX_FRAC)
         gust_size  = max(2, min(remaining, int(remaining * gust_frac)))
         gust       = cells[erased : erased + gust_size]
 
         # Pre-fade: dim the entire gust briefly before it disappears.
-        for (row, col), (ch, bold, _dim) in gust:
-            scr.addch(stdscr, row, col, ch, bold=False, dim=True)
-        stdscr.refresh()
-        time.sleep(FADE_DURATION)
+        yield timeline.cells(gust, bold=False, dim=True), FADE_DURATION
 
         # Erase — all gust cells vanish at once (poof).
-        for (row, col), _ in gust:
-            scr.addch(stdscr, row, col, " ")
-
-        stdscr.refresh()
+        # Irregular pause — some gusts come right after, others wait.
+        yield timeline.blank(pos for pos, _ in gust), rng.uniform(PAUSE_MIN, PAUSE_MAX)
         erased += gust_size
 
-        # Irregular pause — some gusts come right after, others wait.
-        time.sleep(random.uniform(PAUSE_MIN, PAUSE_MAX))
+    yield timeline.clear, 0.4
+
+
+def _phase_drift(grid: dict, rng: random.Random, h: int, w: int,
+                 cy: int, cx: int, rx: float, ry: float, fine: bool = False):
+    """Same gusts, but each gust's cells blow away as dust instead of vanishing.
+    fine: dust as braille dots, a mote anywhere within its cell."""
+    cells    = _wind_order(grid, rng, cy, cx, rx, ry)
+    n        = len(cells)
+    erased   = 0
+    wind     = rng.choice((-1, 1))
+    dust     = particles.Particles(n, w, h)
+    standing = dict(grid)
+    shown    = []                          # dust drawn in the last frame
+    gone     = []                          # cells just released, still on screen
+    dots     = raster.Raster(w, h, raster.BRAILLE, attr=curses.A_DIM) if fine else None
+
+    while erased < n or len(dust):
+        if erased < n:
+            remaining = n - erased
+            gust_frac = rng.uniform(GUST_MIN_FRAC, GUST_MAX_FRAC)
+            gust_size = max(2, min(remaining, int(remaining * gust_frac)))
+            gust      = cells[erased : erased + gust_size]
+            erased   += gust_size
+
+            yield timeline.cells(gust, bold=False, dim=True), FADE_DURATION
+            gone = [pos for pos, _ in gust]
+            for row, col in gone:
+                del standing[row, col]
+                dust.spawn(col, row,
+                           wind * rng.uniform(*DRIFT_SPEED), rng.uniform(*DRIFT_LIFT),
+                           rng.randint(*DUST_LIFE))
+            frames = max(1, round(rng.uniform(PAUSE_MIN, PAUSE_MAX) / DRIFT_FRAME))
+        else:
+            frames = 1                     # last of the dust clearing the screen
+
+        for _ in range(frames):
+            points = dust.points()
+            motes  = [(int(y), int(x)) for x, y in points]
+            yield _dust_frame(shown + gone, motes, standing, dots, points), DRIFT_FRAME
+            shown, gone = motes, []
+            dust.step()
+
+    yield timeline.clear, 0.4
+
+
+def _dust_frame(stale: list, motes: list, standing: dict,
+                dots: raster.Raster | None = None, points: list = ()):
+    """Blank stale (last frame's dust, cells just released), put back the standing
+    cells dust had covered, draw this frame's motes — as glyphs, or as a dot each
+    at points on dots."""
+    restore = [(pos, standing[pos]) for pos in stale if pos in standing]
+    if dots is None:
+        dust = timeline.cells(((row, col), (_pick(DUST_CHARS, row, col), False, True))
+                              for row, col in motes)
+    else:
+        dust = _dust_dots(dots, points)
+    layers  = (timeline.blank(stale), timeline.cells(restore), dust)
+
+    def draw(win) -> None:
+        for layer in layers:
+            layer(win)
+    return draw
+
 
-    stdscr.erase()
-    stdscr.refresh()
-    time.sleep(0.4)
+def _dust_dots(dots: raster.Raster, points: list):
+    def draw(win) -> None:
+        dots.clear()
+        for x, y in points:
+            dots.set(int(x * 2), int(y * 4), raster.PLAIN)
+        dots.draw(win, 0, 0)
+    return draw
 
 
 # ── Public entry point ────────────────────────────────────────
 
-def play_mandala_wipe(stdscr) -> None:
+def play_mandala_wipe(stdscr, style: str | None = None) -> None:
     """Full mandala formation and dissolution. Blocks until complete."""
-    h, w = stdscr.getmaxyx()
-    cy   = h // 2
-    cx   = w // 2
+    timeline.run(stdscr, ceremony, style or os.environ.get(WIPE_ENV, "gusts"))
+
+
+def ceremony(h: int, w: int, rng: random.Random, style: str = "gusts"):
+    """The wipe as a timeline, for timeline.Player."""
+    if style not in WIPE_STYLES:
+        style = "gusts"
+    cy = h // 2
+    cx = w // 2
 
     grid, rx, ry = _build_grid(h, w)
     if not grid:
         return
 
-    _phase_build(stdscr, grid, cy, cx, rx, ry)
-    time.sleep(HOLD_DURATION)
-    _phase_title(stdscr, cy, cx)
-    _phase_wipe(stdscr, grid, cy, cx, rx, ry)
+    yield "build"
+    yield from _phase_build(grid, cy, cx, rx, ry)
+    yield "hold"
+    yield None, HOLD_DURATION
+    yield "title"
+    yield from _phase_title(cy, cx)
+    yield "wipe"
+    if style == "drift":
+        yield from _phase_drift(grid, rng, h, w, cy, cx, rx, ry, fine=raster.wanted())
+    else:
+        yield from _phase_wipe(grid, rng, cy, cx, rx, ry)